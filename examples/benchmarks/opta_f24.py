@@ -0,0 +1,54 @@
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+from kloppy import opta
+
+
+def main():
+    """
+    This example benchmarks loading a season of Opta F24 event data.
+
+    The directory should contain the feeds of each match as a pair of
+    `f7-<match_id>.xml` and `f24-<match_id>.xml` files. When no directory is
+    given, the sample match from the test suite is used.
+    """
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("directory", nargs="?", type=Path)
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.directory:
+        matches = [
+            (f24_file.with_name(f"f7-{f24_file.name[4:]}"), f24_file)
+            for f24_file in sorted(args.directory.glob("f24-*.xml"))
+        ]
+    else:
+        files_dir = Path(__file__).parent / "../../kloppy/tests/files"
+        matches = [(files_dir / "opta_f7.xml", files_dir / "opta_f24.xml")]
+
+    event_count = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for f7_file, f24_file in matches:
+            dataset = opta.load(f7_data=f7_file, f24_data=f24_file)
+            event_count += len(dataset.events)
+    took = time.perf_counter() - start
+
+    logger.info(
+        f"Loaded {len(matches) * args.rounds} matches, {event_count} events "
+        f"in {took:.2f}s ({event_count / took:.0f} events/sec)"
+    )
+
+
+if __name__ == "__main__":
+    main()
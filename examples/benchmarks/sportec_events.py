@@ -0,0 +1,73 @@
+import argparse
+import logging
+import resource
+import sys
+import time
+
+from kloppy import sportec
+from kloppy._providers.sportec import get_IDSSE_url
+from kloppy.io import open_as_file
+
+IDSSE_MATCH_IDS = [
+    "J03WPY",
+    "J03WN1",
+    "J03WMX",
+    "J03WOH",
+    "J03WQQ",
+    "J03WOY",
+    "J03WR9",
+]
+
+
+def main():
+    """
+    This example benchmarks loading the Sportec event data of the IDSSE open
+    matches.
+
+    The feeds are downloaded (or read from the kloppy cache) before the
+    timing starts, so only the deserialization is measured. The peak memory
+    usage is reported as the maximum resident set size of the process.
+    """
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "match_ids", nargs="*", default=IDSSE_MATCH_IDS, metavar="match_id"
+    )
+    parser.add_argument("--rounds", type=int, default=1)
+    args = parser.parse_args()
+
+    matches = []
+    for match_id in args.match_ids:
+        with open_as_file(
+            get_IDSSE_url(match_id, "event")
+        ) as event_data_fp, open_as_file(
+            get_IDSSE_url(match_id, "meta")
+        ) as meta_data_fp:
+            matches.append((event_data_fp.read(), meta_data_fp.read()))
+
+    event_count = 0
+    start = time.perf_counter()
+    for _ in range(args.rounds):
+        for event_data, meta_data in matches:
+            dataset = sportec.load_event(
+                event_data=event_data, meta_data=meta_data
+            )
+            event_count += len(dataset.events)
+    took = time.perf_counter() - start
+
+    max_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    logger.info(
+        f"Loaded {len(matches) * args.rounds} matches, {event_count} events "
+        f"in {took:.2f}s ({event_count / took:.0f} events/sec), "
+        f"peak memory {max_rss_mb:.0f}MB"
+    )
+
+
+if __name__ == "__main__":
+    main()
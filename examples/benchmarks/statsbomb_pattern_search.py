@@ -0,0 +1,114 @@
+import argparse
+import json
+import logging
+import sys
+import time
+
+from kloppy import event_pattern_matching as pm
+from kloppy import statsbomb
+from kloppy.domain.services.matchers.pattern.regexp import RegExp
+from kloppy.io import open_as_file
+
+# La Liga 2015/2016, the full season is part of the StatsBomb open data
+COMPETITION_ID = 11
+SEASON_ID = 27
+
+MATCHES_URL = "https://raw.githubusercontent.com/statsbomb/open-data/master/data/matches/{competition_id}/{season_id}.json"
+
+
+def ball_recovery_pattern():
+    return (
+        pm.match_pass(capture="last_pass_of_team_a")
+        + pm.match_pass(team=pm.not_same_as("last_pass_of_team_a.team"))
+        * slice(1, None)
+        + pm.group(
+            pm.match_pass(
+                success=True,
+                team=pm.same_as("last_pass_of_team_a.team"),
+                capture="recover",
+            )
+            + pm.match_any() * slice(None, 2),
+            capture="success",
+        )
+        * slice(0, 1)
+    )
+
+
+def legacy_search(dataset, pattern):
+    """Match from every start index of every period, like `search` did
+    before patterns were compiled."""
+    re = RegExp.from_ast(pattern)
+    match_count = 0
+    for period in dataset.metadata.periods:
+        events = [event for event in dataset.events if event.period == period]
+        for i in range(len(events)):
+            if re.match(events[i:], consume_all=False):
+                match_count += 1
+    return match_count
+
+
+def main():
+    """
+    This example benchmarks searching an event pattern in a full StatsBomb
+    season.
+
+    The matches are loaded (from the StatsBomb open data, or the kloppy
+    cache) before the timing starts, so only the search is measured. Use
+    `--legacy` to compare with matching from every start index.
+    """
+    logging.basicConfig(
+        stream=sys.stdout,
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    logger = logging.getLogger(__name__)
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--competition-id", type=int, default=COMPETITION_ID)
+    parser.add_argument("--season-id", type=int, default=SEASON_ID)
+    parser.add_argument("--limit", type=int, help="Number of matches to use")
+    parser.add_argument("--legacy", action="store_true")
+    args = parser.parse_args()
+
+    with open_as_file(
+        MATCHES_URL.format(
+            competition_id=args.competition_id, season_id=args.season_id
+        )
+    ) as matches_fp:
+        match_ids = [match["match_id"] for match in json.load(matches_fp)]
+    if args.limit:
+        match_ids = match_ids[: args.limit]
+
+    datasets = [
+        statsbomb.load_open_data(
+            match_id=match_id, event_types=["pass", "shot"]
+        )
+        for match_id in match_ids
+    ]
+    event_count = sum(len(dataset.events) for dataset in datasets)
+    pattern = ball_recovery_pattern()
+
+    start = time.perf_counter()
+    match_count = sum(len(pm.search(dataset, pattern)) for dataset in datasets)
+    took = time.perf_counter() - start
+    logger.info(
+        f"Searched {len(datasets)} matches, {event_count} events in "
+        f"{took:.2f}s ({event_count / took:.0f} events/sec), "
+        f"found {match_count} matches"
+    )
+
+    if args.legacy:
+        start = time.perf_counter()
+        legacy_match_count = sum(
+            legacy_search(dataset, pattern) for dataset in datasets
+        )
+        legacy_took = time.perf_counter() - start
+        logger.info(
+            f"Legacy search took {legacy_took:.2f}s "
+            f"({event_count / legacy_took:.0f} events/sec), "
+            f"found {legacy_match_count} matches"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ def load(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """
     Load DataFactory event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -21,11 +22,15 @@ def load(
         event_types:
         coordinates:
         event_factory:
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
     """
     deserializer = DatafactoryDeserializer(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
+        fields=fields,
     )
     with open_as_file(event_data) as event_data_fp:
         return deserializer.deserialize(
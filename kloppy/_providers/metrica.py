@@ -15,7 +15,7 @@ from kloppy.infra.serializers.tracking.metrica_epts import (
     MetricaEPTSTrackingDataDeserializer,
     MetricaEPTSTrackingDataInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, open_as_file, open_as_files
 
 
 def load_tracking_csv(
@@ -48,9 +48,9 @@ def load_tracking_epts(
     deserializer = MetricaEPTSTrackingDataDeserializer(
         sample_rate=sample_rate, limit=limit, coordinate_system=coordinates
     )
-    with open_as_file(raw_data) as raw_data_fp, open_as_file(
-        meta_data
-    ) as meta_data_fp:
+    with open_as_file(
+        raw_data, memory_map=get_config("io.memory_map")
+    ) as raw_data_fp, open_as_file(meta_data) as meta_data_fp:
         return deserializer.deserialize(
             inputs=MetricaEPTSTrackingDataInputs(
                 raw_data=raw_data_fp, meta_data=meta_data_fp
@@ -64,11 +64,13 @@ def load_event(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     deserializer = MetricaJsonEventDataDeserializer(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
+        fields=fields,
     )
 
     with open_as_file(event_data) as event_data_fp, open_as_file(
@@ -88,35 +90,47 @@ def load_open_data(
     coordinates: Optional[str] = None,
 ) -> TrackingDataset:
     if match_id == "1" or match_id == 1:
-        return load_tracking_csv(
-            home_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+        with open_as_files(
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_1/Sample_Game_1_RawTrackingData_Home_Team.csv",
-            away_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_1/Sample_Game_1_RawTrackingData_Away_Team.csv",
-            sample_rate=sample_rate,
-            limit=limit,
-            coordinates=coordinates,
-        )
+        ) as (home_data_fp, away_data_fp):
+            return load_tracking_csv(
+                home_data=home_data_fp,
+                away_data=away_data_fp,
+                sample_rate=sample_rate,
+                limit=limit,
+                coordinates=coordinates,
+            )
     elif match_id == "2" or match_id == 2:
-        return load_tracking_csv(
-            home_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+        with open_as_files(
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_2/Sample_Game_2_RawTrackingData_Home_Team.csv",
-            away_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_2/Sample_Game_2_RawTrackingData_Away_Team.csv",
-            sample_rate=sample_rate,
-            limit=limit,
-            coordinates=coordinates,
-        )
+        ) as (home_data_fp, away_data_fp):
+            return load_tracking_csv(
+                home_data=home_data_fp,
+                away_data=away_data_fp,
+                sample_rate=sample_rate,
+                limit=limit,
+                coordinates=coordinates,
+            )
     elif match_id == "3" or match_id == 3:
-        return load_tracking_epts(
-            meta_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+        with open_as_files(
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_3/Sample_Game_3_metadata.xml",
-            raw_data="https://raw.githubusercontent.com/metrica-sports/sample-data/"
+            "https://raw.githubusercontent.com/metrica-sports/sample-data/"
             "master/data/Sample_Game_3/Sample_Game_3_tracking.txt",
-            sample_rate=sample_rate,
-            limit=limit,
-            coordinates=coordinates,
-        )
+        ) as (meta_data_fp, raw_data_fp):
+            return load_tracking_epts(
+                meta_data=meta_data_fp,
+                raw_data=raw_data_fp,
+                sample_rate=sample_rate,
+                limit=limit,
+                coordinates=coordinates,
+            )
     else:
         raise KloppyError(
             f"Don't know where to fetch Metrica open data for {match_id}"
@@ -13,6 +13,7 @@ def load(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """
     Load Opta event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -23,11 +24,15 @@ def load(
         event_types:
         coordinates:
         event_factory:
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
     """
     deserializer = StatsPerformDeserializer(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
+        fields=fields,
     )
     with open_as_file(f7_data) as f7_data_fp, open_as_file(
         f24_data
@@ -1,10 +1,14 @@
 from typing import Optional
 
 from kloppy.domain import TrackingDataset
+from kloppy.infra.serializers.tracking.live import (
+    LiveTrackingDatasetBuilder,
+)
 from kloppy.infra.serializers.tracking.secondspectrum import (
     SecondSpectrumDeserializer,
     SecondSpectrumInputs,
 )
+from kloppy.config import get_config
 from kloppy.io import FileLike, open_as_file, Source
 
 
@@ -24,7 +28,7 @@ def load(
         only_alive=only_alive,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
-        raw_data
+        raw_data, memory_map=get_config("io.memory_map")
     ) as raw_data_fp, open_as_file(
         Source.create(additional_meta_data, optional=True)
     ) as additional_meta_data_fp:
@@ -35,3 +39,32 @@ def load(
                 additional_meta_data=additional_meta_data_fp,
             )
         )
+
+
+def load_live(
+    meta_data: FileLike,
+    additional_meta_data: Optional[FileLike] = None,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = False,
+) -> LiveTrackingDatasetBuilder:
+    """
+    Create a builder for a live Second Spectrum feed. Lines of raw data are
+    added using `feed`.
+
+    Args:
+        meta_data: Second Spectrum XML or JSON metadata of the match.
+        additional_meta_data: Second Spectrum JSON metadata with the players.
+        coordinates: The coordinate system to transform the frames to.
+        only_alive: Only add frames in which the ball is in play.
+    """
+    deserializer = SecondSpectrumDeserializer(
+        coordinate_system=coordinates, only_alive=only_alive
+    )
+    with open_as_file(meta_data) as meta_data_fp, open_as_file(
+        Source.create(additional_meta_data, optional=True)
+    ) as additional_meta_data_fp:
+        # The orientation is determined when the first frame comes in
+        metadata = deserializer.deserialize_metadata(
+            meta_data_fp, additional_meta_data_fp
+        )
+    return LiveTrackingDatasetBuilder(deserializer, metadata)
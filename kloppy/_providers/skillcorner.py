@@ -5,7 +5,7 @@ from kloppy.infra.serializers.tracking.skillcorner import (
     SkillCornerDeserializer,
     SkillCornerInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, open_as_file, open_as_files
 
 
 def load(
@@ -39,11 +39,15 @@ def load_open_data(
     coordinates: Optional[str] = None,
     include_empty_frames: Optional[bool] = False,
 ) -> TrackingDataset:
-    return load(
-        meta_data=f"https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{match_id}/match_data.json",
-        raw_data=f"https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{match_id}/structured_data.json",
-        sample_rate=sample_rate,
-        limit=limit,
-        coordinates=coordinates,
-        include_empty_frames=include_empty_frames,
-    )
+    with open_as_files(
+        f"https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{match_id}/match_data.json",
+        f"https://raw.githubusercontent.com/SkillCorner/opendata/master/data/matches/{match_id}/structured_data.json",
+    ) as (meta_data_fp, raw_data_fp):
+        return load(
+            meta_data=meta_data_fp,
+            raw_data=raw_data_fp,
+            sample_rate=sample_rate,
+            limit=limit,
+            coordinates=coordinates,
+            include_empty_frames=include_empty_frames,
+        )
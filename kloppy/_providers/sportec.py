@@ -12,7 +12,7 @@ from kloppy.infra.serializers.tracking.sportec import (
     SportecTrackingDataDeserializer,
     SportecTrackingDataInputs,
 )
-from kloppy.io import FileLike, open_as_file
+from kloppy.io import FileLike, open_as_file, open_as_files
 from kloppy.utils import deprecated
 
 
@@ -22,6 +22,7 @@ def load_event(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """
     Load Sportec event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -32,12 +33,16 @@ def load_event(
         event_types:
         coordinates:
         event_factory:
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
 
     """
     serializer = SportecEventDataDeserializer(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
+        fields=fields,
     )
     with open_as_file(event_data) as event_data_fp, open_as_file(
         meta_data
@@ -159,13 +164,16 @@ def load_open_event_data(
                In Submission.
     """
     try:
-        return load_event(
-            event_data=get_IDSSE_url(match_id, "event"),
-            meta_data=get_IDSSE_url(match_id, "meta"),
-            event_types=event_types,
-            coordinates=coordinates,
-            event_factory=event_factory,
-        )
+        with open_as_files(
+            get_IDSSE_url(match_id, "event"), get_IDSSE_url(match_id, "meta")
+        ) as (event_data_fp, meta_data_fp):
+            return load_event(
+                event_data=event_data_fp,
+                meta_data=meta_data_fp,
+                event_types=event_types,
+                coordinates=coordinates,
+                event_factory=event_factory,
+            )
     except HTTPError as e:
         raise HTTPError(
             "Unable to retrieve data. The dataset archive location may have changed. "
@@ -222,14 +230,18 @@ def load_open_tracking_data(
                In Submission.
     """
     try:
-        return load_tracking(
-            raw_data=get_IDSSE_url(match_id, "tracking"),
-            meta_data=get_IDSSE_url(match_id, "meta"),
-            sample_rate=sample_rate,
-            limit=limit,
-            coordinates=coordinates,
-            only_alive=only_alive,
-        )
+        with open_as_files(
+            get_IDSSE_url(match_id, "tracking"),
+            get_IDSSE_url(match_id, "meta"),
+        ) as (raw_data_fp, meta_data_fp):
+            return load_tracking(
+                raw_data=raw_data_fp,
+                meta_data=meta_data_fp,
+                sample_rate=sample_rate,
+                limit=limit,
+                coordinates=coordinates,
+                only_alive=only_alive,
+            )
     except HTTPError as e:
         raise HTTPError(
             "Unable to retrieve data. The dataset archive location may have changed. "
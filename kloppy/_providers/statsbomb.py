@@ -8,7 +8,7 @@ from kloppy.infra.serializers.event.statsbomb import (
     StatsBombInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
-from kloppy.io import open_as_file, FileLike, Source
+from kloppy.io import open_as_file, open_as_files, FileLike, Source
 
 
 def load(
@@ -19,6 +19,7 @@ def load(
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
     additional_metadata: dict = {},
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """
     Load StatsBomb event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -30,6 +31,10 @@ def load(
         event_types:
         coordinates:
         event_factory:
+        additional_metadata:
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
     """
     deserializer = StatsBombDeserializer(
         event_types=event_types,
@@ -37,6 +42,7 @@ def load(
         event_factory=event_factory
         or get_config("event_factory")
         or StatsBombEventFactory(),
+        fields=fields,
     )
     with open_as_file(event_data) as event_data_fp, open_as_file(
         lineup_data
@@ -66,14 +72,19 @@ def load_open_data(
         "\n"
     )
 
-    return load(
-        event_data=f"https://raw.githubusercontent.com/statsbomb/open-data/master/data/events/{match_id}.json",
-        lineup_data=f"https://raw.githubusercontent.com/statsbomb/open-data/master/data/lineups/{match_id}.json",
-        three_sixty_data=Source(
+    with open_as_files(
+        f"https://raw.githubusercontent.com/statsbomb/open-data/master/data/events/{match_id}.json",
+        f"https://raw.githubusercontent.com/statsbomb/open-data/master/data/lineups/{match_id}.json",
+        Source(
             f"https://raw.githubusercontent.com/statsbomb/open-data/master/data/three-sixty/{match_id}.json",
             skip_if_missing=True,
         ),
-        event_types=event_types,
-        coordinates=coordinates,
-        event_factory=event_factory,
-    )
+    ) as (event_data_fp, lineup_data_fp, three_sixty_data_fp):
+        return load(
+            event_data=event_data_fp,
+            lineup_data=lineup_data_fp,
+            three_sixty_data=three_sixty_data_fp,
+            event_types=event_types,
+            coordinates=coordinates,
+            event_factory=event_factory,
+        )
@@ -40,7 +40,7 @@ def load(
         only_alive=only_alive,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
-        raw_data
+        raw_data, memory_map=get_config("io.memory_map")
     ) as raw_data_fp:
         return deserializer.deserialize(
             inputs=StatsPerformTrackingInputs(
@@ -60,6 +60,7 @@ def load_event(
     event_types: Optional[List[str]] = None,
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """Load Stats Perform event data.
 
@@ -71,6 +72,9 @@ def load_event(
         event_types: list of event types to load
         coordinates: coordinate system to use
         event_factory: a custom event factory
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
 
     Returns:
         EventDataset: the loaded event data
@@ -79,6 +83,7 @@ def load_event(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),  # type: ignore
+        fields=fields,
     )
     with open_as_file(ma1_data) as ma1_data_fp, open_as_file(
         ma3_data
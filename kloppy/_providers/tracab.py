@@ -2,6 +2,9 @@ from typing import Optional, Union, Type
 
 
 from kloppy.domain import TrackingDataset
+from kloppy.infra.serializers.tracking.live import (
+    LiveTrackingDatasetBuilder,
+)
 from kloppy.infra.serializers.tracking.tracab.tracab_dat import (
     TRACABDatDeserializer,
 )
@@ -9,6 +12,7 @@ from kloppy.infra.serializers.tracking.tracab.tracab_json import (
     TRACABJSONDeserializer,
     TRACABInputs,
 )
+from kloppy.config import get_config
 from kloppy.io import FileLike, open_as_file, get_file_extension
 
 
@@ -35,13 +39,36 @@ def load(
         only_alive=only_alive,
     )
     with open_as_file(meta_data) as meta_data_fp, open_as_file(
-        raw_data
+        raw_data, memory_map=get_config("io.memory_map")
     ) as raw_data_fp:
         return deserializer.deserialize(
             inputs=TRACABInputs(meta_data=meta_data_fp, raw_data=raw_data_fp)
         )
 
 
+def load_live(
+    meta_data: FileLike,
+    coordinates: Optional[str] = None,
+    only_alive: Optional[bool] = True,
+) -> LiveTrackingDatasetBuilder:
+    """
+    Create a builder for a live TRACAB (.dat) feed. Lines of raw data are
+    added using `feed`.
+
+    Args:
+        meta_data: TRACAB XML metadata of the match.
+        coordinates: The coordinate system to transform the frames to.
+        only_alive: Only add frames in which the ball is in play.
+    """
+    deserializer = TRACABDatDeserializer(
+        coordinate_system=coordinates, only_alive=only_alive
+    )
+    with open_as_file(meta_data) as meta_data_fp:
+        # The orientation is determined when the first frame comes in
+        metadata = deserializer.deserialize_metadata(meta_data_fp)
+    return LiveTrackingDatasetBuilder(deserializer, metadata)
+
+
 def identify_deserializer(
     meta_data: FileLike,
     raw_data: FileLike,
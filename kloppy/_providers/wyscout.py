@@ -1,4 +1,3 @@
-import json
 from typing import Union, Type
 
 from kloppy.config import get_config
@@ -8,7 +7,7 @@ from kloppy.infra.serializers.event.wyscout import (
     WyscoutInputs,
 )
 from kloppy.domain import EventDataset, Optional, List, EventFactory
-from kloppy.io import open_as_file, FileLike
+from kloppy.io import iter_json_object, open_as_file, FileLike
 
 
 def load(
@@ -17,6 +16,7 @@ def load(
     coordinates: Optional[str] = None,
     event_factory: Optional[EventFactory] = None,
     data_version: Optional[str] = None,
+    fields: Optional[List[str]] = None,
 ) -> EventDataset:
     """
     Load Wyscout event data into a [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -27,6 +27,9 @@ def load(
         coordinates:
         event_factory:
         data_version:
+        fields: optional event attributes (qualifiers, raw_event,
+            related_event_ids, freeze_frame, statistics) to parse. By default
+            all attributes are parsed.
     """
     if data_version == "V2":
         deserializer_class = WyscoutDeserializerV2
@@ -39,6 +42,7 @@ def load(
         event_types=event_types,
         coordinate_system=coordinates,
         event_factory=event_factory or get_config("event_factory"),
+        fields=fields,
     )
 
     with open_as_file(event_data) as event_data_fp:
@@ -64,11 +68,19 @@ def load_open_data(
 def identify_deserializer(
     event_data: FileLike,
 ) -> Union[Type[WyscoutDeserializerV3], Type[WyscoutDeserializerV2]]:
+    # Only the first event is decoded
+    first_event = None
     with open_as_file(event_data) as event_data_fp:
-        events_with_meta = json.load(event_data_fp)
-
-    events = events_with_meta["events"]
-    first_event = events[0]
+        for key, value in iter_json_object(
+            event_data_fp, stream_keys=["events"]
+        ):
+            if key == "events":
+                first_event = next(value, None)
+                break
+    if first_event is None:
+        raise ValueError(
+            "Wyscout data version could not be recognized, please specify"
+        )
 
     deserializer = None
     if "eventName" in first_event:
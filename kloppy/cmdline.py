@@ -41,15 +41,34 @@ def run_query(argv=sys.argv[1:]):
     parser = argparse.ArgumentParser(description="Run query on event data")
     parser.add_argument(
         "--input-statsbomb",
-        help="StatsBomb event input files (events.json,lineup.json)",
+        action="append",
+        default=[],
+        help="StatsBomb event input files (events.json,lineup.json). Can be given multiple times.",
     )
     parser.add_argument(
-        "--input-opta", help="Opta event input files (f24.xml,f7.xml)"
+        "--input-opta",
+        action="append",
+        default=[],
+        help="Opta event input files (f24.xml,f7.xml). Can be given multiple times.",
     )
     parser.add_argument(
-        "--input-datafactory", help="Datafactory event input file (.json)"
+        "--input-datafactory",
+        action="append",
+        default=[],
+        help="Datafactory event input file (.json). Can be given multiple times.",
+    )
+    parser.add_argument(
+        "--input-wyscout",
+        action="append",
+        default=[],
+        help="Wyscout event input file. Can be given multiple times.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of processes used to search the matches",
     )
-    parser.add_argument("--input-wyscout", help="Wyscout event input file")
     parser.add_argument("--output-xml", help="Output file")
     parser.add_argument(
         "--with-success",
@@ -95,43 +114,52 @@ def run_query(argv=sys.argv[1:]):
 
     query = load_query(opts.query_file)
 
-    dataset = None
-    if opts.input_statsbomb:
+    datasets = []
+    for input_statsbomb in opts.input_statsbomb:
         with performance_logging("load dataset", logger=logger):
-            events_filename, lineup_filename = opts.input_statsbomb.split(",")
-            dataset = statsbomb.load(
-                event_data=events_filename.strip(),
-                lineup_data=lineup_filename.strip(),
-                event_types=query.event_types,
+            events_filename, lineup_filename = input_statsbomb.split(",")
+            datasets.append(
+                statsbomb.load(
+                    event_data=events_filename.strip(),
+                    lineup_data=lineup_filename.strip(),
+                    event_types=query.event_types,
+                )
             )
-    if opts.input_opta:
+    for input_opta in opts.input_opta:
         with performance_logging("load dataset", logger=logger):
-            f24_filename, f7_filename = opts.input_opta.split(",")
-            dataset = opta.load(
-                f24_data=f24_filename.strip(),
-                f7_data=f7_filename.strip(),
-                event_types=query.event_types,
+            f24_filename, f7_filename = input_opta.split(",")
+            datasets.append(
+                opta.load(
+                    f24_data=f24_filename.strip(),
+                    f7_data=f7_filename.strip(),
+                    event_types=query.event_types,
+                )
             )
-    if opts.input_datafactory:
+    for input_datafactory in opts.input_datafactory:
         with performance_logging("load dataset", logger=logger):
-            events_filename = opts.input_datafactory
-            dataset = datafactory.load(
-                event_data=events_filename.strip(),
-                event_types=query.event_types,
+            datasets.append(
+                datafactory.load(
+                    event_data=input_datafactory.strip(),
+                    event_types=query.event_types,
+                )
             )
-    if opts.input_wyscout:
+    for input_wyscout in opts.input_wyscout:
         with performance_logging("load dataset", logger=logger):
-            events_filename = opts.input_wyscout
-            dataset = wyscout.load(
-                event_data=events_filename,
-                event_types=query.event_types,
+            datasets.append(
+                wyscout.load(
+                    event_data=input_wyscout,
+                    event_types=query.event_types,
+                )
             )
 
-    if not dataset:
+    if not datasets:
         raise Exception("You have to specify a dataset.")
+    if opts.output_xml and len(datasets) > 1:
+        raise Exception("Output to xml is only supported for a single match.")
+    dataset = datasets[0]
 
     with performance_logging("searching", logger=logger):
-        matches = pm.search(dataset, query.pattern)
+        matches = pm.search(datasets, query.pattern, workers=opts.workers)
 
     # Construct new code dataset with same properties (eg periods)
     # as original event dataset.
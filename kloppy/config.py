@@ -18,10 +18,14 @@ Config = TypedDict(
     "Config",
     {
         "cache": Optional[str],
+        "cache.max_size": Optional[int],
+        "cache.verify": bool,
         "coordinate_system": Optional[str],
         "event_factory": Optional[EventFactory],
         "adapters.http.basic_authentication": Optional[str],
         "adapters.s3.s3fs": Optional[Any],
+        "io.background_decompression": bool,
+        "io.memory_map": bool,
         "dataframe.engine": Optional[
             Union[Literal["pandas"], Literal["polars"]]
         ],
@@ -31,10 +35,14 @@ Config = TypedDict(
 # https://github.com/python/mypy/issues/6262
 CONFIG_KEYS = Literal[
     "cache",
+    "cache.max_size",
+    "cache.verify",
     "coordinate_system",
     "event_factory",
     "adapters.http.basic_authentication",
     "adapters.s3.s3fs",
+    "io.background_decompression",
+    "io.memory_map",
     "dataframe.engine",
 ]
 
@@ -45,10 +53,14 @@ class PartialConfig(Config, total=False):
 
 _default_config: Config = {
     "cache": cache_dir,
+    "cache.max_size": None,
+    "cache.verify": False,
     "coordinate_system": "kloppy",
     "event_factory": None,
     "adapters.http.basic_authentication": None,
     "adapters.s3.s3fs": None,
+    "io.background_decompression": False,
+    "io.memory_map": True,
     "dataframe.engine": "pandas",
 }
 
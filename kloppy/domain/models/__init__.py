@@ -3,3 +3,4 @@ from .pitch import *
 from .tracking import *
 from .event import *
 from .code import *
+from .corpus import *
@@ -1,9 +1,11 @@
 import sys
 from abc import ABC, abstractmethod
+from bisect import bisect_right
 from collections import defaultdict
 from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from enum import Enum, Flag
+from functools import partial
 from typing import (
     Any,
     Callable,
@@ -14,6 +16,8 @@ from typing import (
     Literal,
     NewType,
     Optional,
+    Sequence,
+    Tuple,
     TypeVar,
     Union,
     overload,
@@ -29,6 +33,7 @@ else:
 
 from ...exceptions import (
     InvalidFilterError,
+    KloppyError,
     KloppyParameterError,
     OrientationError,
 )
@@ -1094,6 +1099,15 @@ class DataRecord(ABC):
     def replace(self, **changes):
         return replace(self, **changes)
 
+    def __getstate__(self):
+        # Pickling the links would recurse through all records of the
+        # dataset. A pickled dataset restores them (see
+        # `Dataset.__setstate__`); a record pickled on its own loses them.
+        state = self.__dict__.copy()
+        for name in ("dataset", "prev_record", "next_record"):
+            state.pop(name, None)
+        return state
+
     def __str__(self):
         return f"<{self.__class__.__name__}>"
 
@@ -1150,10 +1164,216 @@ class Metadata:
                 else None,
             )
 
+    @property
+    def period_offsets(self) -> Dict[int, timedelta]:
+        """
+        The match time at the start of every period, by period id: the total
+        duration of the previous periods.
+        """
+        return {period.id: period.offset for period in self.periods}
+
+    def to_match_time(
+        self, period_ids: Iterable[int], timestamps: Iterable[timedelta]
+    ) -> List[timedelta]:
+        """
+        Convert columns of period ids and timestamps (relative to the start
+        of the period) to the time since the start of the match.
+
+        Examples:
+            >>> match_times = dataset.metadata.to_match_time(
+            ...     [record.period.id for record in dataset.records],
+            ...     [record.timestamp for record in dataset.records],
+            ... )
+        """
+        offsets = self.period_offsets
+        return [
+            offsets[period_id] + timestamp
+            for period_id, timestamp in zip(period_ids, timestamps)
+        ]
+
+    def from_match_time(
+        self, match_times: Iterable[timedelta]
+    ) -> Tuple[List[int], List[timedelta]]:
+        """
+        Convert a column of times since the start of the match to columns of
+        period ids and timestamps (relative to the start of the period). A
+        time at the boundary between two periods is at the start of the
+        later period.
+
+        Examples:
+            >>> period_ids, timestamps = dataset.metadata.from_match_time(
+            ...     match_times
+            ... )
+        """
+        offsets = self.period_offsets
+        if not offsets:
+            raise KloppyError("Cannot convert match times without periods")
+        ids = list(offsets.keys())
+        starts = list(offsets.values())
+
+        period_ids = []
+        timestamps = []
+        for match_time in match_times:
+            idx = max(bisect_right(starts, match_time) - 1, 0)
+            period_ids.append(ids[idx])
+            timestamps.append(match_time - starts[idx])
+        return period_ids, timestamps
+
 
 T = TypeVar("T", bound="DataRecord")
 
 
+def _check_metadata_compatible(metadata: Metadata, other: Metadata):
+    for attribute in [
+        "provider",
+        "coordinate_system",
+        "orientation",
+        "frame_rate",
+    ]:
+        if getattr(metadata, attribute) != getattr(other, attribute):
+            raise KloppyParameterError(
+                f"Cannot concatenate datasets with a different {attribute}: "
+                f"{getattr(metadata, attribute)} != "
+                f"{getattr(other, attribute)}"
+            )
+
+    team_ids = [team.team_id for team in metadata.teams]
+    other_team_ids = [team.team_id for team in other.teams]
+    if team_ids != other_team_ids:
+        raise KloppyParameterError(
+            f"Cannot concatenate datasets of different teams: {team_ids} != "
+            f"{other_team_ids}"
+        )
+
+
+_TEAM_ATTRIBUTES = ("team", "ball_owning_team")
+_PLAYER_ATTRIBUTES = ("player", "receiver_player", "replacement_player")
+
+
+def _merge_players(
+    other_teams: List[Team], teams: Dict[str, Team], players: Dict[str, Player]
+):
+    """
+    Add the players that are only known to the metadata of another dataset
+    (e.g. a substitute that only appears in the second half) to the teams of
+    the metadata, so all records can refer to a player of `teams`.
+    """
+    for other_team in other_teams:
+        team = teams[other_team.team_id]
+        for player in other_team.players:
+            if player.player_id not in players:
+                player = replace(player, team=team)
+                team.players.append(player)
+                players[player.player_id] = player
+
+
+def _use_metadata_players(
+    record: "DataRecord", teams: Dict[str, Team], players: Dict[str, Player]
+):
+    """Point the team and player references of a record to the metadata."""
+    for attribute in _TEAM_ATTRIBUTES:
+        team = record.__dict__.get(attribute)
+        if team is not None:
+            record.__dict__[attribute] = teams.get(team.team_id, team)
+    for attribute in _PLAYER_ATTRIBUTES:
+        player = record.__dict__.get(attribute)
+        if player is not None:
+            record.__dict__[attribute] = players.get(player.player_id, player)
+    for attribute in ("player_positions", "players_data"):
+        # The positions of a formation change and the player data of a
+        # frame are keyed by player
+        values = record.__dict__.get(attribute)
+        if values:
+            record.__dict__[attribute] = {
+                (
+                    players.get(player.player_id, player)
+                    if player is not None
+                    else None
+                ): value
+                for player, value in values.items()
+            }
+
+    map_freeze_frame = getattr(record, "map_freeze_frame", None)
+    if map_freeze_frame is not None:
+        map_freeze_frame(
+            partial(_use_metadata_players_of_frame, teams, players)
+        )
+
+
+def _use_metadata_players_of_frame(
+    teams: Dict[str, Team], players: Dict[str, Player], frame: "DataRecord"
+) -> "DataRecord":
+    _use_metadata_players(frame, teams, players)
+    return frame
+
+
+def dataframe_from_dict(
+    data: Dict[str, List[Any]],
+    engine: Optional[
+        Union[
+            Literal["polars"],
+            Literal["pandas"],
+            Literal["pandas[pyarrow]"],
+        ]
+    ] = None,
+):
+    """Convert a dict of columns to a dataframe of the requested engine."""
+    from kloppy.config import get_config
+
+    if not engine:
+        engine = get_config("dataframe.engine")
+
+    if engine == "pandas[pyarrow]":
+        try:
+            import pandas as pd
+
+            types_mapper = pd.ArrowDtype
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pandas installed. Please"
+                " install it using: pip install pandas"
+            )
+        except AttributeError:
+            raise AttributeError(
+                "Seems like you have an older version of pandas installed. Please"
+                " upgrade to at least 1.5 using: pip install pandas>=1.5"
+            )
+
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pyarrow installed. Please"
+                " install it using: pip install pyarrow"
+            )
+
+        table = pa.Table.from_pydict(data)
+        return table.to_pandas(types_mapper=types_mapper)
+
+    elif engine == "pandas":
+        try:
+            from pandas import DataFrame
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have pandas installed. Please"
+                " install it using: pip install pandas"
+            )
+
+        return DataFrame.from_dict(data)
+    elif engine == "polars":
+        try:
+            from polars import from_dict
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have polars installed. Please"
+                " install it using: pip install polars"
+            )
+
+        return from_dict(data)
+    else:
+        raise KloppyParameterError(f"Engine {engine} is not valid")
+
+
 @dataclass
 class Dataset(ABC, Generic[T]):
     """
@@ -1180,6 +1400,12 @@ class Dataset(ABC, Generic[T]):
         return len(self.records)
 
     def __post_init__(self):
+        self._link_records()
+
+        self._init_player_positions()
+        self._update_formations_and_positions()
+
+    def _link_records(self):
         for i, record in enumerate(self.records):
             record.set_refs(
                 dataset=self,
@@ -1189,8 +1415,9 @@ class Dataset(ABC, Generic[T]):
                 else None,
             )
 
-        self._init_player_positions()
-        self._update_formations_and_positions()
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._link_records()
 
     def _init_player_positions(self):
         start_of_match = self.metadata.periods[0].start_time
@@ -1239,6 +1466,7 @@ class Dataset(ABC, Generic[T]):
             >>> from kloppy.domain import EventType
             >>> dataset = dataset.filter(lambda event: event.event_type == EventType.PASS)
             >>> dataset = dataset.filter('pass')
+            >>> dataset = dataset.filter('pass.home > shot.home')
         """
         return replace(
             self,
@@ -1250,6 +1478,14 @@ class Dataset(ABC, Generic[T]):
             self, records=[mapper(record) for record in self.records]
         )
 
+    def possessions(self) -> "PossessionTable":
+        """
+        See [segment_possessions][kloppy.domain.services.possessions.segment_possessions]
+        """
+        from kloppy.domain.services.possessions import segment_possessions
+
+        return segment_possessions(self)
+
     def find_all(self, filter_) -> List[T]:
         return [record for record in self.records if record.matches(filter_)]
 
@@ -1294,6 +1530,112 @@ class Dataset(ABC, Generic[T]):
             records=[mapper_fn(record) for record in dataset.records],
         )
 
+    @classmethod
+    def concat(cls, datasets: Sequence["Dataset"]) -> Self:
+        """
+        Concatenate datasets of the same match into a single dataset, for
+        example the periods of a match that were delivered as separate files.
+
+        The metadata of the first dataset is re-used, with the periods of all
+        datasets merged. Players that only appear in the metadata of a later
+        dataset are added to the teams of the first one. The records are moved to the new dataset: only the
+        records at the boundaries between datasets are re-linked, and the
+        player positions are computed once for the whole match. The datasets
+        passed in should not be used anymore afterwards.
+
+        Arguments:
+            - datasets: datasets with compatible metadata (same provider,
+                coordinate system, orientation, frame rate and teams), in
+                chronological order
+
+        Examples:
+            >>> first_half = sportec.load_tracking(raw_data="half1.xml", meta_data="meta.xml")
+            >>> second_half = sportec.load_tracking(raw_data="half2.xml", meta_data="meta.xml")
+            >>> dataset = TrackingDataset.concat([first_half, second_half])
+        """
+        if not datasets:
+            raise KloppyParameterError("Please pass at least one dataset")
+
+        first = datasets[0]
+        for other in datasets[1:]:
+            if type(other) is not type(first):
+                raise KloppyParameterError(
+                    f"Cannot concatenate a {type(other).__name__} to a "
+                    f"{type(first).__name__}"
+                )
+            _check_metadata_compatible(first.metadata, other.metadata)
+
+        periods: Dict[int, Period] = {}
+        for dataset in datasets:
+            for period in dataset.metadata.periods:
+                current = periods.get(period.id)
+                if current is None:
+                    periods[period.id] = period
+                elif current is not period and (
+                    period.start_timestamp < current.start_timestamp
+                    or period.end_timestamp > current.end_timestamp
+                ):
+                    periods[period.id] = Period(
+                        id=period.id,
+                        start_timestamp=min(
+                            current.start_timestamp, period.start_timestamp
+                        ),
+                        end_timestamp=max(
+                            current.end_timestamp, period.end_timestamp
+                        ),
+                    )
+
+        merged_periods = [periods[period_id] for period_id in sorted(periods)]
+        if len(merged_periods) == len(first.metadata.periods) and all(
+            period is other_period
+            for period, other_period in zip(
+                merged_periods, first.metadata.periods
+            )
+        ):
+            metadata = first.metadata
+        else:
+            metadata = replace(first.metadata, periods=merged_periods)
+
+        teams = {team.team_id: team for team in metadata.teams}
+        players = {
+            player.player_id: player
+            for team in metadata.teams
+            for player in team.players
+        }
+
+        # Create the dataset without records, so the (expensive) position
+        # tracking only runs once, after all records are added.
+        concatenated = cls(metadata=metadata, records=[])
+        records = concatenated.records
+        for dataset in datasets:
+            if not dataset.records:
+                continue
+
+            same_periods = all(
+                periods[period.id] is period
+                for period in dataset.metadata.periods
+            )
+            same_teams = all(
+                teams[team.team_id] is team for team in dataset.metadata.teams
+            )
+            if not same_teams:
+                _merge_players(dataset.metadata.teams, teams, players)
+            for record in dataset.records:
+                record.dataset = concatenated
+                if not same_periods:
+                    record.period = periods[record.period.id]
+                if not same_teams:
+                    _use_metadata_players(record, teams, players)
+
+            if records:
+                records[-1].next_record = dataset.records[0]
+                dataset.records[0].prev_record = records[-1]
+            records.extend(dataset.records)
+
+        concatenated._init_player_positions()
+        concatenated._update_formations_and_positions()
+        return concatenated
+
     def get_record_by_id(self, record_id: Union[int, str]) -> Optional[T]:
         for record in self.records:
             if record.record_id == record_id:
@@ -1372,62 +1714,9 @@ class Dataset(ABC, Generic[T]):
         ] = None,
         **named_columns: "Column",
     ):
-        from kloppy.config import get_config
-
-        if not engine:
-            engine = get_config("dataframe.engine")
-
-        if engine == "pandas[pyarrow]":
-            try:
-                import pandas as pd
-
-                types_mapper = pd.ArrowDtype
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pandas installed. Please"
-                    " install it using: pip install pandas"
-                )
-            except AttributeError:
-                raise AttributeError(
-                    "Seems like you have an older version of pandas installed. Please"
-                    " upgrade to at least 1.5 using: pip install pandas>=1.5"
-                )
-
-            try:
-                import pyarrow as pa
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pyarrow installed. Please"
-                    " install it using: pip install pyarrow"
-                )
-
-            table = pa.Table.from_pydict(
-                self.to_dict(*columns, **named_columns)
-            )
-            return table.to_pandas(types_mapper=types_mapper)
-
-        elif engine == "pandas":
-            try:
-                from pandas import DataFrame
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have pandas installed. Please"
-                    " install it using: pip install pandas"
-                )
-
-            return DataFrame.from_dict(self.to_dict(*columns, **named_columns))
-        elif engine == "polars":
-            try:
-                from polars import from_dict
-            except ImportError:
-                raise ImportError(
-                    "Seems like you don't have polars installed. Please"
-                    " install it using: pip install polars"
-                )
-
-            return from_dict(self.to_dict(*columns, **named_columns))
-        else:
-            raise KloppyParameterError(f"Engine {engine} is not valid")
+        return dataframe_from_dict(
+            self.to_dict(*columns, **named_columns), engine=engine
+        )
 
     def __repr__(self):
         return f"<{self.__class__.__name__} record_count={len(self.records)}>"
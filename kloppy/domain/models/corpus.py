@@ -0,0 +1,318 @@
+from dataclasses import dataclass
+from itertools import compress
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from kloppy.exceptions import KloppyParameterError
+
+from .common import Dataset, Metadata, dataframe_from_dict
+from .event import EventDataset
+
+Column = Dataset.Column
+
+# Columns with few distinct values that `filter` and `groupby` are mostly
+# used with. For these columns the rows of every value are indexed.
+INDEXED_COLUMNS = ("match_id", "event_type", "team_id", "player_id")
+
+
+@dataclass(frozen=True)
+class CorpusTeam:
+    """
+    A team as it is known across all matches of an `EventCorpus`
+
+    Attributes:
+        team_id: identifier given by the provider
+        name: readable name of the team
+    """
+
+    team_id: str
+    name: str
+
+    def __str__(self):
+        return self.name
+
+
+@dataclass(frozen=True)
+class CorpusPlayer:
+    """
+    A player as it is known across all matches of an `EventCorpus`
+
+    Attributes:
+        player_id: identifier given by the provider
+        name: full name of the player
+    """
+
+    player_id: str
+    name: str
+
+    def __str__(self):
+        return self.name
+
+
+class EventCorpus:
+    """
+    Events of many matches stored in a single columnar table.
+
+    Each match is converted to columns (see
+    [`to_dict`][kloppy.domain.models.common.Dataset.to_dict]) when it is
+    added, after which the event objects can be garbage collected. Teams and
+    players are interned: they are stored once for the whole corpus, no
+    matter in how many matches they appear. The metadata of every match is
+    kept separately.
+
+    The `match_id`, `event_type`, `team_id` and `player_id` columns are
+    indexed: the first time one of them is filtered or grouped on, the rows
+    of each value are collected, after which only the selected rows are
+    visited. Other columns are compared row by row in Python.
+
+    Attributes:
+        metadata: the `Metadata` of each match, by match id
+        teams: the interned teams, by team id
+        players: the interned players, by player id
+
+    Examples:
+        >>> corpus = EventCorpus.from_datasets(
+        ...     (match_id, statsbomb.load(f"{match_id}.json", f"lineup_{match_id}.json"))
+        ...     for match_id in match_ids
+        ... )
+        >>> shots = corpus.filter(event_type="SHOT")
+        >>> shots_per_player = {
+        ...     corpus.players[player_id].name: len(player_shots)
+        ...     for player_id, player_shots in shots.groupby("player_id").items()
+        ... }
+    """
+
+    def __init__(self, *columns: Column, **named_columns: Column):
+        self.columns = columns
+        self.named_columns = named_columns
+
+        self.metadata: Dict[str, Metadata] = {}
+        self.teams: Dict[str, CorpusTeam] = {}
+        self.players: Dict[str, CorpusPlayer] = {}
+
+        self._table: Dict[str, List[Any]] = {"match_id": []}
+        # The row numbers of every value, for the indexed columns that were
+        # used by `filter` or `groupby`
+        self._indices: Dict[str, Dict[Any, List[int]]] = {}
+
+    @classmethod
+    def from_datasets(
+        cls,
+        datasets: Iterable[Union[EventDataset, Tuple[str, EventDataset]]],
+        *columns: Column,
+        **named_columns: Column,
+    ) -> "EventCorpus":
+        """Create a corpus from datasets.
+
+        `datasets` yields either datasets, or `(match_id, dataset)` pairs for
+        datasets without a `game_id`. When it is a generator, only one
+        dataset is kept in memory at a time.
+        """
+        corpus = cls(*columns, **named_columns)
+        for item in datasets:
+            if isinstance(item, tuple):
+                corpus.add(item[1], match_id=item[0])
+            else:
+                corpus.add(item)
+        return corpus
+
+    def add(self, dataset: EventDataset, match_id: Optional[str] = None):
+        """Add the events of a match to the corpus.
+
+        Arguments:
+            dataset: the events of the match
+            match_id: identifier of the match. Defaults to the `game_id` of
+                the dataset.
+        """
+        match_id = match_id or dataset.metadata.game_id
+        if match_id is None:
+            raise KloppyParameterError(
+                "The dataset has no game_id. Please pass a match_id."
+            )
+        match_id = str(match_id)
+        if match_id in self.metadata:
+            raise KloppyParameterError(
+                f"Match {match_id} is already part of the corpus"
+            )
+        self.metadata[match_id] = dataset.metadata
+
+        for team in dataset.metadata.teams:
+            if team.team_id not in self.teams:
+                self.teams[team.team_id] = CorpusTeam(
+                    team_id=team.team_id, name=team.name
+                )
+            for player in team.players:
+                if player.player_id not in self.players:
+                    self.players[player.player_id] = CorpusPlayer(
+                        player_id=player.player_id, name=player.full_name
+                    )
+
+        size = len(self)
+        record_count = len(dataset.records)
+        data = dataset.to_dict(*self.columns, **self.named_columns)
+        # Iterate `data` to add new columns in the order of the dataset
+        for name in data:
+            if name not in self._table:
+                self._table[name] = [None] * size
+        for name, values in self._table.items():
+            if name == "match_id":
+                values.extend([match_id] * record_count)
+            elif name in data:
+                values.extend(data[name])
+            else:
+                values.extend([None] * record_count)
+
+            index = self._indices.get(name)
+            if index is not None:
+                for row, value in enumerate(values[size:], size):
+                    index.setdefault(value, []).append(row)
+
+    def __len__(self):
+        return len(self._table["match_id"])
+
+    @property
+    def column_names(self) -> List[str]:
+        return list(self._table.keys())
+
+    def column(self, name: str) -> List[Any]:
+        """Get the values of a single column."""
+        try:
+            return self._table[name]
+        except KeyError:
+            raise KloppyParameterError(f"Unknown column {name}")
+
+    def _index(self, name: str) -> Optional[Dict[Any, List[int]]]:
+        """The row numbers of every value of column `name`, or `None` when
+        the column is not indexed."""
+        if name not in INDEXED_COLUMNS or name not in self._table:
+            return None
+        index = self._indices.get(name)
+        if index is None:
+            index = self._indices[name] = {}
+            for row, value in enumerate(self._table[name]):
+                index.setdefault(value, []).append(row)
+        return index
+
+    def filter(
+        self, mask: Optional[Sequence[bool]] = None, **column_values: Any
+    ) -> "EventCorpus":
+        """
+        Select the events for which `mask` is true and all the given columns
+        have the given value.
+
+        The mask can be any sequence of booleans with one value per event,
+        such as a numpy array or a pandas series computed over the columns.
+        Values of the indexed columns are looked up in the index; other
+        columns are only compared for the rows that are still selected.
+
+        Examples:
+            >>> import numpy as np
+            >>> x = np.array(corpus.column("coordinates_x"), dtype=float)
+            >>> corpus = corpus.filter(x > 60, event_type="PASS")
+        """
+        if mask is not None:
+            mask = list(mask)
+            if len(mask) != len(self):
+                raise KloppyParameterError(
+                    f"The mask has {len(mask)} values, but the corpus "
+                    f"contains {len(self)} events"
+                )
+            indices = list(compress(range(len(self)), mask))
+        else:
+            indices = None
+
+        other_column_values = {}
+        for name, value in column_values.items():
+            index = self._index(name)
+            if index is None:
+                other_column_values[name] = self.column(name)
+                continue
+            rows = index.get(value, [])
+            if indices is None:
+                indices = rows
+            else:
+                rows = set(rows)
+                indices = [idx for idx in indices if idx in rows]
+
+        if indices is None:
+            indices = range(len(self))
+        for name, values in other_column_values.items():
+            value = column_values[name]
+            indices = [idx for idx in indices if values[idx] == value]
+
+        return self._select(list(indices))
+
+    def groupby(self, *names: str) -> Dict[Any, "EventCorpus"]:
+        """
+        Split the corpus by the values of one or more columns.
+
+        The keys are the column values, or tuples of values when grouping by
+        multiple columns.
+        """
+        if not names:
+            raise KloppyParameterError("Please specify at least one column")
+
+        index = self._index(names[0]) if len(names) == 1 else None
+        if index is not None:
+            return {key: self._select(idx) for key, idx in index.items()}
+
+        keys = (
+            self.column(names[0])
+            if len(names) == 1
+            else list(zip(*(self.column(name) for name in names)))
+        )
+        indices: Dict[Any, List[int]] = {}
+        for idx, key in enumerate(keys):
+            indices.setdefault(key, []).append(idx)
+        return {key: self._select(idx) for key, idx in indices.items()}
+
+    def _select(self, indices: List[int]) -> "EventCorpus":
+        corpus = EventCorpus(*self.columns, **self.named_columns)
+        corpus.teams = dict(self.teams)
+        corpus.players = dict(self.players)
+        corpus._table = {
+            name: [values[idx] for idx in indices]
+            for name, values in self._table.items()
+        }
+        match_ids = set(corpus._table["match_id"])
+        corpus.metadata = {
+            match_id: metadata
+            for match_id, metadata in self.metadata.items()
+            if match_id in match_ids
+        }
+        return corpus
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {name: list(values) for name, values in self._table.items()}
+
+    def to_df(
+        self,
+        engine: Optional[
+            Union[
+                Literal["polars"],
+                Literal["pandas"],
+                Literal["pandas[pyarrow]"],
+            ]
+        ] = None,
+    ):
+        return dataframe_from_dict(self._table, engine=engine)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} match_count={len(self.metadata)} "
+            f"event_count={len(self)}>"
+        )
+
+    __str__ = __repr__
+
+
+__all__ = ["CorpusTeam", "CorpusPlayer", "EventCorpus"]
@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import timedelta
 from enum import Enum
+from functools import partial
 from typing import (
     Dict,
     List,
@@ -35,6 +36,7 @@ from ...exceptions import OrphanedRecordError, InvalidFilterError, KloppyError
 
 if TYPE_CHECKING:
     from .tracking import Frame
+    from ..services.state_builder.table import StateTable
 
 
 class ResultType(Enum):
@@ -655,6 +657,41 @@ class Event(DataRecord, ABC):
     def related_formation_change(self) -> Optional["FormationChangeEvent"]:
         return self.get_related_event(EventType.FORMATION_CHANGE)
 
+    def map_freeze_frame(self, func: Callable[["Frame"], "Frame"]):
+        """
+        Apply `func` to the freeze frame of this event.
+
+        A freeze frame that is not loaded yet stays lazy; `func` is applied
+        when the freeze frame gets materialized.
+        """
+        freeze_frame = self.__dict__.get("_freeze_frame")
+        if callable(freeze_frame):
+            self.freeze_frame = partial(
+                _apply_to_lazy_freeze_frame, func, freeze_frame
+            )
+        elif freeze_frame:
+            self.freeze_frame = func(freeze_frame)
+
+    def set_state_ref(self, state_table: "StateTable", idx: int):
+        """
+        Let `state` refer to row `idx` of `state_table`. The row is only
+        read when `state` is accessed.
+        """
+        self.__dict__["_state_ref"] = (state_table, idx)
+
+    def __getstate__(self):
+        # A lazy freeze frame is pickled as-is, so it is still only loaded
+        # when it is accessed. A state reference refers to the state table
+        # of the whole dataset, so only the state row of this event is kept.
+        _get_state(self)
+        return super().__getstate__()
+
+    def replace(self, **changes):
+        # Pass the (possibly lazy) freeze frame as-is, so copying an event
+        # does not materialize it.
+        changes.setdefault("freeze_frame", self.__dict__.get("_freeze_frame"))
+        return replace(self, **changes)
+
     def matches(self, filter_) -> bool:
         if filter_ is None:
             return True
@@ -721,6 +758,59 @@ class Event(DataRecord, ABC):
         return str(self)
 
 
+def _apply_to_lazy_freeze_frame(
+    func: Callable[["Frame"], "Frame"],
+    loader: Callable[[], Optional["Frame"]],
+) -> Optional["Frame"]:
+    freeze_frame = loader()
+    return func(freeze_frame) if freeze_frame else freeze_frame
+
+
+def _get_freeze_frame(event: Event) -> Optional["Frame"]:
+    freeze_frame = event.__dict__.get("_freeze_frame")
+    if callable(freeze_frame):
+        # The freeze frame is loaded lazily. Materialize it on first access
+        # and keep the result.
+        freeze_frame = freeze_frame()
+        event.__dict__["_freeze_frame"] = freeze_frame
+    return freeze_frame
+
+
+def _set_freeze_frame(
+    event: Event,
+    freeze_frame: Union[Optional["Frame"], Callable[[], Optional["Frame"]]],
+):
+    event.__dict__["_freeze_frame"] = freeze_frame
+
+
+# `freeze_frame` is a dataclass field, but its value can be a (zero-argument)
+# callable that is only evaluated when the freeze frame is accessed.
+Event.freeze_frame = property(_get_freeze_frame, _set_freeze_frame)
+
+
+def _get_state(event: Event) -> Dict[str, Any]:
+    state = event.__dict__.get("_state")
+    state_ref = event.__dict__.pop("_state_ref", None)
+    if state_ref is not None:
+        # Merge the state from the state table on first access. The dict
+        # passed to the constructor can be shared with copies of this event,
+        # so it is not updated in place.
+        state_table, idx = state_ref
+        state = {**(state or {}), **state_table.row(idx)}
+        event.__dict__["_state"] = state
+    return state
+
+
+def _set_state(event: Event, state: Dict[str, Any]):
+    event.__dict__.pop("_state_ref", None)
+    event.__dict__["_state"] = state
+
+
+# `state` is a dataclass field, but it can also refer to a row of the
+# `StateTable` built by `EventDataset.add_state`.
+Event.state = property(_get_state, _set_state)
+
+
 @dataclass(repr=False)
 @docstring_inherit_attributes(Event)
 class GenericEvent(Event):
@@ -1056,12 +1146,15 @@ class EventDataset(Dataset[Event]):
         records (List[Event]): See [`Event`][kloppy.domain.models.event.Event]
         dataset_type: `DatasetType.EVENT` (See [`DatasetType`][kloppy.domain.models.common.DatasetType])
         events: alias for `records`
+        state_table: the state added by `add_state`. See [`StateTable`][kloppy.domain.services.state_builder.table.StateTable]
     """
 
     records: List[Event]
 
     dataset_type: DatasetType = DatasetType.EVENT
 
+    state_table: Optional["StateTable"] = field(default=None, init=False)
+
     def _update_formations_and_positions(self):
         """Update team formations and player positions based on Substitution and TacticalShift events."""
         max_leeway = timedelta(seconds=60)
@@ -1123,6 +1216,29 @@ class EventDataset(Dataset[Event]):
     def events(self):
         return self.records
 
+    def find_all(self, filter_) -> List[Event]:
+        """
+        Find all events that match `filter_`.
+
+        A string is interpreted as a CSS selector, see
+        [css][kloppy.domain.services.matchers.css] for the supported syntax.
+
+        Examples:
+            >>> goals = dataset.find_all("shot.goal")
+            >>> shots_after_pass = dataset.find_all("pass.home > shot.home")
+        """
+        if isinstance(filter_, str):
+            from kloppy.domain.services.matchers.css import CSSPatternMatcher
+
+            return CSSPatternMatcher(filter_).match(self)
+        return super().find_all(filter_)
+
+    def find(self, filter_) -> Optional[Event]:
+        if isinstance(filter_, str):
+            events = self.find_all(filter_)
+            return events[0] if events else None
+        return super().find(filter_)
+
     def get_event_by_id(self, event_id: str) -> Event:
         return self.get_record_by_id(event_id)
 
@@ -1,7 +1,10 @@
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import (
     Generic,
+    Iterable,
     List,
     Literal,
     Optional,
@@ -15,6 +18,9 @@ from sortedcontainers import SortedDict
 
 from kloppy.exceptions import KloppyError
 
+_MICROSECOND = timedelta(microseconds=1)
+_ZERO = timedelta(0)
+
 
 @dataclass
 class Period:
@@ -63,6 +69,23 @@ class Period:
     def duration(self) -> timedelta:
         return self.end_timestamp - self.start_timestamp
 
+    @property
+    def offset(self) -> timedelta:
+        """
+        The match time at the start of this period: the total duration of
+        all previous periods. It is computed once, and reset by `set_refs`.
+        """
+        offset = self.__dict__.get("_offset")
+        if offset is None:
+            prev_period = getattr(self, "prev_period", None)
+            offset = (
+                prev_period.offset + prev_period.duration
+                if prev_period
+                else _ZERO
+            )
+            self.__dict__["_offset"] = offset
+        return offset
+
     def __eq__(self, other):
         return isinstance(other, Period) and other.id == self.id
 
@@ -89,6 +112,7 @@ class Period:
         """
         self.prev_period = prev
         self.next_period = next_
+        self.__dict__.pop("_offset", None)
 
 
 @dataclass
@@ -96,6 +120,26 @@ class Time:
     period: "Period"
     timestamp: timedelta
 
+    @property
+    def sort_key(self) -> Tuple[int, int]:
+        """
+        An integer key (period id, timestamp in microseconds) that orders
+        and identifies times. Comparing keys is much cheaper than comparing
+        periods and timedeltas, so the key is computed once and cached.
+        """
+        key = self.__dict__.get("_sort_key")
+        if key is None:
+            key = self.__dict__["_sort_key"] = (
+                self.period.id,
+                self.timestamp // _MICROSECOND,
+            )
+        return key
+
+    @property
+    def match_time(self) -> timedelta:
+        """The time since the start of the match."""
+        return self.period.offset + self.timestamp
+
     @classmethod
     def from_period(
         cls,
@@ -124,56 +168,46 @@ class Time:
         AbsTime - AbsTime = timedelta
         AbsTime - timedelta = AbsTime
 
-        The period duration must be taking into account.
+        The period duration must be taking into account. Moving within a
+        period, or subtracting two times, doesn't walk the periods: the
+        offsets of the periods are cached.
         """
         if isinstance(other, timedelta):
-            current_timestamp = self.timestamp
-            current_period = self.period
-            while other > current_timestamp:
-                other -= current_timestamp
-                if not current_period.prev_period:
+            period = self.period
+            timestamp = self.timestamp - other
+            while timestamp < _ZERO:
+                if not period.prev_period:
                     # We reached start of the match, lets just return start itself
-                    return Time(period=current_period, timestamp=timedelta(0))
+                    return Time(period=period, timestamp=_ZERO)
 
-                current_period = current_period.prev_period
-                current_timestamp = current_period.duration
+                period = period.prev_period
+                timestamp += period.duration
 
-            return Time(
-                period=current_period, timestamp=current_timestamp - other
-            )
+            return Time(period=period, timestamp=timestamp)
 
         elif isinstance(other, Time):
-            if self.period >= other.period:
-                diff = self.timestamp
-                current_period = self.period
-                while current_period > other.period:
-                    current_period = current_period.prev_period
-                    diff += current_period.duration
-
-                return diff - other.timestamp
-            else:
-                return -other.__sub__(self)
+            if self.period.id == other.period.id:
+                return self.timestamp - other.timestamp
+            return self.match_time - other.match_time
         else:
             raise ValueError(f"Cannot subtract {other}")
 
     def __add__(self, other: timedelta) -> "Time":
         assert isinstance(other, timedelta)
-        current_timestamp = self.timestamp
-        current_period = self.period
-        while (current_timestamp + other) > current_period.duration:
+        period = self.period
+        timestamp = self.timestamp + other
+        duration = period.duration
+        while timestamp > duration:
             # Subtract time left in this period
+            if not period.next_period:
+                # We reached end of the match, lets just return end itself
+                return Time(period=period, timestamp=duration)
 
-            other -= current_period.duration - current_timestamp
-            if not current_period.next_period:
-                # We reached start of the match, lets just return start itself
-                return Time(
-                    period=current_period, timestamp=current_period.duration
-                )
+            timestamp -= duration
+            period = period.next_period
+            duration = period.duration
 
-            current_period = current_period.next_period
-            current_timestamp = timedelta(0)
-
-        return Time(period=current_period, timestamp=current_timestamp + other)
+        return Time(period=period, timestamp=timestamp)
 
     def __radd__(self, other: timedelta) -> "Time":
         assert isinstance(other, timedelta)
@@ -183,16 +217,14 @@ class Time:
         raise RuntimeError("Doesn't make sense.")
 
     def __lt__(self, other):
-        return self.period < other.period or (
-            self.period == other.period and self.timestamp < other.timestamp
-        )
+        return self.sort_key < other.sort_key
 
     def __str__(self):
         m, s = divmod(self.timestamp.total_seconds(), 60)
         return f"P{self.period.id}T{m:02.0f}:{s:02.0f}"
 
     def __hash__(self):
-        return hash((self.period.id, self.timestamp.total_seconds()))
+        return hash(self.sort_key)
 
 
 SENTINEL = object()
@@ -202,7 +234,9 @@ T = TypeVar("T")
 
 class TimeContainer(Generic[T]):
     def __init__(self):
-        self.items: SortedDict = SortedDict()
+        # Sort on the integer key of the times, so lookups don't need to
+        # compare `Time` objects
+        self.items: SortedDict = SortedDict(attrgetter("sort_key"))
 
     def set(self, time: Time, item: Optional[T]):
         self.items[time] = item  # Pair(key=time, item=item)
@@ -213,6 +247,44 @@ class TimeContainer(Generic[T]):
             raise KeyError("Not found")
         return self.items.values()[idx]
 
+    def values_at(
+        self, times: Iterable[Time], default=SENTINEL
+    ) -> List[Optional[T]]:
+        """
+        Return the values at all `times` at once.
+
+        The times are resolved in a single merge pass over the items when
+        they are sorted, which is the case for the records of a dataset.
+        Times that are out of order fall back to a binary search.
+
+        Arguments:
+            times: the times to look up, preferably sorted
+            default: the value for times before the first item. When not
+                given, a `KeyError` is raised for such times.
+        """
+        keys = [time.sort_key for time in self.items.keys()]
+        values = list(self.items.values())
+
+        results = []
+        idx = -1
+        prev_key = None
+        for time in times:
+            key = time.sort_key
+            if prev_key is not None and key < prev_key:
+                idx = bisect_right(keys, key) - 1
+            else:
+                while idx + 1 < len(keys) and keys[idx + 1] <= key:
+                    idx += 1
+            prev_key = key
+
+            if idx >= 0:
+                results.append(values[idx])
+            elif default is SENTINEL:
+                raise KeyError("Not found")
+            else:
+                results.append(default)
+        return results
+
     def __getitem__(self, item: Time):
         return self.value_at(item)
 
@@ -234,10 +306,7 @@ class TimeContainer(Generic[T]):
         if len(items) < 2:
             raise ValueError("Cannot create ranges when length < 2")
 
-        ranges_ = []
-        for start_time, end_time in zip(items[:-1], items[1:]):
-            ranges_.append((start_time, end_time, self.items[start_time]))
-        return ranges_
+        return list(zip(items[:-1], items[1:], self.items.values()))
 
     def last(self, include_time: bool = False, default=SENTINEL):
         if not len(self.items):
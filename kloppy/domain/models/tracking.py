@@ -5,6 +5,7 @@ from kloppy.domain.models.common import DatasetType
 
 from .common import Dataset, DataRecord, Player
 from .pitch import Point, Point3D
+from kloppy.exceptions import KloppyError
 from kloppy.utils import (
     deprecated,
 )
@@ -52,6 +53,26 @@ class TrackingDataset(Dataset[Frame]):
     def frame_rate(self):
         return self.metadata.frame_rate
 
+    def aggregate(self, type_: str, **aggregator_kwargs) -> List[Any]:
+        if type_ == "physical":
+            from kloppy.domain.services.aggregators.physical import (
+                PhysicalAggregator,
+            )
+
+            aggregator = PhysicalAggregator(**aggregator_kwargs)
+        else:
+            raise KloppyError(f"No aggregator {type_} not found")
+
+        return aggregator.aggregate(self)
+
+    def compute_kinematics(self, *args, **kwargs) -> "TrackingDataset":
+        """
+        See [compute_kinematics][kloppy.domain.services.kinematics.compute_kinematics]
+        """
+        from ..services.kinematics import compute_kinematics
+
+        return compute_kinematics(self, *args, **kwargs)
+
     @deprecated(
         "to_pandas will be removed in the future. Please use to_df instead."
     )
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
 from typing import List, NamedTuple
 
-from kloppy.domain import EventDataset
+from kloppy.domain import EventDataset, TrackingDataset
 
 
 class EventDatasetAggregator(ABC):
     @abstractmethod
     def aggregate(self, dataset: EventDataset) -> List[NamedTuple]:
         raise NotImplementedError
+
+
+class TrackingDatasetAggregator(ABC):
+    @abstractmethod
+    def aggregate(self, dataset: TrackingDataset) -> List[NamedTuple]:
+        raise NotImplementedError
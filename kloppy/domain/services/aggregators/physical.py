@@ -0,0 +1,190 @@
+from datetime import timedelta
+from typing import Dict, List, NamedTuple, Optional
+
+from kloppy.domain import Period, Player, TrackingDataset
+from kloppy.domain.services.aggregators.aggregator import (
+    TrackingDatasetAggregator,
+)
+from kloppy.domain.services.kinematics import (
+    SAVITZKY_GOLAY,
+    player_kinematics,
+)
+from kloppy.exceptions import KloppyParameterError
+
+# The lower bound (in m/s) of every speed zone
+DEFAULT_SPEED_ZONES = {
+    "walking": 0.0,
+    "jogging": 2.0,
+    "running": 4.0,
+    "high_speed_running": 5.5,
+    "sprinting": 7.0,
+}
+
+
+class PhysicalPerformance(NamedTuple):
+    """
+    The physical performance of a player.
+
+    Attributes:
+        player: See [`Player`][kloppy.domain.models.common.Player]
+        period: the period, or `None` for the whole match
+        time_played: the time the player was tracked on the pitch
+        total_distance: distance covered, in meters
+        high_speed_distance: distance covered above the high speed
+            threshold, in meters
+        sprint_count: the number of sprints
+        time_in_speed_zones: the time spent in every speed zone
+    """
+
+    player: Player
+    period: Optional[Period]
+    time_played: timedelta
+    total_distance: float
+    high_speed_distance: float
+    sprint_count: int
+    time_in_speed_zones: Dict[str, timedelta]
+
+
+class PhysicalAggregator(TrackingDatasetAggregator):
+    """
+    Aggregate the physical performance of all players.
+
+    The speed of the players is derived from their coordinates (see
+    [compute_kinematics][kloppy.domain.services.kinematics.compute_kinematics]),
+    and aggregated with array operations per player.
+
+    Arguments:
+        per_period: aggregate per period instead of for the whole match
+        high_speed_threshold: the minimum speed (in m/s) for high speed
+            distance
+        sprint_threshold: the minimum speed (in m/s) of a sprint
+        min_sprint_duration: the minimum duration (in seconds) of a sprint
+        speed_zones: the names and lower bounds (in m/s) of the speed zones
+        smoothing: `savitzky_golay`, `moving_average` or `None`
+        max_speed: velocities above this speed (in m/s) are considered
+            tracking errors
+
+    Examples:
+        >>> for item in dataset.aggregate("physical", per_period=False):
+        ...     print(item.player, item.total_distance, item.sprint_count)
+    """
+
+    def __init__(
+        self,
+        per_period: bool = True,
+        high_speed_threshold: float = 5.5,
+        sprint_threshold: float = 7.0,
+        min_sprint_duration: float = 1.0,
+        speed_zones: Optional[Dict[str, float]] = None,
+        smoothing: Optional[str] = SAVITZKY_GOLAY,
+        max_speed: Optional[float] = 12.0,
+    ):
+        speed_zones = dict(speed_zones or DEFAULT_SPEED_ZONES)
+        lower_bounds = list(speed_zones.values())
+        if not lower_bounds or lower_bounds != sorted(lower_bounds):
+            raise KloppyParameterError(
+                "The speed zones must be ordered by their lower bound"
+            )
+
+        self.per_period = per_period
+        self.high_speed_threshold = high_speed_threshold
+        self.sprint_threshold = sprint_threshold
+        self.min_sprint_duration = min_sprint_duration
+        self.speed_zones = speed_zones
+        self.smoothing = smoothing
+        self.max_speed = max_speed
+
+    def aggregate(self, dataset: TrackingDataset) -> List[PhysicalPerformance]:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "Seems like you don't have numpy installed. Please"
+                " install it using: pip install numpy"
+            )
+
+        periods = {period.id: period for period in dataset.metadata.periods}
+        zone_names = list(self.speed_zones.keys())
+        zone_bounds = np.array(list(self.speed_zones.values()))
+
+        items = []
+        for kinematics in player_kinematics(
+            dataset, smoothing=self.smoothing, max_speed=self.max_speed
+        ):
+            if self.per_period:
+                group_ids, groups = np.unique(
+                    kinematics.period_ids, return_inverse=True
+                )
+                group_periods = [periods.get(int(id_)) for id_ in group_ids]
+            else:
+                groups = np.zeros(len(kinematics.speed), dtype=int)
+                group_periods = [None]
+            group_count = len(group_periods)
+
+            speed = kinematics.speed
+            step_duration = kinematics.step_duration
+            step_distance = kinematics.step_distance
+
+            time_played = np.bincount(
+                groups, weights=step_duration, minlength=group_count
+            )
+            total_distance = np.bincount(
+                groups, weights=step_distance, minlength=group_count
+            )
+            high_speed_distance = np.bincount(
+                groups,
+                weights=step_distance * (speed >= self.high_speed_threshold),
+                minlength=group_count,
+            )
+
+            zones = np.clip(
+                np.searchsorted(zone_bounds, speed, side="right") - 1,
+                0,
+                None,
+            )
+            time_in_zones = np.bincount(
+                groups * len(zone_names) + zones,
+                weights=step_duration,
+                minlength=group_count * len(zone_names),
+            ).reshape(group_count, len(zone_names))
+
+            # A sprint is a run of frames within a track above the sprint
+            # threshold, that lasts long enough.
+            track_starts = kinematics.track_starts
+            above = speed >= self.sprint_threshold
+            prev_above = np.concatenate(([False], above[:-1])) & ~track_starts
+            next_above = np.concatenate(
+                (above[1:] & ~track_starts[1:], [False])
+            )
+            sprint_starts = np.flatnonzero(above & ~prev_above)
+            sprint_ends = np.flatnonzero(above & ~next_above)
+            elapsed = np.cumsum(step_duration)
+            sprint_durations = elapsed[sprint_ends] - elapsed[sprint_starts]
+            sprint_count = np.bincount(
+                groups[
+                    sprint_starts[sprint_durations >= self.min_sprint_duration]
+                ],
+                minlength=group_count,
+            )
+
+            for group, period in enumerate(group_periods):
+                items.append(
+                    PhysicalPerformance(
+                        player=kinematics.player,
+                        period=period,
+                        time_played=timedelta(
+                            seconds=float(time_played[group])
+                        ),
+                        total_distance=float(total_distance[group]),
+                        high_speed_distance=float(high_speed_distance[group]),
+                        sprint_count=int(sprint_count[group]),
+                        time_in_speed_zones={
+                            name: timedelta(
+                                seconds=float(time_in_zones[group, idx])
+                            )
+                            for idx, name in enumerate(zone_names)
+                        },
+                    )
+                )
+
+        return items
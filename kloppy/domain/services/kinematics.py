@@ -0,0 +1,419 @@
+"""
+Derive the speed, acceleration and distance covered of every player from
+the coordinates in a tracking dataset.
+
+The frames are split into tracks per player: runs of consecutive frames of
+the same period in which the player is on the pitch and no frames are
+missing. Substitutions, sent off players and frames that were left out
+(for example with `only_alive=True`) therefore start a new track. Every
+track is converted to arrays and processed with array operations:
+
+1. the coordinates are converted to meters
+2. the velocity is computed with central differences
+3. velocities above `max_speed` are considered tracking errors and are
+   replaced by interpolating the surrounding velocities
+4. the velocity is smoothed with a Savitzky-Golay or a moving average
+   filter
+5. the acceleration is the derivative of the (smoothed) speed, and the
+   distance is the cumulative integral of the speed
+
+The distance covered keeps adding up over all tracks of a player.
+"""
+import warnings
+from dataclasses import dataclass, replace
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+)
+
+from kloppy.domain import (
+    DEFAULT_PITCH_LENGTH,
+    DEFAULT_PITCH_WIDTH,
+    Player,
+    PlayerData,
+    TrackingDataset,
+    Unit,
+)
+from kloppy.exceptions import KloppyParameterError
+
+if TYPE_CHECKING:
+    import numpy as np
+
+SAVITZKY_GOLAY = "savitzky_golay"
+MOVING_AVERAGE = "moving_average"
+
+# The name of the acceleration in `PlayerData.other_data`
+ACCELERATION = "acceleration"
+
+
+def _import_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have numpy installed. Please"
+            " install it using: pip install numpy"
+        )
+    return np
+
+
+def _scale_to_meters(dataset: TrackingDataset) -> Tuple[float, float]:
+    pitch_dimensions = dataset.metadata.pitch_dimensions
+    if pitch_dimensions.unit == Unit.NORMED or pitch_dimensions.standardized:
+        if (
+            pitch_dimensions.pitch_length is None
+            or pitch_dimensions.pitch_width is None
+        ):
+            warnings.warn(
+                "The pitch length and width are not specified. "
+                "Assuming a standard pitch size of 105x68 meters. "
+                "This may lead to incorrect results.",
+                stacklevel=3,
+            )
+            pitch_length = DEFAULT_PITCH_LENGTH
+            pitch_width = DEFAULT_PITCH_WIDTH
+        else:
+            pitch_length = pitch_dimensions.pitch_length
+            pitch_width = pitch_dimensions.pitch_width
+        return (
+            pitch_length
+            / (pitch_dimensions.x_dim.max - pitch_dimensions.x_dim.min),
+            pitch_width
+            / (pitch_dimensions.y_dim.max - pitch_dimensions.y_dim.min),
+        )
+
+    scale = pitch_dimensions.unit.convert(Unit.METERS, 1)
+    return scale, scale
+
+
+def _filter_coefficients(
+    np, smoothing: str, window_length: int, polyorder: int
+):
+    if smoothing == MOVING_AVERAGE:
+        return np.full(window_length, 1 / window_length)
+
+    # Savitzky-Golay: the value of the least-squares polynomial fit at the
+    # center of the window is a linear combination of the window values.
+    half_window = window_length // 2
+    offsets = np.arange(-half_window, half_window + 1, dtype=float)
+    vandermonde = offsets[:, None] ** np.arange(polyorder + 1)
+    return np.linalg.pinv(vandermonde)[0]
+
+
+def _smooth(
+    np, values, smoothing: Optional[str], window_length: int, polyorder: int
+):
+    if smoothing is None:
+        return values
+
+    # Use a shorter window for short tracks
+    window_length = min(window_length, len(values) - (len(values) + 1) % 2)
+    if window_length < 3 or (
+        smoothing == SAVITZKY_GOLAY and window_length <= polyorder
+    ):
+        return values
+
+    coefficients = _filter_coefficients(
+        np, smoothing, window_length, polyorder
+    )
+    half_window = window_length // 2
+    padded = np.pad(values, half_window, mode="edge")
+    return np.convolve(padded, coefficients[::-1], mode="valid")
+
+
+def _interpolate_invalid(np, values, invalid):
+    if not invalid.any():
+        return values
+    if invalid.all():
+        return np.zeros_like(values)
+    positions = np.arange(len(values))
+    values = values.copy()
+    values[invalid] = np.interp(
+        positions[invalid], positions[~invalid], values[~invalid]
+    )
+    return values
+
+
+def _split_tracks(
+    np, frame_indices, timestamps, period_ids, max_gap: float
+) -> List[Tuple[int, int]]:
+    """Split the frames of a player into runs of contiguous frames. Returns
+    (start, end) positions."""
+    if not len(frame_indices):
+        return []
+    breaks = (
+        (np.diff(frame_indices) != 1)
+        | (np.diff(period_ids) != 0)
+        | (np.diff(timestamps) > max_gap)
+        | (np.diff(timestamps) <= 0)
+    )
+    boundaries = np.flatnonzero(breaks) + 1
+    starts = np.concatenate(([0], boundaries))
+    ends = np.concatenate((boundaries, [len(frame_indices)]))
+    return list(zip(starts.tolist(), ends.tolist()))
+
+
+@dataclass
+class PlayerKinematics:
+    """
+    The kinematics of a player, as arrays with one value for every frame in
+    which the player is on the pitch.
+
+    Attributes:
+        player: See [`Player`][kloppy.domain.models.common.Player]
+        player_data: the `PlayerData` of the player in those frames
+        frame_indices: the positions of the frames in the dataset
+        period_ids: the id of the period of the frames
+        track_starts: whether a frame starts a new track
+        speed: speed in m/s
+        acceleration: acceleration in m/s²
+        step_duration: seconds since the previous frame of the track
+        step_distance: meters covered since the previous frame of the track
+    """
+
+    player: Player
+    player_data: List[PlayerData]
+    frame_indices: "np.ndarray"
+    period_ids: "np.ndarray"
+    track_starts: "np.ndarray"
+    speed: "np.ndarray"
+    acceleration: "np.ndarray"
+    step_duration: "np.ndarray"
+    step_distance: "np.ndarray"
+
+
+def _validate_parameters(
+    smoothing: Optional[str], window_length: int, polyorder: int
+):
+    if smoothing not in (SAVITZKY_GOLAY, MOVING_AVERAGE, None):
+        raise KloppyParameterError(
+            f"Unknown smoothing {smoothing}. Possible options: "
+            f"{SAVITZKY_GOLAY}, {MOVING_AVERAGE} or None"
+        )
+    if smoothing is not None and (window_length < 3 or window_length % 2 == 0):
+        raise KloppyParameterError(
+            "The window length must be an odd number of at least 3 frames"
+        )
+    if smoothing == SAVITZKY_GOLAY and polyorder >= window_length:
+        raise KloppyParameterError(
+            "The polyorder must be less than the window length"
+        )
+
+
+def player_kinematics(
+    dataset: TrackingDataset,
+    smoothing: Optional[
+        Literal["savitzky_golay", "moving_average"]
+    ] = SAVITZKY_GOLAY,
+    max_speed: Optional[float] = 12.0,
+    window_length: int = 7,
+    polyorder: int = 2,
+) -> Iterator[PlayerKinematics]:
+    """
+    Compute the kinematics of all players, without writing them to the
+    frames. See [compute_kinematics][kloppy.domain.services.kinematics.compute_kinematics]
+    for the arguments.
+    """
+    _validate_parameters(smoothing, window_length, polyorder)
+
+    np = _import_numpy()
+
+    frames = dataset.frames
+    if not frames:
+        return
+
+    timestamps = np.array(
+        [frame.timestamp.total_seconds() for frame in frames]
+    )
+    period_ids = np.array([frame.period.id for frame in frames])
+
+    # The frame rate in the metadata does not account for sampling, so the
+    # interval between frames is derived from the timestamps.
+    intervals = np.diff(timestamps)
+    intervals = intervals[intervals > 0]
+    if len(intervals):
+        frame_interval = float(np.median(intervals))
+    elif dataset.metadata.frame_rate:
+        frame_interval = 1 / dataset.metadata.frame_rate
+    else:
+        frame_interval = 0
+    # Allow some jitter, but not a missing frame
+    max_gap = 1.5 * frame_interval
+
+    # Collect the frames and coordinates of every player in a single pass.
+    # The players are looked up by identity, because `Player.__hash__` is
+    # relatively slow. The values are appended to flat lists instead of
+    # tuples, so no objects are allocated that the garbage collector keeps
+    # scanning.
+    players: Dict[int, Player] = {}
+    player_columns: Dict[
+        int, Tuple[List[int], List[float], List[float], List[PlayerData]]
+    ] = {}
+    for idx, frame in enumerate(frames):
+        for player, data in frame.players_data.items():
+            coordinates = data.coordinates
+            if coordinates is None:
+                continue
+            columns = player_columns.get(id(player))
+            if columns is None:
+                players[id(player)] = player
+                columns = player_columns[id(player)] = ([], [], [], [])
+            columns[0].append(idx)
+            columns[1].append(coordinates.x)
+            columns[2].append(coordinates.y)
+            columns[3].append(data)
+
+    scale = np.array(_scale_to_meters(dataset))
+
+    for key, (indices, xs, ys, player_data) in player_columns.items():
+        frame_indices = np.array(indices)
+        coordinates = (
+            np.column_stack(
+                (np.array(xs, dtype=float), np.array(ys, dtype=float))
+            )
+            * scale
+        )
+        player_timestamps = timestamps[frame_indices]
+        player_period_ids = period_ids[frame_indices]
+
+        speed = np.zeros(len(frame_indices))
+        acceleration = np.zeros(len(frame_indices))
+        step_duration = np.zeros(len(frame_indices))
+        step_distance = np.zeros(len(frame_indices))
+        track_starts = np.zeros(len(frame_indices), dtype=bool)
+
+        for start, end in _split_tracks(
+            np,
+            frame_indices,
+            player_timestamps,
+            player_period_ids,
+            max_gap,
+        ):
+            track_starts[start] = True
+            if end - start < 2:
+                continue
+
+            t = player_timestamps[start:end]
+            position = coordinates[start:end]
+            velocity = np.gradient(position, t, axis=0)
+
+            if max_speed is not None:
+                invalid = np.hypot(velocity[:, 0], velocity[:, 1]) > max_speed
+                velocity = np.column_stack(
+                    [
+                        _interpolate_invalid(np, velocity[:, axis], invalid)
+                        for axis in range(2)
+                    ]
+                )
+
+            velocity = np.column_stack(
+                [
+                    _smooth(
+                        np,
+                        velocity[:, axis],
+                        smoothing,
+                        window_length,
+                        polyorder,
+                    )
+                    for axis in range(2)
+                ]
+            )
+            track_speed = np.hypot(velocity[:, 0], velocity[:, 1])
+
+            speed[start:end] = track_speed
+            acceleration[start:end] = np.gradient(track_speed, t)
+            step_duration[start + 1 : end] = np.diff(t)
+            # Trapezoidal integration of the speed
+            step_distance[start + 1 : end] = (
+                (track_speed[1:] + track_speed[:-1])
+                / 2
+                * step_duration[start + 1 : end]
+            )
+
+        yield PlayerKinematics(
+            player=players[key],
+            player_data=player_data,
+            frame_indices=frame_indices,
+            period_ids=player_period_ids,
+            track_starts=track_starts,
+            speed=speed,
+            acceleration=acceleration,
+            step_duration=step_duration,
+            step_distance=step_distance,
+        )
+
+
+def compute_kinematics(
+    dataset: TrackingDataset,
+    smoothing: Optional[
+        Literal["savitzky_golay", "moving_average"]
+    ] = SAVITZKY_GOLAY,
+    max_speed: Optional[float] = 12.0,
+    window_length: int = 7,
+    polyorder: int = 2,
+) -> TrackingDataset:
+    """
+    Compute the speed, acceleration and distance covered of all players.
+
+    Returns a new dataset in which `speed` (in m/s) and `distance`
+    (cumulative, in meters) of every
+    [`PlayerData`][kloppy.domain.models.tracking.PlayerData] are set, and
+    the acceleration (in m/s²) is added as `other_data["acceleration"]`.
+    Values that were provided by the data provider are replaced. The frames
+    of `dataset` are not modified, so datasets that share frames with it
+    (e.g. created by `filter`) are not affected.
+
+    Arguments:
+        - smoothing: `savitzky_golay`, `moving_average` or `None`
+        - max_speed: velocities above this speed (in m/s) are considered
+            tracking errors. `None` keeps all velocities.
+        - window_length: the number of frames of the smoothing window
+        - polyorder: the order of the Savitzky-Golay polynomial
+
+    Examples:
+        >>> dataset = dataset.compute_kinematics(smoothing='moving_average')
+        >>> df = dataset.to_df()  # columns `<player_id>_s`, `<player_id>_d`, `<player_id>_acceleration`
+
+    Returns:
+        [`TrackingDataset`][kloppy.domain.models.tracking.TrackingDataset]
+    """
+    # The frames and their player data can be shared with other datasets,
+    # so the results are written to copies.
+    players_data = [dict(frame.players_data) for frame in dataset.frames]
+    for kinematics in player_kinematics(
+        dataset,
+        smoothing=smoothing,
+        max_speed=max_speed,
+        window_length=window_length,
+        polyorder=polyorder,
+    ):
+        player = kinematics.player
+        for frame_index, data, speed, acceleration, distance in zip(
+            kinematics.frame_indices.tolist(),
+            kinematics.player_data,
+            kinematics.speed.tolist(),
+            kinematics.acceleration.tolist(),
+            kinematics.step_distance.cumsum().tolist(),
+        ):
+            players_data[frame_index][player] = replace(
+                data,
+                speed=speed,
+                distance=distance,
+                other_data={**data.other_data, ACCELERATION: acceleration},
+            )
+
+    return replace(
+        dataset,
+        records=[
+            replace(frame, players_data=frame_players_data)
+            for frame, frame_players_data in zip(dataset.frames, players_data)
+        ],
+    )
+
+
+__all__ = ["PlayerKinematics", "compute_kinematics", "player_kinematics"]
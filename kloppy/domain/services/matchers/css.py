@@ -1,36 +1,232 @@
-from typing import List
-from lxml import etree
+"""
+A selector engine for a subset of CSS, evaluated over the events of a
+dataset.
 
-from cssselect import GenericTranslator
+The events of a dataset are seen as a sequence in which every event is
+followed by the next one. Generic events (unrecognised event types) are
+left out of that sequence: they are only selected by a `generic` type
+selector on its own, and combinators skip over them. The supported syntax
+is:
 
-from kloppy.domain import Event, EventType
+- type selectors: the event type (`pass`, `shot`, `ball_out`, ...) or `*`
+- class selectors: the result (`.complete`, `.goal`, `.off_target`, ...)
+  and the ground of the team (`.home`, `.away`)
+- combinators: `a > b` and `a + b` select a `b` directly after an `a`,
+  `a b` and `a ~ b` select a `b` anywhere after an `a`
+- selector lists: `a, b`
+
+Selectors are case-insensitive. The events are indexed as bitsets (one
+Python integer per event type, result and team, with a bit per event), so a
+selector is evaluated with a few integer operations per compound selector.
+"""
+import re
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from kloppy.domain import Event, EventDataset, EventType
+from kloppy.exceptions import InvalidFilterError
+
+_TOKEN_RE = re.compile(
+    r"\s*([>+~,])\s*|(\s+)|([A-Za-z_][A-Za-z0-9_-]*|\*)|\.([A-Za-z_][A-Za-z0-9_-]*)"
+)
+
+# Combinators
+NEXT = "next"
+LATER = "later"
+
+
+@dataclass(frozen=True)
+class CompoundSelector:
+    """A type selector (`None` for any type) with class selectors."""
+
+    event_type: Optional[EventType]
+    classes: Tuple[str, ...]
+
+
+# A chain of compound selectors. Every compound selector but the first is
+# preceded by its combinator.
+Chain = Tuple[Tuple[Optional[str], CompoundSelector], ...]
+
+
+@lru_cache(maxsize=256)
+def compile_selector(selector: str) -> Tuple[Chain, ...]:
+    """Parse a selector (list) into chains of compound selectors."""
+    chains = []
+    chain = []
+    combinator = None
+    event_type = None
+    classes = []
+    has_compound = False
+
+    def end_compound():
+        nonlocal event_type, classes, has_compound, combinator
+        if not has_compound:
+            raise InvalidFilterError(f"Invalid selector '{selector}'")
+        chain.append(
+            (combinator, CompoundSelector(event_type, tuple(classes)))
+        )
+        event_type, classes, has_compound, combinator = None, [], False, None
+
+    pos = 0
+    selector_ = selector.strip()
+    while pos < len(selector_):
+        match = _TOKEN_RE.match(selector_, pos)
+        if not match or match.end() == pos:
+            raise InvalidFilterError(
+                f"Unsupported selector '{selector}' at position {pos}"
+            )
+        pos = match.end()
+        symbol, whitespace, type_name, class_name = match.groups()
+
+        if symbol or whitespace:
+            end_compound()
+            if symbol == ",":
+                chains.append(tuple(chain))
+                chain = []
+            else:
+                combinator = NEXT if symbol in (">", "+") else LATER
+        elif type_name:
+            if has_compound:
+                raise InvalidFilterError(f"Invalid selector '{selector}'")
+            has_compound = True
+            if type_name != "*":
+                try:
+                    event_type = EventType[type_name.upper()]
+                except KeyError:
+                    raise InvalidFilterError(
+                        f"Cannot find event type {type_name}. Possible options: {[e.value.lower() for e in EventType]}"
+                    )
+        else:
+            has_compound = True
+            classes.append(class_name.lower())
+
+    end_compound()
+    chains.append(tuple(chain))
+    return tuple(chains)
+
+
+def _to_bitset(positions: List[int], size: int) -> int:
+    data = bytearray((size + 7) // 8)
+    for pos in positions:
+        data[pos >> 3] |= 1 << (pos & 7)
+    return int.from_bytes(data, "little")
+
+
+class EventIndex:
+    """
+    Bitsets of the events of a dataset by event type, result and team.
+
+    Bit `i` of a bitset is set when event `i` has the property.
+    """
+
+    def __init__(self, events: Sequence[Event]):
+        self.events = events
+        self.size = len(events)
+
+        positions_by_type: Dict[EventType, List[int]] = defaultdict(list)
+        positions_by_class: Dict[str, List[int]] = defaultdict(list)
+        for i, event in enumerate(events):
+            positions_by_type[event.event_type].append(i)
+            if event.result is not None:
+                positions_by_class[event.result.name.lower()].append(i)
+            if event.team is not None:
+                positions_by_class[event.team.ground.value].append(i)
+
+        self.by_type: Dict[EventType, int] = {
+            event_type: _to_bitset(positions, len(events))
+            for event_type, positions in positions_by_type.items()
+        }
+        self.by_class: Dict[str, int] = {
+            class_name: _to_bitset(positions, len(events))
+            for class_name, positions in positions_by_class.items()
+        }
+
+        # The events in the sequence that combinators run over
+        self.generic = self.by_type.get(EventType.GENERIC, 0)
+        self.all = ((1 << len(events)) - 1) & ~self.generic
+
+    @classmethod
+    def for_dataset(cls, dataset: EventDataset) -> "EventIndex":
+        """Get the index of a dataset. It is built once and kept on the
+        dataset until records are added or removed.
+
+        The index is not updated when records are replaced or their type,
+        result or team is changed in place. Call `invalidate` after such
+        edits.
+        """
+        index = dataset.__dict__.get("_event_index")
+        if (
+            index is None
+            or index.events is not dataset.records
+            or index.size != len(dataset.records)
+        ):
+            index = cls(dataset.records)
+            dataset.__dict__["_event_index"] = index
+        return index
+
+    @staticmethod
+    def invalidate(dataset: EventDataset):
+        """Drop the index of a dataset, so it is built again on the next
+        query."""
+        dataset.__dict__.pop("_event_index", None)
+
+    def _next(self, mask: int) -> int:
+        """The positions of the events that follow the events in `mask`,
+        skipping generic events."""
+        # A bit shifted into a run of generic events is carried to the
+        # first event after that run.
+        return ((mask << 1) + self.generic) & self.all
+
+    def _mask(self, compound: CompoundSelector) -> int:
+        mask = (
+            self.all
+            if compound.event_type is None
+            else self.by_type.get(compound.event_type, 0)
+        )
+        for class_name in compound.classes:
+            mask &= self.by_class.get(class_name, 0)
+        return mask
+
+    def select(self, chains: Sequence[Chain]) -> List[Event]:
+        """The events selected by the last compound selector of any of the
+        chains, in dataset order."""
+        selected = 0
+        for chain in chains:
+            mask = 0
+            for combinator, compound in chain:
+                compound_mask = self._mask(compound)
+                if len(chain) > 1:
+                    compound_mask &= self.all
+                if combinator is None:
+                    mask = compound_mask
+                elif combinator == NEXT:
+                    mask = self._next(mask) & compound_mask
+                elif mask:
+                    # Every position after the first selected event
+                    first = mask & -mask
+                    mask = compound_mask & ~((first << 1) - 1)
+                if not mask:
+                    break
+            selected |= mask
+
+        bits = bin(selected)[:1:-1]
+        return [self.events[i] for i, bit in enumerate(bits) if bit == "1"]
 
 
 class CSSPatternMatcher:
     def __init__(self, pattern: str):
-        self.expression = GenericTranslator().css_to_xpath([pattern])
+        self.chains = compile_selector(pattern.lower())
 
-    def match(self, events: List[Event]) -> List[List[Event]]:
-        elm = etree.Element("start")
-        root = elm
-        for i, event in enumerate(events):
-            if event.event_type != EventType.GENERIC:
-                elm = etree.SubElement(
-                    elm,
-                    event.event_name.lower()
-                    .replace(" ", "_")
-                    .replace("*", ""),
-                    index=i,
-                    result=str(event.result).lower(),
-                    team=str(event.team.ground).lower(),
-                    attrib={
-                        "class": str(event.result).lower()
-                        + " "
-                        + str(event.team.ground).lower()
-                    },
-                )
-
-        matching_events = []
-        for elm in root.xpath(self.expression):
-            matching_events.append(events[elm.attrib["index"]])
-        return matching_events
+    def match(
+        self, events: Union[EventDataset, Sequence[Event]]
+    ) -> List[Event]:
+        if isinstance(events, EventDataset):
+            index = EventIndex.for_dataset(events)
+        else:
+            index = EventIndex(events)
+        return index.select(self.chains)
+
+
+__all__ = ["CSSPatternMatcher", "EventIndex", "compile_selector"]
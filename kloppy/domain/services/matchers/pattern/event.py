@@ -1,7 +1,20 @@
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import partial
-from typing import Callable, Dict, Iterator, List, Tuple
+from operator import attrgetter
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from kloppy.domain import (
     CarryEvent,
@@ -13,11 +26,11 @@ from kloppy.domain import (
 )
 
 from .regexp import (
+    CompiledRegExp,
     Final,
     Matcher,
     Node,
     Out,
-    RegExp,
     Tok,
     _make_match,
     _TrailItem,
@@ -25,46 +38,96 @@ from .regexp import (
 from .regexp.regexp import _Match
 
 
+def _add_captures(captures: Dict[str, List[Tok]], match: _Match):
+    for name, capture in match.children.items():
+        captures[name] = capture[0].trail
+        _add_captures(captures, capture[0])
+
+
+def _get_captures(trail: Tuple[_TrailItem[Out], ...]) -> Dict[str, List[Tok]]:
+    captures = {}
+    _add_captures(captures, _make_match(trail))
+    return captures
+
+
 class WithCaptureMatcher(Matcher):
     def __init__(self, matcher: Callable[[Tok, Dict[str, List[Tok]]], bool]):
         self.matcher = matcher
 
-    def _add_captures(self, captures: Dict[str, List[Tok]], match: _Match):
-        for name, capture in match.children.items():
-            captures[name] = capture[0].trail
-            self._add_captures(captures, capture[0])
-
     def match(
         self, token: Tok, trail: Tuple[_TrailItem[Out], ...]
     ) -> Iterator[Out]:
-        match = _make_match(trail)
-        captures = {}
-        self._add_captures(captures, match)
-        if self.matcher(token, captures):
+        if self.matcher(token, _get_captures(trail)):
             yield token
 
 
-def match_generic(event_cls, capture=None, **kwargs):
-    def _matcher_fn(event: Event, captures: Dict[str, List[Event]]) -> bool:
-        if not isinstance(event, event_cls):
-            return False
+def _is_success(event: Event) -> bool:
+    return bool(event.result and event.result.is_success)
+
+
+class EventMatcher(Matcher):
+    """
+    Matches events of type `event_cls` of which the attributes satisfy the
+    checks given as keyword arguments (see `match_generic`).
+
+    The checks are compiled once and run cheapest first: the event type,
+    then the attributes that are compared with a fixed value and finally the
+    attributes that are compared with captured events. The captures are
+    only resolved from the trail when all other checks pass. The event type
+    is also exposed as `types`, so the search engine can skip events of
+    other types without calling the matcher.
+
+    The checks are stored as data instead of closures, so a compiled
+    pattern can be pickled and sent to worker processes.
+    """
 
-        # TODO: v[0] points to first record
-        captures = {k: v[0] for k, v in captures.items()}
+    def __init__(self, event_cls: Type[Event], **kwargs):
+        self.event_cls = event_cls
+        self.types = (event_cls,)
+
+        self.success = False
+        self.attribute_values: List[Tuple[Callable, Any]] = []
+        self.capture_checks: List[Tuple[str, Callable, Callable]] = []
         for attr_name, attr_value in kwargs.items():
             if callable(attr_value):
-                attr_real_value = getattr(event, attr_name)
-                result = attr_value(attr_name, attr_real_value, captures)
+                self.capture_checks.append(
+                    (attr_name, attrgetter(attr_name), attr_value)
+                )
+            elif attr_name == "success":
+                self.success = True
             else:
-                if attr_name == "success":
-                    result = event.result and event.result.is_success
-                else:
-                    result = getattr(event, attr_name) == attr_value
-            if not result:
-                return False
-        return True
+                self.attribute_values.append(
+                    (attrgetter(attr_name), attr_value)
+                )
+
+    def match(
+        self, token: Tok, trail: Tuple[_TrailItem[Out], ...]
+    ) -> Iterator[Out]:
+        if not isinstance(token, self.event_cls):
+            return
+
+        if self.success and not _is_success(token):
+            return
+
+        for get_attribute, value in self.attribute_values:
+            if not get_attribute(token) == value:
+                return
+
+        if self.capture_checks:
+            # TODO: v[0] points to first record
+            captures = {k: v[0] for k, v in _get_captures(trail).items()}
+            for attr_name, get_attribute, check in self.capture_checks:
+                if not check(attr_name, get_attribute(token), captures):
+                    return
 
-    _matcher = Final(WithCaptureMatcher(matcher=_matcher_fn))
+        yield token
+
+    def __repr__(self):
+        return f"EventMatcher({self.event_cls.__name__})"
+
+
+def match_generic(event_cls, capture=None, **kwargs):
+    _matcher = Final(EventMatcher(event_cls, **kwargs))
 
     if capture:
         return _matcher[capture]
@@ -79,22 +142,28 @@ match_take_on = partial(match_generic, TakeOnEvent)
 match_any = partial(match_generic, Event)
 
 
-def same_as(capture: str):
-    capture_name, attribute_name = capture.split(".")
+class _CaptureComparison:
+    """Compares an attribute with the attribute of a captured event."""
 
-    def fn(attr_name, value, captures):
-        return value == getattr(captures[capture_name], attribute_name)
+    def __init__(self, capture: str, equal: bool):
+        self.capture_name, self.attribute_name = capture.split(".")
+        self.equal = equal
 
-    return fn
+    def __call__(self, attr_name, value, captures):
+        captured_value = getattr(
+            captures[self.capture_name], self.attribute_name
+        )
+        if self.equal:
+            return value == captured_value
+        return value != captured_value
 
 
-def not_same_as(capture: str):
-    capture_name, capture_attribute_name = capture.split(".")
+def same_as(capture: str):
+    return _CaptureComparison(capture, equal=True)
 
-    def fn(attr_name, value, captures):
-        return value != getattr(captures[capture_name], capture_attribute_name)
 
-    return fn
+def not_same_as(capture: str):
+    return _CaptureComparison(capture, equal=False)
 
 
 def group(node, capture=None):
@@ -103,16 +172,24 @@ def group(node, capture=None):
     return node
 
 
-def function(fn):
-    def wrapper(attr_name, value, captures):
+class _Function:
+    """Calls `fn` with the attribute and the same attribute of all
+    captured events."""
+
+    def __init__(self, fn: Callable[..., bool]):
+        self.fn = fn
+
+    def __call__(self, attr_name, value, captures):
         capture_values = {
             f"{capture_name}_{attr_name}": getattr(capture_value, attr_name)
             for capture_name, capture_value in captures.items()
             if capture_value
         }
-        return fn(value, **capture_values)
+        return self.fn(value, **capture_values)
+
 
-    return wrapper
+def function(fn):
+    return _Function(fn)
 
 
 @dataclass
@@ -121,44 +198,122 @@ class Match:
     captures: Dict[str, List[Event]]
 
 
-def search(dataset: EventDataset, pattern: Node[Tok, Out]):
-    events = dataset.events
-    re = RegExp.from_ast(pattern)
-
-    results = []
-    events_per_period = defaultdict(list)
-    for event in events:
-        events_per_period[event.period.id].append(event)
+def search(
+    dataset: Union[EventDataset, Iterable[EventDataset]],
+    pattern: Node[Tok, Out],
+    workers: Optional[int] = None,
+) -> List[Match]:
+    """
+    Search a pattern in the events of one or more datasets.
+
+    Every period of every dataset is searched separately, as patterns never
+    match over periods. With `workers`, the periods are distributed over a
+    pool of that many processes. The compiled pattern is pickled once per
+    worker, so the functions used in the pattern (e.g. by `function`) must
+    be picklable on platforms that do not fork. Within a worker the events
+    are linked to the other events of their period, but not to a dataset.
+
+    The matches are ordered by dataset, period and first event, however
+    many workers are used. They always refer to the events of the given
+    datasets.
+
+    Examples:
+        >>> matches = search(
+        ...     [statsbomb.load_open_data(match_id) for match_id in match_ids],
+        ...     pm.match_pass(capture="pass") + pm.match_shot(team=pm.same_as("pass.team")),
+        ...     workers=4,
+        ... )
+    """
+    datasets = (
+        [dataset] if isinstance(dataset, EventDataset) else list(dataset)
+    )
+    re = CompiledRegExp.from_ast(pattern)
+
+    shards = []
+    for dataset_ in datasets:
+        events_per_period = defaultdict(list)
+        for event in dataset_.events:
+            events_per_period[event.period.id].append(event)
 
-    for period, events_ in sorted(events_per_period.items()):
         # Search per period. Patterns should never match over periods
-        results.extend(_search(events_, re))
-    return results
-
+        shards.extend(
+            events_ for _, events_ in sorted(events_per_period.items())
+        )
 
-def _search(events: List[Event], re: RegExp[Tok, Out]):
-    i = 0
     results = []
-    for i in range(len(events)):
-        matches = re.match(events[i:], consume_all=False)
-        if matches:
-            results.append(
-                Match(
-                    events=matches[0].trail,
-                    # TODO: check trail[0] because this points to the first event in the capture and not
-                    #       all of them
-                    captures={
-                        capture_name: capture_value[0].trail[0]
-                        for capture_name, capture_value in matches[
-                            0
-                        ].children.items()
-                    },
+    if workers is None or workers <= 1 or len(shards) <= 1:
+        for events_ in shards:
+            results.extend(_search(events_, re))
+        return results
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(re,)
+    ) as executor:
+        for events_, shard_matches in zip(
+            shards, executor.map(_search_shard, shards)
+        ):
+            for trail, captures in shard_matches:
+                results.append(
+                    Match(
+                        events=tuple(events_[idx] for idx in trail),
+                        captures={
+                            capture_name: events_[idx]
+                            for capture_name, idx in captures.items()
+                        },
+                    )
                 )
-            )
-
     return results
 
 
+def _search(events: List[Event], re: CompiledRegExp[Tok, Out]):
+    return [
+        Match(
+            events=match.trail,
+            # TODO: check trail[0] because this points to the first event in the capture and not
+            #       all of them
+            captures={
+                capture_name: capture_value[0].trail[0]
+                for capture_name, capture_value in match.children.items()
+            },
+        )
+        for _, match in re.search(events)
+    ]
+
+
+_worker_re: Optional[CompiledRegExp] = None
+
+
+def _init_worker(re: CompiledRegExp):
+    global _worker_re
+    _worker_re = re
+
+
+def _search_shard(
+    events: List[Event],
+) -> List[Tuple[List[int], Dict[str, int]]]:
+    """Search the events of one period in a worker process. The matches are
+    returned as positions, so they can be mapped back to the events of the
+    parent process."""
+    for i, event in enumerate(events):
+        event.set_refs(
+            dataset=None,
+            prev=events[i - 1] if i > 0 else None,
+            next_=events[i + 1] if i + 1 < len(events) else None,
+        )
+
+    positions = {id(event): idx for idx, event in enumerate(events)}
+    return [
+        (
+            [positions[id(event)] for event in match.events],
+            {
+                capture_name: positions[id(event)]
+                for capture_name, event in match.captures.items()
+            },
+        )
+        for match in _search(events, _worker_re)
+    ]
+
+
 @dataclass
 class Query:
     event_types: List[str]
@@ -1,3 +1,4 @@
 from .ast import *
 from .matchers import *
 from .regexp import *
+from .compiled import *
@@ -0,0 +1,237 @@
+from bisect import bisect_left
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+import networkx as nx
+
+# noinspection PyProtectedMember
+from .ast import Final, Node, _Initial, _Terminal
+from .matchers import Matcher, Out, Tok, _TrailItem
+from .regexp import Match, _make_match, ast_to_graph
+
+_Trail = Tuple[_TrailItem, ...]
+
+
+@dataclass(frozen=True)
+class Transition(Generic[Tok, Out]):
+    """
+    An edge of the compiled graph.
+
+    `data` holds the capture flags of the edge, `data_key` is a hashable
+    version of it that is used to de-duplicate trails. `types` are the
+    token types the matcher can accept (see `Matcher.types`).
+    """
+
+    target: int
+    matcher: Matcher[Tok, Out]
+    data: Dict[str, Sequence[Any]]
+    data_key: Tuple
+    types: Optional[Tuple[type, ...]]
+
+    def accepted_types(
+        self, types: Iterable[type]
+    ) -> Optional[FrozenSet[type]]:
+        """The subset of `types` this transition can accept, or `None` when
+        it accepts any token."""
+        if self.types is None:
+            return None
+        return frozenset(
+            type_ for type_ in types if issubclass(type_, self.types)
+        )
+
+
+class CompiledRegExp(Generic[Tok, Out]):
+    """
+    A regular expression compiled into dense transition tables, which can
+    search a sequence in a single left-to-right scan.
+
+    The graph built by `ast_to_graph` is converted once: every `Final` node
+    becomes a state (state 0 is the initial state) with a tuple of outgoing
+    transitions, and a flag that indicates whether the state can terminate a
+    match.
+
+    `search` runs a Thompson-style simulation: all start positions are
+    tracked together in one list of threads, and a new thread is started at
+    every token that can be the first token of a match. Threads that reach
+    the same state with the same trail are merged. Threads with different
+    trails are kept apart, because the matchers can depend on the captures
+    made so far.
+
+    When matchers declare the token types they accept, the sequence is
+    indexed by token type first. Matchers are only called for tokens of an
+    accepted type, and when no thread is active the scan jumps to the next
+    token that can start a match.
+
+    >>> re = CompiledRegExp.from_ast(Final(Eq('a')) + Final(Eq('b')) * slice(1, None))
+    >>> [(start, "".join(m.trail)) for start, m in re.search("abbcab")]
+    [(0, 'abb'), (4, 'ab')]
+    """
+
+    INITIAL_STATE = 0
+
+    def __init__(self, graph: nx.DiGraph):
+        initial = _Initial()
+        terminal = _Terminal()
+
+        nodes = [initial] + [node for node in graph if isinstance(node, Final)]
+        states = {node: idx for idx, node in enumerate(nodes)}
+
+        self.transitions: List[Tuple[Transition[Tok, Out], ...]] = []
+        self.terminal: List[bool] = []
+        for node in nodes:
+            transitions = []
+            for successor in graph.successors(node):
+                if not isinstance(successor, Final):
+                    continue
+                data = graph.get_edge_data(node, successor, default={})
+                transitions.append(
+                    Transition(
+                        target=states[successor],
+                        matcher=successor.statement,
+                        data=data,
+                        data_key=tuple(
+                            sorted((k, tuple(v)) for k, v in data.items())
+                        ),
+                        types=successor.statement.types,
+                    )
+                )
+            self.transitions.append(tuple(transitions))
+            self.terminal.append(graph.has_successor(node, terminal))
+
+    @classmethod
+    def from_ast(cls, root: Node[Tok, Out]) -> "CompiledRegExp[Tok, Out]":
+        return cls(graph=ast_to_graph(root.copy()))
+
+    def search(self, seq: Sequence[Tok]) -> List[Tuple[int, Match[Out]]]:
+        """
+        Find the matches that start at any position of `seq`.
+
+        For every start position this gives the same match as
+        `RegExp.match(seq[start:], consume_all=False)[0]`: the longest match
+        and, when several paths lead to it, the first one in trail order.
+        Matches can overlap.
+
+        Returns (start position, match) pairs, ordered by start position.
+        """
+        transitions = self.transitions
+        terminal = self.terminal
+
+        # Index the tokens by type, and determine for every transition which
+        # of those types it accepts.
+        token_types = [type(token) for token in seq]
+        positions_by_type: Dict[type, List[int]] = defaultdict(list)
+        for pos, token_type in enumerate(token_types):
+            positions_by_type[token_type].append(pos)
+        accepted = [
+            [
+                transition.accepted_types(positions_by_type.keys())
+                for transition in state_transitions
+            ]
+            for state_transitions in transitions
+        ]
+
+        initial_accepted = accepted[self.INITIAL_STATE]
+        if any(types is None for types in initial_accepted):
+            starts = list(range(len(seq)))
+        else:
+            starts = sorted(
+                pos
+                for token_type in set().union(*initial_accepted)
+                for pos in positions_by_type[token_type]
+            )
+        can_start = bytearray(len(seq))
+        for pos in starts:
+            can_start[pos] = 1
+
+        # (start, state, trail)
+        threads: List[Tuple[int, int, _Trail]] = []
+        # Trails of the terminating threads at the last step where a start
+        # position could terminate
+        terminating: Dict[int, List[_Trail]] = {}
+        results = []
+
+        pos = 0
+        while pos < len(seq):
+            if not threads:
+                # Skip the tokens that cannot start a match
+                idx = bisect_left(starts, pos)
+                if idx == len(starts):
+                    break
+                pos = starts[idx]
+
+            token = seq[pos]
+            token_type = token_types[pos]
+            if can_start[pos]:
+                threads.append((pos, self.INITIAL_STATE, ()))
+
+            next_threads = []
+            seen = set()
+            # Equal trails are interned, so trails can be compared by
+            # identity. The key refers to the parent trail and the item,
+            # which are kept alive by the new trail.
+            trails: Dict[Tuple[int, int, Tuple], _Trail] = {}
+            for start, state, trail in threads:
+                for transition, types in zip(
+                    transitions[state], accepted[state]
+                ):
+                    if types is not None and token_type not in types:
+                        continue
+                    possible_trail = trail + (
+                        _TrailItem(item=None, data=transition.data),
+                    )
+                    for item in transition.matcher.match(
+                        token, trail=possible_trail
+                    ):
+                        key = (id(trail), id(item), transition.data_key)
+                        new_trail = trails.get(key)
+                        if new_trail is None:
+                            new_trail = trails[key] = trail + (
+                                _TrailItem(item=item, data=transition.data),
+                            )
+                        signature = (transition.target, id(new_trail))
+                        if signature not in seen:
+                            seen.add(signature)
+                            next_threads.append(
+                                (start, transition.target, new_trail)
+                            )
+
+            alive = set()
+            step_terminating: Dict[int, List[_Trail]] = {}
+            for start, state, trail in next_threads:
+                alive.add(start)
+                if terminal[state]:
+                    step_terminating.setdefault(start, []).append(trail)
+            terminating.update(step_terminating)
+
+            for start in {start for start, _, _ in threads} - alive:
+                if start in terminating:
+                    results.append(
+                        (start, self._best_match(terminating.pop(start)))
+                    )
+            threads = next_threads
+            pos += 1
+
+        for start in sorted(terminating):
+            results.append((start, self._best_match(terminating[start])))
+
+        results.sort(key=lambda result: result[0])
+        return results
+
+    @staticmethod
+    def _best_match(trails: List[_Trail]) -> Match[Out]:
+        unique = list({id(trail): trail for trail in trails}.values())
+        return _make_match(min(unique)).as_match()
+
+
+__all__ = ["CompiledRegExp", "Transition"]
@@ -7,6 +7,7 @@ from typing import (
     Generic,
     Iterator,
     Mapping,
+    Optional,
     Sequence,
     Tuple,
     TypeVar,
@@ -57,6 +58,11 @@ class _TrailItem(Generic[Out]):
 
 
 class Matcher(Generic[Tok, Out], metaclass=ABCMeta):
+    # Tokens that are not an instance of one of these types never match. The
+    # search engine uses this to skip tokens without calling `match`. `None`
+    # means that any token can match.
+    types: Optional[Tuple[type, ...]] = None
+
     @abstractmethod
     def match(
         self, token: Tok, trail: Tuple[_TrailItem[Out], ...]
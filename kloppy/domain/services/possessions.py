@@ -0,0 +1,330 @@
+"""
+Split a dataset into possessions (or phases) of play.
+
+A phase is a run of consecutive records of the same period that have the
+same `ball_owning_team` and `ball_state`. The phases in which the ball is
+alive are the possessions. For every phase the table holds the record
+range, the team, the period, the start and end time and how the phase
+ended.
+
+Phases are found by comparing the key of every record with the key of the
+previous record, in a single pass over columns that are built up front. A
+phase lasts until the next phase starts, or until the end of the period,
+so the phases of a period do not overlap and leave no gaps. The
+`IntervalIndex` uses that to look up the phase at a given time with a
+binary search.
+"""
+import math
+from bisect import bisect_right
+from enum import Enum
+from itertools import compress
+from operator import ne
+from typing import (
+    Any,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from kloppy.domain import (
+    BallOutEvent,
+    BallState,
+    Dataset,
+    DataRecord,
+    FoulCommittedEvent,
+    Period,
+    ShotEvent,
+    ShotResult,
+    Team,
+    Time,
+)
+from kloppy.domain.models.common import dataframe_from_dict
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+class PossessionOutcome(Enum):
+    """
+    How a phase ended.
+
+    Attributes:
+        GOAL: the last event is a goal (or own goal)
+        SHOT: the last event is a shot that is not a goal
+        BALL_OUT: the last event is a ball out event
+        FOUL: the last event is a committed foul
+        TURNOVER: the other team gained possession
+        BALL_DEAD: the ball went out of play
+        END_OF_PERIOD: the period ended
+    """
+
+    GOAL = "GOAL"
+    SHOT = "SHOT"
+    BALL_OUT = "BALL_OUT"
+    FOUL = "FOUL"
+    TURNOVER = "TURNOVER"
+    BALL_DEAD = "BALL_DEAD"
+    END_OF_PERIOD = "END_OF_PERIOD"
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}.{self.name}>"
+
+
+class Possession(NamedTuple):
+    """
+    A phase of play.
+
+    Attributes:
+        start_idx: index of the first record of the phase
+        end_idx: index after the last record of the phase, so the records
+            are `dataset.records[start_idx:end_idx]`
+        team: the team in possession, if known
+        period: See [`Period`][kloppy.domain.models.time.Period]
+        start_time: time of the first record
+        end_time: start time of the next phase, or the end of the period
+        ball_state: See [`BallState`][kloppy.domain.models.common.BallState]
+        outcome: See [`PossessionOutcome`][kloppy.domain.services.possessions.PossessionOutcome].
+            `None` for phases in which the ball is dead.
+    """
+
+    start_idx: int
+    end_idx: int
+    team: Optional[Team]
+    period: Period
+    start_time: Time
+    end_time: Time
+    ball_state: Optional[BallState]
+    outcome: Optional[PossessionOutcome]
+
+
+class IntervalIndex(Generic[K, V]):
+    """
+    An index of half-open intervals `[start, end)`, to find the intervals
+    that contain a key.
+
+    The intervals are sorted by start, and for every position the largest
+    end so far is kept. A lookup does a binary search for the last interval
+    that starts at or before the key, and walks back only while an earlier
+    interval can still contain the key. For intervals that do not overlap
+    this is O(log n).
+    """
+
+    def __init__(self, intervals: Sequence[Tuple[K, K, V]]):
+        intervals = sorted(intervals, key=lambda interval: interval[0])
+        self.starts: List[K] = [start for start, _, _ in intervals]
+        self.ends: List[K] = [end for _, end, _ in intervals]
+        self.values: List[V] = [value for _, _, value in intervals]
+
+        self.max_ends: List[K] = []
+        for end in self.ends:
+            if self.max_ends and end < self.max_ends[-1]:
+                end = self.max_ends[-1]
+            self.max_ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def overlapping(self, key: K) -> List[V]:
+        """All values of the intervals that contain `key`, ordered by
+        start."""
+        values = []
+        idx = bisect_right(self.starts, key) - 1
+        while idx >= 0 and key < self.max_ends[idx]:
+            if key < self.ends[idx]:
+                values.append(self.values[idx])
+            idx -= 1
+        values.reverse()
+        return values
+
+    def at(self, key: K) -> Optional[V]:
+        """The value of the interval that contains `key` and starts last, or
+        `None` when no interval contains it."""
+        idx = bisect_right(self.starts, key) - 1
+        while idx >= 0 and key < self.max_ends[idx]:
+            if key < self.ends[idx]:
+                return self.values[idx]
+            idx -= 1
+        return None
+
+
+class PossessionTable:
+    """
+    The phases of a dataset, in dataset order.
+
+    Examples:
+        >>> possessions = dataset.possessions()
+        >>> possession = possessions.at(dataset.records[100].time)
+        >>> dataset.records[possession.start_idx:possession.end_idx]
+        >>> df = possessions.to_df()
+    """
+
+    def __init__(self, phases: List[Possession]):
+        self.phases = phases
+
+        intervals = []
+        for phase, next_phase in zip(phases, phases[1:] + [None]):
+            if next_phase is None or next_phase.period != phase.period:
+                # Records can be timed at (or just after) the end of the
+                # period, so the last phase covers the rest of the period.
+                end_key = (phase.period.id, math.inf)
+            else:
+                end_key = phase.end_time.sort_key
+            intervals.append((phase.start_time.sort_key, end_key, phase))
+        self.index: IntervalIndex[Tuple[int, int], Possession] = IntervalIndex(
+            intervals
+        )
+
+    def __len__(self) -> int:
+        return len(self.phases)
+
+    def __iter__(self) -> Iterator[Possession]:
+        return iter(self.phases)
+
+    def __getitem__(self, item):
+        return self.phases[item]
+
+    def possessions(self) -> List[Possession]:
+        """The phases in which the ball is alive and the team in possession
+        is known."""
+        return [
+            phase
+            for phase in self.phases
+            if phase.team is not None and phase.ball_state != BallState.DEAD
+        ]
+
+    def at(self, time: Time) -> Optional[Possession]:
+        """The phase that contains `time`, or `None` when there is none."""
+        return self.index.at(time.sort_key)
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        return {
+            name: [getattr(phase, name) for phase in self.phases]
+            for name in Possession._fields
+        }
+
+    def to_df(
+        self,
+        engine: Optional[
+            Union[
+                Literal["polars"],
+                Literal["pandas"],
+                Literal["pandas[pyarrow]"],
+            ]
+        ] = None,
+    ):
+        data = self.to_dict()
+        data["team"] = [
+            team.team_id if team else None for team in data["team"]
+        ]
+        data["period"] = [period.id for period in data["period"]]
+        data["start_time"] = [time.timestamp for time in data["start_time"]]
+        data["end_time"] = [time.timestamp for time in data["end_time"]]
+        data["ball_state"] = [
+            ball_state.value if ball_state else None
+            for ball_state in data["ball_state"]
+        ]
+        data["outcome"] = [
+            outcome.value if outcome else None for outcome in data["outcome"]
+        ]
+        return dataframe_from_dict(data, engine=engine)
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__} phase_count={len(self)}>"
+
+
+def _event_outcome(record: DataRecord) -> Optional[PossessionOutcome]:
+    if isinstance(record, ShotEvent):
+        if record.result in (ShotResult.GOAL, ShotResult.OWN_GOAL):
+            return PossessionOutcome.GOAL
+        return PossessionOutcome.SHOT
+    elif isinstance(record, BallOutEvent):
+        return PossessionOutcome.BALL_OUT
+    elif isinstance(record, FoulCommittedEvent):
+        return PossessionOutcome.FOUL
+    return None
+
+
+def segment_possessions(dataset: Dataset) -> PossessionTable:
+    """
+    Split the records of an event or tracking dataset into phases, based on
+    the `ball_owning_team` and `ball_state` of the records.
+
+    Returns:
+        [`PossessionTable`][kloppy.domain.services.possessions.PossessionTable]
+    """
+    records = dataset.records
+    if not records:
+        return PossessionTable([])
+
+    periods = [record.period for record in records]
+    teams = [record.ball_owning_team for record in records]
+    ball_states = [record.ball_state for record in records]
+    keys = list(
+        zip(
+            [period.id for period in periods],
+            [team.team_id if team else None for team in teams],
+            ball_states,
+        )
+    )
+
+    starts = [0] + list(
+        compress(range(1, len(keys)), map(ne, keys[1:], keys[:-1]))
+    )
+    ends = starts[1:] + [len(records)]
+
+    phases = []
+    for start_idx, end_idx in zip(starts, ends):
+        period = periods[start_idx]
+        next_start = end_idx if end_idx < len(records) else None
+        if next_start is not None and periods[next_start] != period:
+            next_start = None
+
+        if next_start is None:
+            end_time = Time.from_period(period, "end")
+        else:
+            end_time = records[next_start].time
+
+        ball_state = ball_states[start_idx]
+        if ball_state == BallState.DEAD:
+            outcome = None
+        else:
+            outcome = _event_outcome(records[end_idx - 1])
+            if outcome is None:
+                if next_start is None:
+                    outcome = PossessionOutcome.END_OF_PERIOD
+                elif ball_states[next_start] == BallState.DEAD:
+                    outcome = PossessionOutcome.BALL_DEAD
+                else:
+                    outcome = PossessionOutcome.TURNOVER
+
+        phases.append(
+            Possession(
+                start_idx=start_idx,
+                end_idx=end_idx,
+                team=teams[start_idx],
+                period=period,
+                start_time=records[start_idx].time,
+                end_time=end_time,
+                ball_state=ball_state,
+                outcome=outcome,
+            )
+        )
+
+    return PossessionTable(phases)
+
+
+__all__ = [
+    "IntervalIndex",
+    "Possession",
+    "PossessionOutcome",
+    "PossessionTable",
+    "segment_possessions",
+]
@@ -1,4 +1,3 @@
-from dataclasses import replace
 from typing import List
 
 from kloppy.domain import EventDataset
@@ -6,17 +5,32 @@ from kloppy.domain import EventDataset
 # register all of them
 from . import builders as _builders  # noqa: F401
 from .registered import create_state_builder
+from .table import StateTable
 
 
 def add_state(dataset: EventDataset, *builder_keys: List[str]) -> EventDataset:
     """
     Add state
 
+    All builders are run in a single pass over the events. The state is
+    stored as columns (one value per event and builder) in
+    `dataset.state_table`, and `event.state` reads it on access.
+
+    Note:
+        `dataset` is modified in place and returned; its events are not
+        copied. Calling `add_state` again adds columns to the same state
+        table, so `event.state` holds the state of all builders added so
+        far. Before, a new dataset was returned that only held the state
+        of the last call, and `dataset` was left untouched. Use
+        `copy.deepcopy(dataset)` first to keep the dataset without state.
+
     Arguments:
-        - builder_keys: `lineup` `score` `sequence`
+        - builder_keys: `lineup` `score` `sequence` `formation`
 
     Examples:
         >>> dataset = dataset.add_state('lineup', 'score')
+        >>> dataset.events[0].state['score']
+        Score(home=0, away=0)
 
     Returns:
         [`EventDataset`][kloppy.domain.models.event.EventDataset]
@@ -24,28 +38,33 @@ def add_state(dataset: EventDataset, *builder_keys: List[str]) -> EventDataset:
     if len(builder_keys) == 1 and isinstance(builder_keys[0], list):
         builder_keys = builder_keys[0]
 
-    builders = {
-        builder_key: create_state_builder(builder_key)
+    builders = [
+        (builder_key, create_state_builder(builder_key))
         for builder_key in builder_keys
-    }
+    ]
 
-    state = {
-        builder_key: builder.initial_state(dataset)
-        for builder_key, builder in builders.items()
-    }
+    events = dataset.events
+    reducers = [
+        (builder.reduce_before, builder.reduce_after)
+        for _, builder in builders
+    ]
+    states = [builder.initial_state(dataset) for _, builder in builders]
+    columns = [[] for _ in builders]
 
-    events = []
-    for event in dataset.events:
-        state = {
-            builder_key: builder.reduce_before(state[builder_key], event)
-            for builder_key, builder in builders.items()
-        }
+    for event in events:
+        for i, (reduce_before, reduce_after) in enumerate(reducers):
+            state = reduce_before(states[i], event)
+            columns[i].append(state)
+            states[i] = reduce_after(state, event)
 
-        events.append(replace(event, state=state))
+    state_table = getattr(dataset, "state_table", None)
+    if state_table is None or state_table.events is not events:
+        state_table = StateTable(events)
+        dataset.state_table = state_table
+    for (builder_key, _), values in zip(builders, columns):
+        state_table.add_column(builder_key, values)
 
-        state = {
-            builder_key: builder.reduce_after(state[builder_key], event)
-            for builder_key, builder in builders.items()
-        }
+    for idx, event in enumerate(events):
+        event.set_state_ref(state_table, idx)
 
-    return replace(dataset, records=events)
+    return dataset
@@ -1,4 +1,4 @@
-from dataclasses import replace, dataclass
+from dataclasses import dataclass
 from typing import Optional
 
 from kloppy.domain import (
@@ -36,7 +36,7 @@ class FormationStateBuilder(StateBuilder):
     def reduce_after(self, state: Formation, event: Event) -> Formation:
         if isinstance(event, FormationChangeEvent):
             if event.team.ground == Ground.HOME:
-                state = replace(state, home=event.formation_type)
+                state = Formation(home=event.formation_type, away=state.away)
             else:
-                state = replace(state, away=event.formation_type)
+                state = Formation(home=state.home, away=event.formation_type)
         return state
@@ -1,4 +1,4 @@
-from dataclasses import replace, dataclass
+from dataclasses import dataclass
 
 from kloppy.domain import ShotEvent, Event, Ground, ShotResult, EventDataset
 from ..builder import StateBuilder
@@ -24,12 +24,12 @@ class ScoreStateBuilder(StateBuilder):
         if isinstance(event, ShotEvent):
             if event.result == ShotResult.GOAL:
                 if event.team.ground == Ground.HOME:
-                    state = replace(state, home=state.home + 1)
+                    state = Score(home=state.home + 1, away=state.away)
                 else:
-                    state = replace(state, away=state.away + 1)
+                    state = Score(home=state.home, away=state.away + 1)
             elif event.result == ShotResult.OWN_GOAL:
                 if event.team.ground == Ground.HOME:
-                    state = replace(state, away=state.away + 1)
+                    state = Score(home=state.home, away=state.away + 1)
                 else:
-                    state = replace(state, home=state.home + 1)
+                    state = Score(home=state.home + 1, away=state.away)
         return state
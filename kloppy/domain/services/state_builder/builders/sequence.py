@@ -1,4 +1,4 @@
-from dataclasses import replace, dataclass
+from dataclasses import dataclass
 
 from kloppy.domain import (
     Event,
@@ -36,16 +36,14 @@ class SequenceStateBuilder(StateBuilder):
             state.team != event.team
             or event.get_qualifier_value(SetPieceQualifier)
         ):
-            state = replace(
-                state, sequence_id=state.sequence_id + 1, team=event.team
+            state = Sequence(
+                sequence_id=state.sequence_id + 1, team=event.team
             )
 
         return state
 
     def reduce_after(self, state: Sequence, event: Event) -> Sequence:
         if isinstance(event, CLOSE_SEQUENCE):
-            state = replace(
-                state, sequence_id=state.sequence_id + 1, team=None
-            )
+            state = Sequence(sequence_id=state.sequence_id + 1, team=None)
 
         return state
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Sequence
+
+from kloppy.domain import Event
+
+
+class StateTable:
+    """
+    The state of every event of a dataset, stored per state builder as a
+    column with one value per event.
+
+    Consecutive events with the same state share the same value object, so a
+    column mostly holds references.
+
+    Examples:
+        >>> dataset = dataset.add_state('score')
+        >>> dataset.state_table.column('score')[:3]
+        [Score(home=0, away=0), Score(home=0, away=0), Score(home=0, away=0)]
+    """
+
+    def __init__(self, events: Sequence[Event]):
+        self.events = events
+        self.columns: Dict[str, List[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def add_column(self, key: str, values: List[Any]):
+        if len(values) != len(self.events):
+            raise ValueError(
+                f"Column {key} has {len(values)} values, expected {len(self.events)}"
+            )
+        self.columns[key] = values
+
+    def column(self, key: str) -> List[Any]:
+        return self.columns[key]
+
+    def row(self, idx: int) -> Dict[str, Any]:
+        """The state of the event at position `idx`."""
+        return {key: values[idx] for key, values in self.columns.items()}
@@ -326,8 +326,7 @@ class DatasetTransformer:
             ):
                 event = self.__flip_event(event)
 
-            if event.freeze_frame:
-                event.freeze_frame = self.transform_frame(event.freeze_frame)
+            event.map_freeze_frame(self.transform_frame)
 
         return event
 
@@ -341,7 +340,7 @@ class DatasetTransformer:
             and getattr(event, field.name)
         }
 
-        return replace(event, **position_changes)
+        return event.replace(**position_changes)
 
     def __change_event_dimensions(self, event: Event):
         position_changes = {
@@ -353,7 +352,7 @@ class DatasetTransformer:
             and getattr(event, field.name)
         }
 
-        return replace(event, **position_changes)
+        return event.replace(**position_changes)
 
     def __flip_event(self, event: Event):
         position_changes = {
@@ -363,7 +362,7 @@ class DatasetTransformer:
             and getattr(event, field.name)
         }
 
-        return replace(event, **position_changes)
+        return event.replace(**position_changes)
 
     def get_to_coordinate_system(self) -> Optional[CoordinateSystem]:
         return self._to_coordinate_system
@@ -1,3 +1,4 @@
+import asyncio
 from abc import abstractmethod, ABC
 from typing import BinaryIO
 
@@ -11,5 +12,15 @@ class Adapter(ABC):
     def read_to_stream(self, url: str, output: BinaryIO):
         pass
 
+    async def read_to_stream_async(self, url: str, output: BinaryIO):
+        """Asynchronous version of `read_to_stream`.
+
+        By default, `read_to_stream` runs in the default executor of the
+        event loop, so multiple inputs can be downloaded concurrently.
+        Adapters with a native asynchronous client can override this.
+        """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.read_to_stream, url, output)
+
 
 __all__ = ["Adapter"]
@@ -1,3 +1,4 @@
+import threading
 from typing import BinaryIO
 
 from kloppy.config import get_config
@@ -27,14 +28,13 @@ def check_requests_patch():
 
 
 class HTTPAdapter(Adapter):
+    def __init__(self):
+        self._local = threading.local()
+
     def supports(self, url: str) -> bool:
         return url.startswith("http://") or url.startswith("https://")
 
-    def read_to_stream(self, url: str, output: BinaryIO):
-        check_requests_patch()
-
-        basic_authentication = get_config("adapters.http.basic_authentication")
-
+    def _get_session(self):
         try:
             import requests
         except ImportError:
@@ -43,11 +43,29 @@ class HTTPAdapter(Adapter):
                 " install it using: pip install requests"
             )
 
+        # Each thread reuses its own session, so connections (and TLS
+        # handshakes) to the same host are reused. A `requests.Session` is
+        # not guaranteed to be thread-safe, and concurrent downloads run in
+        # the threads of an executor.
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+
+    def read_to_stream(self, url: str, output: BinaryIO):
+        check_requests_patch()
+
+        basic_authentication = get_config("adapters.http.basic_authentication")
+
+        session = self._get_session()
+
         auth = None
         if basic_authentication:
-            auth = requests.auth.HTTPBasicAuth(*basic_authentication)
+            from requests.auth import HTTPBasicAuth
+
+            auth = HTTPBasicAuth(*basic_authentication)
 
-        with requests.get(url, stream=True, auth=auth) as r:
+        with session.get(url, stream=True, auth=auth) as r:
             if r.status_code == 404:
                 raise InputNotFoundError(f"Could not find {url}")
 
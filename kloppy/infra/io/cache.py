@@ -0,0 +1,339 @@
+"""A content-addressed, size-bounded cache for downloaded inputs.
+
+The cache directory contains:
+
+- ``objects/``: the downloaded files, named after the SHA-256 digest of
+  their content. Inputs with the same content are stored only once.
+- ``index.json``: maps every URL to the digest, size and last access time
+  of its content.
+- ``tmp/``: downloads in progress. A download is only moved to ``objects/``
+  (with an atomic rename) once it is complete, so an interrupted download
+  never ends up in the cache.
+"""
+import contextlib
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import BinaryIO, Dict, Generator, List, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+INDEX_FILENAME = "index.json"
+INDEX_VERSION = 1
+
+# Downloads that have been in progress for longer than this (in seconds) are
+# assumed to be interrupted and are removed by `DownloadCache.prune`.
+STALE_DOWNLOAD_AGE = 24 * 60 * 60
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """
+    A cached input.
+
+    Attributes:
+        url: the URL the input was downloaded from
+        path: the location of the cached file
+        digest: SHA-256 digest of the content
+        size: size of the content in bytes
+        last_access: time of the last download or use, in seconds since
+            the epoch
+    """
+
+    url: str
+    path: str
+    digest: str
+    size: int
+    last_access: float
+
+
+class HashingWriter:
+    """A binary file writer that computes the digest of the written data."""
+
+    def __init__(self, fp: BinaryIO, path: str):
+        self.fp = fp
+        self.path = path
+        self.size = 0
+        self._hash = hashlib.sha256()
+
+    def write(self, data: bytes) -> int:
+        self._hash.update(data)
+        self.size += len(data)
+        return self.fp.write(data)
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self):
+        self.fp.flush()
+
+    def hexdigest(self) -> str:
+        return self._hash.hexdigest()
+
+
+def file_digest(path: str) -> str:
+    hash_ = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+            hash_.update(chunk)
+    return hash_.hexdigest()
+
+
+class DownloadCache:
+    """
+    A cache of downloaded inputs, stored in `cache_dir`.
+
+    Arguments:
+        cache_dir: the directory of the cache
+        max_size: the maximum total size of the cache in bytes. When a new
+            download makes the cache larger, the least recently used inputs
+            are evicted. `None` means the cache is unbounded.
+        verify: compare the digest of a cached file with the index before it
+            is used. Files that do not match are removed.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_size: Optional[int] = None,
+        verify: bool = False,
+    ):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+        self.verify = verify
+
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.tmp_dir = os.path.join(cache_dir, "tmp")
+        self.index_path = os.path.join(cache_dir, INDEX_FILENAME)
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.objects_dir, digest)
+
+    @contextlib.contextmanager
+    def _locked_index(self) -> Generator[Dict[str, Dict], None, None]:
+        """Load the index, and write it back when the block completes.
+
+        Other processes using the same cache wait until the block is
+        completed (on platforms that support file locks)."""
+        with open(self.index_path + ".lock", "a") as lock:
+            if fcntl is not None:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                index = self._read_index()
+                yield index
+                self._write_index(index)
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Dict[str, Dict]:
+        try:
+            with open(self.index_path, "r") as fp:
+                data = json.load(fp)
+        except (FileNotFoundError, ValueError):
+            return {}
+        if data.get("version") != INDEX_VERSION:
+            return {}
+        return data["entries"]
+
+    def _write_index(self, index: Dict[str, Dict]):
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir, suffix=".json")
+        with os.fdopen(fd, "w") as fp:
+            json.dump({"version": INDEX_VERSION, "entries": index}, fp)
+        os.replace(tmp_path, self.index_path)
+
+    def _remove_object_if_unused(self, index: Dict[str, Dict], digest: str):
+        if not any(entry["digest"] == digest for entry in index.values()):
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self._object_path(digest))
+
+    def _lookup(self, index: Dict[str, Dict], url: str) -> Optional[str]:
+        entry = index.get(url)
+        if entry is None:
+            return None
+
+        path = self._object_path(entry["digest"])
+        try:
+            valid = os.path.getsize(path) == entry["size"]
+        except FileNotFoundError:
+            valid = False
+        if valid and self.verify:
+            valid = file_digest(path) == entry["digest"]
+
+        if not valid:
+            del index[url]
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(path)
+            return None
+
+        entry["last_access"] = time.time()
+        return path
+
+    def get(self, url: str) -> Optional[str]:
+        """Get the path of the cached file for `url`, or `None` when the
+        input is not (validly) cached.
+
+        Another process can evict the file once this returns. Use `open` to
+        read the cached file."""
+        with self._locked_index() as index:
+            return self._lookup(index, url)
+
+    def open(self, url: str) -> Optional[BinaryIO]:
+        """Open the cached file for `url` for reading, or return `None` when
+        the input is not (validly) cached.
+
+        The file is opened while the index is locked, so it stays readable
+        when it is evicted afterwards (on platforms that allow removing open
+        files)."""
+        with self._locked_index() as index:
+            path = self._lookup(index, url)
+            if path is None:
+                return None
+            return open(path, "rb")
+
+    @contextlib.contextmanager
+    def writer(self, url: str) -> Generator[HashingWriter, None, None]:
+        """
+        Write the content of `url` to the cache.
+
+        The data is written to a temporary file, which is added to the cache
+        when the block completes without an error and removed otherwise.
+
+        Examples:
+            >>> with cache.writer(url) as output:
+            ...     adapter.read_to_stream(url, output)
+            >>> fp = cache.open(url)
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as fp:
+                writer = HashingWriter(fp, tmp_path)
+                yield writer
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(tmp_path)
+            raise
+
+        digest = writer.hexdigest()
+        path = self._object_path(digest)
+
+        # The file is moved into the cache while the index is locked, so
+        # `prune` can't remove it as a file that is not in the index.
+        with self._locked_index() as index:
+            os.replace(tmp_path, path)
+            writer.path = path
+            old_entry = index.get(url)
+            index[url] = {
+                "digest": digest,
+                "size": writer.size,
+                "last_access": time.time(),
+            }
+            if old_entry is not None and old_entry["digest"] != digest:
+                self._remove_object_if_unused(index, old_entry["digest"])
+            if self.max_size is not None:
+                self._evict(index, self.max_size, keep=url)
+
+    def entries(self) -> List[CacheEntry]:
+        """All cached inputs, the least recently used first."""
+        index = self._read_index()
+        return sorted(
+            (
+                CacheEntry(
+                    url=url,
+                    path=self._object_path(entry["digest"]),
+                    digest=entry["digest"],
+                    size=entry["size"],
+                    last_access=entry["last_access"],
+                )
+                for url, entry in index.items()
+            ),
+            key=lambda entry: entry.last_access,
+        )
+
+    @staticmethod
+    def _total_size(index: Dict[str, Dict]) -> int:
+        return sum(
+            {
+                entry["digest"]: entry["size"] for entry in index.values()
+            }.values()
+        )
+
+    def size(self) -> int:
+        """The total size of the cached files in bytes."""
+        return self._total_size(self._read_index())
+
+    def _evict(
+        self, index: Dict[str, Dict], max_size: int, keep: Optional[str] = None
+    ) -> List[str]:
+        evicted = []
+        for url, entry in sorted(
+            index.items(), key=lambda item: item[1]["last_access"]
+        ):
+            if self._total_size(index) <= max_size:
+                break
+            if url == keep:
+                continue
+            del index[url]
+            self._remove_object_if_unused(index, entry["digest"])
+            evicted.append(url)
+        return evicted
+
+    def prune(self, max_size: Optional[int] = None) -> List[str]:
+        """
+        Evict the least recently used inputs until the cache is no larger
+        than `max_size` bytes (defaults to the configured maximum size).
+        Files that are not in the index and stale interrupted downloads are
+        removed as well.
+
+        Returns the evicted URLs.
+        """
+        if max_size is None:
+            max_size = self.max_size
+
+        with self._locked_index() as index:
+            evicted = (
+                self._evict(index, max_size) if max_size is not None else []
+            )
+
+            digests = {entry["digest"] for entry in index.values()}
+            for filename in os.listdir(self.objects_dir):
+                if filename not in digests:
+                    os.remove(os.path.join(self.objects_dir, filename))
+            now = time.time()
+            for filename in os.listdir(self.tmp_dir):
+                path = os.path.join(self.tmp_dir, filename)
+                with contextlib.suppress(FileNotFoundError):
+                    if now - os.path.getmtime(path) > STALE_DOWNLOAD_AGE:
+                        os.remove(path)
+
+        return evicted
+
+    def remove(self, url: str) -> bool:
+        """Remove a single input from the cache. Returns whether it was
+        cached."""
+        with self._locked_index() as index:
+            entry = index.pop(url, None)
+            if entry is None:
+                return False
+            self._remove_object_if_unused(index, entry["digest"])
+            return True
+
+    def clear(self):
+        """Remove all inputs from the cache."""
+        with self._locked_index() as index:
+            index.clear()
+            shutil.rmtree(self.objects_dir, ignore_errors=True)
+            os.makedirs(self.objects_dir, exist_ok=True)
+
+
+__all__ = ["CacheEntry", "DownloadCache"]
@@ -228,6 +228,7 @@ def _parse_pass(
     team: Team,
     previous_event: Dict = None,
     next_event: Dict = None,
+    parse_qualifiers: bool = True,
 ) -> Dict:
     if next_event is not None and next_event["type"] == DF_EVENT_TYPE_OFFSIDE:
         result = PassResult.OFFSIDE
@@ -271,7 +272,11 @@ def _parse_pass(
                 receiver_player = team.get_player_by_id(next_event["plyrId"])
                 result = PassResult.COMPLETE
 
-    qualifiers = _get_event_qualifiers(raw_event, previous_event)
+    qualifiers = (
+        _get_event_qualifiers(raw_event, previous_event)
+        if parse_qualifiers
+        else None
+    )
 
     return dict(
         result=result,
@@ -282,7 +287,11 @@ def _parse_pass(
     )
 
 
-def _parse_shot(raw_event: Dict, previous_event: Dict = None) -> Dict:
+def _parse_shot(
+    raw_event: Dict,
+    previous_event: Dict = None,
+    parse_qualifiers: bool = True,
+) -> Dict:
     outcome_id = raw_event["type"]
     if outcome_id in GOAL_EVENTS:
         result = ShotResult.GOAL
@@ -304,7 +313,11 @@ def _parse_shot(raw_event: Dict, previous_event: Dict = None) -> Dict:
     else:
         raise DeserializationError(f"Unknown shot outcome: {outcome_id}")
 
-    qualifiers = _get_event_qualifiers(raw_event, previous_event)
+    qualifiers = (
+        _get_event_qualifiers(raw_event, previous_event)
+        if parse_qualifiers
+        else None
+    )
 
     return dict(
         result=result,
@@ -478,6 +491,8 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
 
             home_team, away_team = teams
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
+            keep_raw_events = self.should_parse_field("raw_event")
             previous_event = next_event = None
             for i, (e_class, e_id, raw_event) in enumerate(raw_events):
                 period = periods.get(raw_event["t"]["half"])
@@ -514,7 +529,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                         if "coord" in raw_event
                         else None
                     ),
-                    raw_event=raw_event,
+                    raw_event=raw_event if keep_raw_events else None,
                     result=None,
                     qualifiers=None,
                 )
@@ -525,6 +540,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                         team=team,
                         previous_event=previous_event,
                         next_event=next_event,
+                        parse_qualifiers=parse_qualifiers,
                     )
                     event_base_kwargs.update(pass_event_kwargs)
                     event = self.event_factory.build_pass(**event_base_kwargs)
@@ -533,6 +549,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                     shot_event_kwargs = _parse_shot(
                         raw_event=raw_event,
                         previous_event=previous_event,
+                        parse_qualifiers=parse_qualifiers,
                     )
                     event_base_kwargs.update(shot_event_kwargs)
                     event = self.event_factory.build_shot(**event_base_kwargs)
@@ -588,7 +605,7 @@ class DatafactoryDeserializer(EventDataDeserializer[DatafactoryInputs]):
                         team=team,
                         player=player,
                         coordinates=event.coordinates,
-                        raw_event=raw_event,
+                        raw_event=raw_event if keep_raw_events else None,
                         result=None,
                         qualifiers=None,
                     )
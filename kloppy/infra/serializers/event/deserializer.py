@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, List, Generic, TypeVar, Union
+from typing import Iterable, Optional, List, Generic, TypeVar, Union
 
 from kloppy.domain import (
     EventDataset,
@@ -11,9 +11,20 @@ from kloppy.domain import (
     DatasetType,
     DatasetTransformerBuilder,
 )
+from kloppy.exceptions import KloppyParameterError
 
 T = TypeVar("T")
 
+# Event attributes that are only populated when requested using `fields`.
+# All other attributes are always populated.
+OPTIONAL_EVENT_FIELDS = (
+    "qualifiers",
+    "raw_event",
+    "related_event_ids",
+    "freeze_frame",
+    "statistics",
+)
+
 
 class EventDataDeserializer(ABC, Generic[T]):
     def __init__(
@@ -21,6 +32,7 @@ class EventDataDeserializer(ABC, Generic[T]):
         event_types: Optional[List[Union[EventType, str]]] = None,
         coordinate_system: Optional[Union[str, Provider]] = None,
         event_factory: Optional[EventFactory] = None,
+        fields: Optional[List[str]] = None,
     ):
         if not event_types:
             event_types = []
@@ -38,11 +50,44 @@ class EventDataDeserializer(ABC, Generic[T]):
             event_factory = EventFactory()
         self.event_factory = event_factory
 
+        if fields is not None:
+            unknown_fields = set(fields) - set(OPTIONAL_EVENT_FIELDS)
+            if unknown_fields:
+                raise KloppyParameterError(
+                    f"Unknown fields: {', '.join(sorted(unknown_fields))}. "
+                    f"Valid fields are: {', '.join(OPTIONAL_EVENT_FIELDS)}"
+                )
+        self.fields = set(fields) if fields is not None else None
+
     def should_include_event(self, event: Event) -> bool:
         if not self.event_types:
             return True
         return event.event_type in self.event_types
 
+    def should_parse_event_types(
+        self, event_types: Iterable[EventType]
+    ) -> bool:
+        """Check whether any of the given event types is requested.
+
+        Deserializers use this as a cheap pre-filter on raw events: a raw
+        event that can only result in event types that are not requested
+        is skipped before its qualifiers, players and coordinates are parsed.
+        """
+        if not self.event_types:
+            return True
+        return any(
+            event_type in self.event_types for event_type in event_types
+        )
+
+    def should_parse_field(self, field: str) -> bool:
+        """Check whether an optional event attribute was requested.
+
+        When no `fields` are passed, all attributes are parsed. Deserializers
+        check this while parsing, so attributes that were not requested are
+        never built.
+        """
+        return self.fields is None or field in self.fields
+
     def get_transformer(
         self,
         pitch_length: Optional[float] = None,
@@ -112,6 +112,7 @@ def _parse_pass(
     previous_event: Dict,
     subtypes: List,
     team: Team,
+    parse_qualifiers: bool = True,
 ) -> Dict:
     event_type_id = event["type"]["id"]
 
@@ -139,7 +140,11 @@ def _parse_pass(
         receiver_coordinates = None
         receive_timestamp = None
 
-    qualifiers = _get_event_qualifiers(event, previous_event, subtypes)
+    qualifiers = (
+        _get_event_qualifiers(event, previous_event, subtypes)
+        if parse_qualifiers
+        else None
+    )
 
     return dict(
         result=result,
@@ -194,7 +199,12 @@ def _get_event_bodypart_qualifiers(subtypes: List) -> List[Qualifier]:
     return qualifiers
 
 
-def _parse_shot(event: Dict, previous_event: Dict, subtypes: List) -> Dict:
+def _parse_shot(
+    event: Dict,
+    previous_event: Dict,
+    subtypes: List,
+    parse_qualifiers: bool = True,
+) -> Dict:
     if MS_SHOT_OUTCOME_OFF_TARGET in subtypes:
         result = ShotResult.OFF_TARGET
     elif MS_SHOT_OUTCOME_SAVED in subtypes:
@@ -210,7 +220,11 @@ def _parse_shot(event: Dict, previous_event: Dict, subtypes: List) -> Dict:
             f"Unknown shot outcome: {', '.join(subtypes)}"
         )
 
-    qualifiers = _get_event_qualifiers(event, previous_event, subtypes)
+    qualifiers = (
+        _get_event_qualifiers(event, previous_event, subtypes)
+        if parse_qualifiers
+        else None
+    )
 
     return dict(result=result, qualifiers=qualifiers)
 
@@ -269,6 +283,8 @@ class MetricaJsonEventDataDeserializer(
 
         with performance_logging("parse data", logger=logger):
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
+            keep_raw_events = self.should_parse_field("raw_event")
             for previous_event, raw_event in zip(
                 [None] + raw_events["data"], raw_events["data"]
             ):
@@ -302,7 +318,7 @@ class MetricaJsonEventDataDeserializer(
                     team=team,
                     player=player,
                     coordinates=(_parse_coordinates(raw_event["start"])),
-                    raw_event=raw_event,
+                    raw_event=raw_event if keep_raw_events else None,
                 )
 
                 if event_type == MS_SET_PIECE:
@@ -315,6 +331,7 @@ class MetricaJsonEventDataDeserializer(
                         previous_event=previous_event,
                         subtypes=subtypes,
                         team=team,
+                        parse_qualifiers=parse_qualifiers,
                     )
 
                     event = self.event_factory.build_pass(
@@ -327,6 +344,7 @@ class MetricaJsonEventDataDeserializer(
                         event=raw_event,
                         previous_event=previous_event,
                         subtypes=subtypes,
+                        parse_qualifiers=parse_qualifiers,
                     )
                     event = self.event_factory.build_shot(
                         **shot_event_kwargs,
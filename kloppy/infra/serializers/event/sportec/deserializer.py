@@ -1,8 +1,8 @@
 from collections import OrderedDict
-from typing import Dict, List, NamedTuple, IO
+from typing import Dict, Iterator, List, NamedTuple, IO
 from datetime import timedelta, datetime
 import logging
-from lxml import objectify
+from lxml import etree, objectify
 
 from kloppy.domain import (
     EventDataset,
@@ -265,12 +265,28 @@ def _event_chain_from_xml_elm(event_elm):
     current_elm = event_elm
     while True:
         chain[current_elm.tag] = dict(current_elm.attrib)
-        if not current_elm.countchildren():
+        if not len(current_elm):
             break
-        current_elm = current_elm.getchildren()[0]
+        current_elm = current_elm[0]
     return chain
 
 
+def _iter_event_chains(event_data: IO[bytes]) -> Iterator[OrderedDict]:
+    """Stream the event chains of the `Event` elements in the event XML.
+
+    Each element is cleared as soon as its chain is extracted, so the memory
+    usage does not grow with the size of the document.
+    """
+    for _, event_elm in etree.iterparse(
+        event_data, events=("end",), tag="Event", remove_comments=True
+    ):
+        yield _event_chain_from_xml_elm(event_elm)
+        # Free the memory of the processed elements
+        event_elm.clear()
+        while event_elm.getprevious() is not None:
+            del event_elm.getparent()[0]
+
+
 SPORTEC_EVENT_NAME_KICKOFF = "KickOff"
 SPORTEC_EVENT_NAME_FINAL_WHISTLE = "FinalWhistle"
 
@@ -362,7 +378,9 @@ def _get_event_bodypart_qualifiers(event_chain):
     return qualifiers
 
 
-def _parse_shot(event_name: str, event_chain: OrderedDict) -> Dict:
+def _parse_shot(
+    event_name: str, event_chain: OrderedDict, parse_qualifiers: bool = True
+) -> Dict:
     if event_name == SPORTEC_EVENT_NAME_SHOT_WIDE:
         result = ShotResult.OFF_TARGET
     elif event_name == SPORTEC_EVENT_NAME_SHOT_SAVED:
@@ -380,10 +398,17 @@ def _parse_shot(event_name: str, event_chain: OrderedDict) -> Dict:
     else:
         raise ValueError(f"Unknown shot type {event_name}")
 
-    return dict(result=result, qualifiers=_get_event_qualifiers(event_chain))
+    return dict(
+        result=result,
+        qualifiers=_get_event_qualifiers(event_chain)
+        if parse_qualifiers
+        else None,
+    )
 
 
-def _parse_pass(event_chain: OrderedDict, team: Team) -> Dict:
+def _parse_pass(
+    event_chain: OrderedDict, team: Team, parse_qualifiers: bool = True
+) -> Dict:
     if event_chain["Play"]["Evaluation"] in (
         "successfullyCompleted",
         "successful",
@@ -403,7 +428,9 @@ def _parse_pass(event_chain: OrderedDict, team: Team) -> Dict:
     return dict(
         result=result,
         receiver_player=receiver_player,
-        qualifiers=_get_event_qualifiers(event_chain),
+        qualifiers=_get_event_qualifiers(event_chain)
+        if parse_qualifiers
+        else None,
     )
 
 
@@ -464,7 +491,6 @@ class SportecEventDataDeserializer(
     def deserialize(self, inputs: SportecEventDataInputs) -> EventDataset:
         with performance_logging("load data", logger=logger):
             match_root = objectify.fromstring(inputs.meta_data.read())
-            event_root = objectify.fromstring(inputs.event_data.read())
 
         with performance_logging("parse data", logger=logger):
             date = datetime.fromisoformat(
@@ -485,9 +511,9 @@ class SportecEventDataDeserializer(
             periods = []
             period_id = 0
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
 
-            for event_elm in event_root.iterchildren("Event"):
-                event_chain = _event_chain_from_xml_elm(event_elm)
+            for event_chain in _iter_event_chains(inputs.event_data):
                 timestamp = _parse_datetime(event_chain["Event"]["EventTime"])
 
                 if (
@@ -553,7 +579,9 @@ class SportecEventDataDeserializer(
                 event_name, event_attributes = event_chain.popitem()
                 if event_name in SPORTEC_SHOT_EVENT_NAMES:
                     shot_event_kwargs = _parse_shot(
-                        event_name=event_name, event_chain=event_chain
+                        event_name=event_name,
+                        event_chain=event_chain,
+                        parse_qualifiers=parse_qualifiers,
                     )
                     event = self.event_factory.build_shot(
                         **shot_event_kwargs,
@@ -561,7 +589,9 @@ class SportecEventDataDeserializer(
                     )
                 elif event_name in SPORTEC_PASS_EVENT_NAMES:
                     pass_event_kwargs = _parse_pass(
-                        event_chain=event_chain, team=team
+                        event_chain=event_chain,
+                        team=team,
+                        parse_qualifiers=parse_qualifiers,
                     )
                     event = self.event_factory.build_pass(
                         **pass_event_kwargs,
@@ -613,14 +643,18 @@ class SportecEventDataDeserializer(
                         **generic_event_kwargs,
                     )
 
-                if (
-                    event.event_type == EventType.PASS
-                    and event.get_qualifier_value(SetPieceQualifier)
+                # Read the set piece type from the event chain, as the
+                # qualifiers of the event are only parsed on request
+                if event.event_type == EventType.PASS and any(
+                    qualifier.value
                     in (
                         SetPieceType.THROW_IN,
                         SetPieceType.GOAL_KICK,
                         SetPieceType.CORNER_KICK,
                     )
+                    for qualifier in _get_event_setpiece_qualifiers(
+                        event_chain
+                    )
                 ):
                     # 1. update previous pass
                     if events[-1].event_type == EventType.PASS:
@@ -686,6 +720,12 @@ class SportecEventDataDeserializer(
                 else:
                     event.receiver_coordinates = events[i + 1].coordinates
 
+        # The raw events are needed above to find the receiver coordinates,
+        # so they can only be dropped now
+        if not self.should_parse_field("raw_event"):
+            for event in events:
+                event.raw_event = None
+
         events = list(
             filter(
                 self.should_include_event,
@@ -1,5 +1,5 @@
-import json
 import logging
+from functools import partial
 from itertools import zip_longest
 from typing import IO, NamedTuple, Optional
 
@@ -20,7 +20,7 @@ from kloppy.infra.serializers.event.deserializer import EventDataDeserializer
 from kloppy.utils import performance_logging
 
 from . import specification as SB
-from .helpers import parse_freeze_frame, parse_str_ts
+from .helpers import load_freeze_frame, load_json, parse_str_ts
 from .specification import position_types_mapping
 
 logger = logging.getLogger(__name__)
@@ -68,10 +68,17 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
 
         # Create events
         with performance_logging("parse events", logger=logger):
+            parse_freeze_frames = self.should_parse_field("freeze_frame")
+            keep_raw_events = self.should_parse_field("raw_event")
             events = []
             for raw_event in raw_events.values():
+                if not self.should_parse_event_types(
+                    raw_event.get_event_types()
+                ):
+                    continue
                 new_events = (
                     raw_event.set_version(data_version)
+                    .set_fields(self.fields)
                     .set_refs(periods, teams, raw_events)
                     .deserialize(self.event_factory)
                 )
@@ -79,6 +86,15 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
                     if self.should_include_event(event):
                         # Transform event to the coordinate system
                         event = self.transformer.transform_event(event)
+                        if parse_freeze_frames:
+                            self.add_freeze_frame(
+                                event, teams, three_sixty_data, data_version
+                            )
+                        # The raw event (which can be the raw event of a
+                        # related event) is used while deserializing, but
+                        # only kept when it was requested.
+                        if not keep_raw_events:
+                            event.raw_event = None
                         events.append(event)
 
         metadata = Metadata(
@@ -93,36 +109,37 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
             coordinate_system=self.transformer.get_to_coordinate_system(),
             **additional_metadata,
         )
-        dataset = EventDataset(metadata=metadata, records=events)
-        for event in dataset:
-            if "freeze_frame" in event.raw_event.get("shot", {}):
-                event.freeze_frame = self.transformer.transform_frame(
-                    parse_freeze_frame(
-                        freeze_frame=event.raw_event["shot"]["freeze_frame"],
-                        home_team=teams[0],
-                        away_team=teams[1],
-                        event=event,
-                        fidelity_version=data_version.shot_fidelity_version,
-                    )
-                )
-            if not event.freeze_frame and event.event_id in three_sixty_data:
-                freeze_frame = three_sixty_data[event.event_id]
-                event.freeze_frame = self.transformer.transform_frame(
-                    parse_freeze_frame(
-                        freeze_frame=freeze_frame["freeze_frame"],
-                        home_team=teams[0],
-                        away_team=teams[1],
-                        event=event,
-                        fidelity_version=data_version.xy_fidelity_version,
-                        visible_area=freeze_frame["visible_area"],
-                    )
-                )
-        return dataset
+        return EventDataset(metadata=metadata, records=events)
+
+    def add_freeze_frame(self, event, teams, three_sixty_data, data_version):
+        # Freeze frames are only parsed when they are accessed
+        if "freeze_frame" in event.raw_event.get("shot", {}):
+            event.freeze_frame = partial(
+                load_freeze_frame,
+                transformer=self.transformer,
+                freeze_frame=event.raw_event["shot"]["freeze_frame"],
+                home_team=teams[0],
+                away_team=teams[1],
+                event=event,
+                fidelity_version=data_version.shot_fidelity_version,
+            )
+        elif event.event_id in three_sixty_data:
+            three_sixty_item = three_sixty_data[event.event_id]
+            event.freeze_frame = partial(
+                load_freeze_frame,
+                transformer=self.transformer,
+                freeze_frame=three_sixty_item["freeze_frame"],
+                home_team=teams[0],
+                away_team=teams[1],
+                event=event,
+                fidelity_version=data_version.xy_fidelity_version,
+                visible_area=three_sixty_item["visible_area"],
+            )
 
     def load_data(self, inputs: StatsBombInputs):
         raw_events = {}
         shot_fidelity_version, xy_fidelity_version = 1, 1
-        for event in json.load(inputs.event_data):
+        for event in load_json(inputs.event_data):
             # load the event
             raw_events[event["id"]] = SB.event_decoder(event)
             # determine the fidelity version
@@ -145,14 +162,15 @@ class StatsBombDeserializer(EventDataDeserializer[StatsBombInputs]):
             xy_fidelity_version=xy_fidelity_version,
         )
 
-        lineups = json.load(inputs.lineup_data)
+        lineups = load_json(inputs.lineup_data)
 
         three_sixty_data = (
             {
                 item["event_uuid"]: item
-                for item in json.load(inputs.three_sixty_data)
+                for item in load_json(inputs.three_sixty_data)
             }
             if inputs.three_sixty_data
+            and self.should_parse_field("freeze_frame")
             else {}
         )
 
@@ -1,8 +1,10 @@
+import json
 from datetime import timedelta
-from typing import Dict, List, Optional
+from typing import IO, Any, Dict, List, Optional
 
 from kloppy.domain import (
     ActionValue,
+    DatasetTransformer,
     Event,
     Frame,
     Period,
@@ -17,6 +19,15 @@ from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
 
 
+def load_json(fp: IO[bytes]) -> Any:
+    """Decode a JSON file. Uses the faster orjson parser when installed."""
+    try:
+        import orjson
+    except ImportError:
+        return json.load(fp)
+    return orjson.loads(fp.read())
+
+
 def parse_str_ts(timestamp: str) -> float:
     """Parse a HH:mm:ss string timestamp into number of seconds."""
     h, m, s = timestamp.split(":")
@@ -164,3 +175,29 @@ def parse_freeze_frame(
     )
 
     return frame
+
+
+def load_freeze_frame(
+    transformer: DatasetTransformer,
+    freeze_frame: List[Dict],
+    fidelity_version: int,
+    home_team: Team,
+    away_team: Team,
+    event: Event,
+    visible_area: Optional[List] = None,
+) -> Frame:
+    """Parse a raw freeze frame and transform it to the requested
+    coordinate system.
+
+    This is used to materialize `event.freeze_frame` on first access.
+    """
+    return transformer.transform_frame(
+        parse_freeze_frame(
+            freeze_frame=freeze_frame,
+            fidelity_version=fidelity_version,
+            home_team=home_team,
+            away_team=away_team,
+            event=event,
+            visible_area=visible_area,
+        )
+    )
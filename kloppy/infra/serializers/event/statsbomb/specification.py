@@ -1,6 +1,6 @@
 from datetime import timedelta
 from enum import Enum, EnumMeta
-from typing import Dict, List, NamedTuple, Optional, Union
+from typing import Dict, List, NamedTuple, Optional, Set, Union
 
 from kloppy.domain import (
     BallState,
@@ -15,6 +15,7 @@ from kloppy.domain import (
     DuelType,
     Event,
     EventFactory,
+    EventType,
     ExpectedGoals,
     FormationType,
     GoalkeeperActionType,
@@ -244,13 +245,41 @@ class EVENT:
         data_version: The version of the StatsBomb data.
     """
 
+    #: The kloppy event types this event can be deserialized into
+    event_types = (EventType.GENERIC,)
+
     def __init__(self, raw_event: Dict):
         self.raw_event = raw_event
+        self.fields: Optional[Set[str]] = None
+
+    def get_event_types(self) -> List[EventType]:
+        """Get the kloppy event types this event can be deserialized into.
+
+        This is a cheap check on the raw event that can be used to skip
+        events that cannot result in any of the requested event types.
+        """
+        event_types = list(self.event_types)
+        if self.raw_event.get("out", False):
+            event_types.append(EventType.BALL_OUT)
+        if any(
+            "aerial_won" in self.raw_event.get(type_name, {})
+            for type_name in ["shot", "clearance", "miscontrol", "pass"]
+        ):
+            event_types.append(EventType.DUEL)
+        return event_types
 
     def set_version(self, data_version: Version):
         self.fidelity_version = data_version.xy_fidelity_version
         return self
 
+    def set_fields(self, fields: Optional[Set[str]]):
+        """Set the optional event attributes to parse. `None` parses all."""
+        self.fields = fields
+        return self
+
+    def should_parse_field(self, field: str) -> bool:
+        return self.fields is None or field in self.fields
+
     def set_refs(self, periods, teams, events):
         self.period = get_period_by_id(self.raw_event["period"], periods)
         self.team = get_team_by_id(self.raw_event["team"]["id"], teams)
@@ -291,18 +320,23 @@ class EVENT:
                 event_factory, **generic_event_kwargs
             )
         )
-        for event in events:
-            play_pattern_qualifiers = _get_play_pattern_qualifiers(
-                event.raw_event
-            )
-            if len(play_pattern_qualifiers) > 0:
-                event.qualifiers = (
-                    event.qualifiers or []
-                ) + play_pattern_qualifiers
+        if self.should_parse_field("qualifiers"):
+            for event in events:
+                play_pattern_qualifiers = _get_play_pattern_qualifiers(
+                    event.raw_event
+                )
+                if len(play_pattern_qualifiers) > 0:
+                    event.qualifiers = (
+                        event.qualifiers or []
+                    ) + play_pattern_qualifiers
         return events
 
     def _parse_generic_kwargs(self) -> Dict:
-        game_state_value = parse_obv_values(self.raw_event)
+        game_state_value = (
+            parse_obv_values(self.raw_event)
+            if self.should_parse_field("statistics")
+            else None
+        )
         return {
             "period": self.period,
             "timestamp": parse_str_ts(self.raw_event["timestamp"]),
@@ -319,7 +353,11 @@ class EVENT:
                 if "location" in self.raw_event
                 else None
             ),
-            "related_event_ids": self.raw_event.get("related_events", []),
+            "related_event_ids": (
+                self.raw_event.get("related_events", [])
+                if self.should_parse_field("related_event_ids")
+                else []
+            ),
             "raw_event": self.raw_event,
             "statistics": [game_state_value] if game_state_value else [],
         }
@@ -336,10 +374,14 @@ class EVENT:
                 generic_event_kwargs[
                     "event_id"
                 ] = f"duel-{generic_event_kwargs['event_id']}"
-                duel_qualifiers = [
-                    DuelQualifier(value=DuelType.LOOSE_BALL),
-                    DuelQualifier(value=DuelType.AERIAL),
-                ]
+                duel_qualifiers = (
+                    [
+                        DuelQualifier(value=DuelType.LOOSE_BALL),
+                        DuelQualifier(value=DuelType.AERIAL),
+                    ]
+                    if self.should_parse_field("qualifiers")
+                    else None
+                )
                 duel_event = event_factory.build_duel(
                     result=DuelResult.WON,
                     qualifiers=duel_qualifiers,
@@ -379,6 +421,8 @@ class EVENT:
 class PASS(EVENT):
     """StatsBomb 30/Pass event."""
 
+    event_types = (EventType.PASS, EventType.INTERCEPTION, EventType.BALL_OUT)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         ONE_TOUCH_INTERCEPTION = 64
         RECOVERY = 66
@@ -444,6 +488,8 @@ class PASS(EVENT):
             _get_pass_qualifiers(pass_dict)
             + _get_set_piece_qualifiers(EVENT_TYPE.PASS, pass_dict)
             + _get_body_part_qualifiers(pass_dict)
+            if self.should_parse_field("qualifiers")
+            else None
         )
 
         pass_event = event_factory.build_pass(
@@ -508,6 +554,8 @@ class PASS(EVENT):
 class BALL_RECEIPT(EVENT):
     """StatsBomb 42/Ball Receipt* event."""
 
+    event_types = (EventType.GENERIC, EventType.BALL_OUT)
+
     def _create_ball_out_event(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -542,6 +590,8 @@ class BALL_RECEIPT(EVENT):
 class SHOT(EVENT):
     """StatsBomb 16/Shot event."""
 
+    event_types = (EventType.SHOT, EventType.BALL_OUT)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         OPEN_PLAY = 87
         FREE_KICK = 62
@@ -586,19 +636,23 @@ class SHOT(EVENT):
         if result is None:
             raise DeserializationError(f"Unknown shot outcome: {outcome_id}")
 
-        qualifiers = _get_set_piece_qualifiers(
-            EVENT_TYPE.SHOT, shot_dict
-        ) + _get_body_part_qualifiers(shot_dict)
-
-        for statistic_cls, prop_name in {
-            ExpectedGoals: "statsbomb_xg",
-            PostShotExpectedGoals: "shot_execution_xg",
-        }.items():
-            value = shot_dict.get(prop_name, None)
-            if value is not None:
-                generic_event_kwargs["statistics"].append(
-                    statistic_cls(value=value)
-                )
+        qualifiers = (
+            _get_set_piece_qualifiers(EVENT_TYPE.SHOT, shot_dict)
+            + _get_body_part_qualifiers(shot_dict)
+            if self.should_parse_field("qualifiers")
+            else None
+        )
+
+        if self.should_parse_field("statistics"):
+            for statistic_cls, prop_name in {
+                ExpectedGoals: "statsbomb_xg",
+                PostShotExpectedGoals: "shot_execution_xg",
+            }.items():
+                value = shot_dict.get(prop_name, None)
+                if value is not None:
+                    generic_event_kwargs["statistics"].append(
+                        statistic_cls(value=value)
+                    )
 
         shot_event = event_factory.build_shot(
             result=result,
@@ -649,6 +703,8 @@ class SHOT(EVENT):
 class INTERCEPTION(EVENT):
     """StatsBomb 10/Interception event."""
 
+    event_types = (EventType.INTERCEPTION, EventType.BALL_OUT)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         LOST = 1
         WON = 4
@@ -723,6 +779,8 @@ class INTERCEPTION(EVENT):
 class OWN_GOAL_AGAINST(EVENT):
     """StatsBomb 20/Own goal against event."""
 
+    event_types = (EventType.SHOT,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -737,6 +795,8 @@ class OWN_GOAL_AGAINST(EVENT):
 class OWN_GOAL_FOR(EVENT):
     """StatsBomb 25/Own goal for event."""
 
+    event_types = ()
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -746,12 +806,18 @@ class OWN_GOAL_FOR(EVENT):
 class CLEARANCE(EVENT):
     """StatsBomb 9/Clearance event."""
 
+    event_types = (EventType.CLEARANCE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
         clearance_dict = self.raw_event.get("clearance", {})
         # Old versions of the data (< v1.1) don't define extra attributes for clearances
-        qualifiers = _get_body_part_qualifiers(clearance_dict)
+        qualifiers = (
+            _get_body_part_qualifiers(clearance_dict)
+            if self.should_parse_field("qualifiers")
+            else None
+        )
 
         clearance_event = event_factory.build_clearance(
             result=None,
@@ -765,6 +831,8 @@ class CLEARANCE(EVENT):
 class MISCONTROL(EVENT):
     """StatsBomb 38/Miscontrol event."""
 
+    event_types = (EventType.MISCONTROL,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -780,6 +848,8 @@ class MISCONTROL(EVENT):
 class DRIBBLE(EVENT):
     """StatsBomb 14/Dribble event."""
 
+    event_types = (EventType.TAKE_ON,)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         COMPLETE = 8
         INCOMPLETE = 9
@@ -819,6 +889,8 @@ class DRIBBLE(EVENT):
 class CARRY(EVENT):
     """StatsBomb 43/Carry event."""
 
+    event_types = (EventType.CARRY,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -841,6 +913,8 @@ class CARRY(EVENT):
 class DUEL(EVENT):
     """StatsBomb 4/Duel event."""
 
+    event_types = (EventType.DUEL, EventType.BALL_OUT)
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         AERIAL_LOST = 10
         TACKLE = 11
@@ -886,7 +960,11 @@ class DUEL(EVENT):
 
         duel_event = event_factory.build_duel(
             result=result,
-            qualifiers=duel_qualifiers,
+            qualifiers=(
+                duel_qualifiers
+                if self.should_parse_field("qualifiers")
+                else None
+            ),
             **generic_event_kwargs,
         )
         return [duel_event]
@@ -917,6 +995,8 @@ class DUEL(EVENT):
 class FIFTY_FIFTY(EVENT):
     """StatsBomb 33/Fifty-Fifty event."""
 
+    event_types = (EventType.DUEL,)
+
     class OUTCOME(Enum, metaclass=TypesEnumMeta):
         WON = 4
         LOST = 1
@@ -948,7 +1028,11 @@ class FIFTY_FIFTY(EVENT):
 
         duel_event = event_factory.build_duel(
             result=result,
-            qualifiers=duel_qualifiers,
+            qualifiers=(
+                duel_qualifiers
+                if self.should_parse_field("qualifiers")
+                else None
+            ),
             **generic_event_kwargs,
         )
         return [duel_event]
@@ -957,6 +1041,14 @@ class FIFTY_FIFTY(EVENT):
 class GOALKEEPER(EVENT):
     """StatsBomb 23/Goalkeeper event."""
 
+    event_types = (
+        EventType.GOALKEEPER,
+        EventType.RECOVERY,
+        EventType.CLEARANCE,
+        EventType.GENERIC,
+        EventType.BALL_OUT,
+    )
+
     class TYPE(Enum, metaclass=TypesEnumMeta):
         COLLECTED = 25
         GOAL_CONCEDED = 26
@@ -1051,7 +1143,11 @@ class GOALKEEPER(EVENT):
                 else:
                     recovery = event_factory.build_recovery(
                         result=None,
-                        qualifiers=body_part_qualifiers,
+                        qualifiers=(
+                            body_part_qualifiers
+                            if self.should_parse_field("qualifiers")
+                            else None
+                        ),
                         **generic_event_kwargs,
                     )
                     return [recovery]
@@ -1063,7 +1159,11 @@ class GOALKEEPER(EVENT):
                 if head_or_foot_used:
                     clearance = event_factory.build_clearance(
                         result=None,
-                        qualifiers=body_part_qualifiers,
+                        qualifiers=(
+                            body_part_qualifiers
+                            if self.should_parse_field("qualifiers")
+                            else None
+                        ),
                         **generic_event_kwargs,
                     )
                     return [clearance]
@@ -1076,7 +1176,11 @@ class GOALKEEPER(EVENT):
         if qualifiers:
             goalkeeper_event = event_factory.build_goalkeeper_event(
                 result=None,
-                qualifiers=qualifiers + body_part_qualifiers,
+                qualifiers=(
+                    qualifiers + body_part_qualifiers
+                    if self.should_parse_field("qualifiers")
+                    else None
+                ),
                 **generic_event_kwargs,
             )
             return [goalkeeper_event]
@@ -1140,6 +1244,8 @@ class GOALKEEPER(EVENT):
 class SUBSTITUTION(EVENT):
     """StatsBomb 19/Substitution event."""
 
+    event_types = (EventType.SUBSTITUTION,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -1173,6 +1279,8 @@ class SUBSTITUTION(EVENT):
 class BAD_BEHAVIOUR(EVENT):
     """StatsBomb 24/Bad behaviour event."""
 
+    event_types = (EventType.CARD, EventType.GENERIC)
+
     class CARD(Enum, metaclass=TypesEnumMeta):
         FIRST_YELLOW = 7
         SECOND_YELLOW = 6
@@ -1206,6 +1314,8 @@ class BAD_BEHAVIOUR(EVENT):
 class FOUL_COMMITTED(EVENT):
     """StatsBomb 22/Foul committed event."""
 
+    event_types = (EventType.FOUL_COMMITTED, EventType.CARD)
+
     class CARD(Enum, metaclass=TypesEnumMeta):
         FIRST_YELLOW = 7
         SECOND_YELLOW = 6
@@ -1221,7 +1331,11 @@ class FOUL_COMMITTED(EVENT):
         if card_type:
             foul_committed_event = event_factory.build_foul_committed(
                 result=None,
-                qualifiers=[CardQualifier(value=card_type)],
+                qualifiers=(
+                    [CardQualifier(value=card_type)]
+                    if self.should_parse_field("qualifiers")
+                    else None
+                ),
                 **generic_event_kwargs,
             )
             card_event = event_factory.build_card(
@@ -1243,6 +1357,8 @@ class FOUL_COMMITTED(EVENT):
 class PLAYER_ON(EVENT):
     """StatsBomb 26/Player on event."""
 
+    event_types = (EventType.PLAYER_ON,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -1257,6 +1373,8 @@ class PLAYER_ON(EVENT):
 class PLAYER_OFF(EVENT):
     """StatsBomb 27/Player off event."""
 
+    event_types = (EventType.PLAYER_OFF,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -1271,6 +1389,8 @@ class PLAYER_OFF(EVENT):
 class BALL_RECOVERY(EVENT):
     """StatsBomb 2/Ball recovery event."""
 
+    event_types = (EventType.RECOVERY,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -1285,6 +1405,8 @@ class BALL_RECOVERY(EVENT):
 class PRESSURE(EVENT):
     """StatsBomb 17/Pressure event."""
 
+    event_types = (EventType.PRESSURE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
@@ -1304,6 +1426,8 @@ class PRESSURE(EVENT):
 class TACTICAL_SHIFT(EVENT):
     """StatsBomb 36/Tactical shift event."""
 
+    event_types = (EventType.FORMATION_CHANGE,)
+
     def _create_events(
         self, event_factory: EventFactory, **generic_event_kwargs
     ) -> List[Event]:
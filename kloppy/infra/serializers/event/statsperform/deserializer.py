@@ -1,5 +1,5 @@
 import math
-from typing import Dict, List, NamedTuple, IO, Optional
+from typing import Any, Dict, List, NamedTuple, IO, Optional, Tuple, Type
 import logging
 from datetime import datetime, timedelta
 
@@ -7,6 +7,7 @@ import pytz
 
 from kloppy.domain import (
     EventDataset,
+    EventType,
     Team,
     Point,
     Point3D,
@@ -237,6 +238,33 @@ event_type_names = {
     77: "player off pitch",
 }
 
+# The kloppy event types a raw event type can be deserialized into. All
+# other raw event types result in a generic event.
+event_type_candidates = {
+    EVENT_TYPE_PASS: (EventType.PASS,),
+    EVENT_TYPE_OFFSIDE_PASS: (EventType.PASS,),
+    EVENT_TYPE_TAKE_ON: (EventType.TAKE_ON,),
+    EVENT_TYPE_SHOT_MISS: (EventType.SHOT,),
+    EVENT_TYPE_SHOT_POST: (EventType.SHOT,),
+    EVENT_TYPE_SHOT_SAVED: (EventType.SHOT,),
+    EVENT_TYPE_SHOT_GOAL: (EventType.SHOT,),
+    EVENT_TYPE_RECOVERY: (EventType.RECOVERY,),
+    EVENT_TYPE_CLEARANCE: (EventType.CLEARANCE,),
+    EVENT_TYPE_INTERCEPTION: (EventType.INTERCEPTION,),
+    EVENT_TYPE_BLOCKED_PASS: (EventType.INTERCEPTION,),
+    EVENT_TYPE_BALL_TOUCH: (EventType.MISCONTROL, EventType.GENERIC),
+    EVENT_TYPE_FOUL_COMMITTED: (EventType.FOUL_COMMITTED, EventType.GENERIC),
+    EVENT_TYPE_FORMATION_CHANGE: (EventType.FORMATION_CHANGE,),
+    EVENT_TYPE_PLAYER_OFF: (EventType.SUBSTITUTION,),
+    EVENT_TYPE_CARD: (EventType.CARD,),
+    **{type_id: (EventType.DUEL,) for type_id in DUEL_EVENTS},
+    **{
+        type_id: (EventType.GOALKEEPER, EventType.GENERIC)
+        for type_id in KEEPER_EVENTS
+    },
+    **{type_id: (EventType.BALL_OUT,) for type_id in BALL_OUT_EVENTS},
+}
+
 position_line_mapping = {
     "Goalkeeper": PositionType.Goalkeeper,
     "Defender": PositionType.Defender,
@@ -245,18 +273,127 @@ position_line_mapping = {
 }
 
 
+def _build_qualifier_table(
+    *groups: List[Tuple[int, Type[Qualifier], Any]]
+) -> Dict[int, Tuple[int, int, Type[Qualifier], Any]]:
+    """Build a lookup table from qualifier id to
+    (group, priority, qualifier class, value).
+
+    Each group lists its qualifier ids from high to low priority. At most
+    one qualifier per group is added to an event.
+    """
+    table = {}
+    for group, mapping in enumerate(groups):
+        for priority, (qualifier_id, qualifier_cls, value) in enumerate(
+            mapping
+        ):
+            if qualifier_id in table:
+                raise ValueError(
+                    f"Qualifier {qualifier_id} is mapped more than once"
+                )
+            table[qualifier_id] = (group, priority, qualifier_cls, value)
+    return table
+
+
+event_qualifier_table = _build_qualifier_table(
+    # set piece
+    [
+        (
+            EVENT_QUALIFIER_CORNER_KICK,
+            SetPieceQualifier,
+            SetPieceType.CORNER_KICK,
+        ),
+        (EVENT_QUALIFIER_FREE_KICK, SetPieceQualifier, SetPieceType.FREE_KICK),
+        (
+            EVENT_QUALIFIER_FREE_KICK_SHOT,
+            SetPieceQualifier,
+            SetPieceType.FREE_KICK,
+        ),
+        (EVENT_QUALIFIER_PENALTY, SetPieceQualifier, SetPieceType.PENALTY),
+        (EVENT_QUALIFIER_THROW_IN, SetPieceQualifier, SetPieceType.THROW_IN),
+        (EVENT_QUALIFIER_KICK_OFF, SetPieceQualifier, SetPieceType.KICK_OFF),
+        (EVENT_QUALIFIER_GOAL_KICK, SetPieceQualifier, SetPieceType.GOAL_KICK),
+    ],
+    # body part
+    [
+        (EVENT_QUALIFIER_HEAD_PASS, BodyPartQualifier, BodyPart.HEAD),
+        (EVENT_QUALIFIER_HEAD, BodyPartQualifier, BodyPart.HEAD),
+        (EVENT_QUALIFIER_FLICK_ON, BodyPartQualifier, BodyPart.HEAD),
+        (EVENT_QUALIFIER_LEFT_FOOT, BodyPartQualifier, BodyPart.LEFT_FOOT),
+        (EVENT_QUALIFIER_RIGHT_FOOT, BodyPartQualifier, BodyPart.RIGHT_FOOT),
+        (EVENT_QUALIFIER_OTHER_BODYPART, BodyPartQualifier, BodyPart.OTHER),
+    ],
+    # card
+    [
+        (EVENT_QUALIFIER_RED_CARD, CardQualifier, CardType.RED),
+        (
+            EVENT_QUALIFIER_FIRST_YELLOW_CARD,
+            CardQualifier,
+            CardType.FIRST_YELLOW,
+        ),
+        (
+            EVENT_QUALIFIER_SECOND_YELLOW_CARD,
+            CardQualifier,
+            CardType.SECOND_YELLOW,
+        ),
+    ],
+    # counter attack
+    [(EVENT_QUALIFIER_COUNTER_ATTACK, CounterAttackQualifier, True)],
+)
+
+# Qualifier id -> (priority, pass type). All matching pass types are added.
+pass_qualifier_table = {
+    qualifier_id: (priority, pass_type)
+    for priority, (qualifier_id, pass_type) in enumerate(
+        [
+            (EVENT_QUALIFIER_CROSS, PassType.CROSS),
+            (EVENT_QUALIFIER_LONG_BALL, PassType.LONG_BALL),
+            (EVENT_QUALIFIER_CHIPPED_BALL, PassType.CHIPPED_PASS),
+            (EVENT_QUALIFIER_THROUGH_BALL, PassType.THROUGH_BALL),
+            (EVENT_QUALIFIER_LAUNCH, PassType.LAUNCH),
+            (EVENT_QUALIFIER_FLICK_ON, PassType.FLICK_ON),
+            (EVENT_QUALIFIER_ASSIST_2ND, PassType.ASSIST_2ND),
+        ]
+    )
+}
+
+goalkeeper_action_types = {
+    EVENT_TYPE_SAVE: GoalkeeperActionType.SAVE,
+    EVENT_TYPE_CLAIM: GoalkeeperActionType.CLAIM,
+    EVENT_TYPE_PUNCH: GoalkeeperActionType.PUNCH,
+    EVENT_TYPE_KEEPER_PICK_UP: GoalkeeperActionType.PICK_UP,
+    EVENT_TYPE_SMOTHER: GoalkeeperActionType.SMOTHER,
+}
+
+shot_results = {
+    EVENT_TYPE_SHOT_MISS: ShotResult.OFF_TARGET,
+    EVENT_TYPE_SHOT_POST: ShotResult.OFF_TARGET,
+    EVENT_TYPE_SHOT_SAVED: ShotResult.SAVED,
+}
+
+shot_statistics = [
+    (EVENT_QUALIFIER_XG, ExpectedGoals),
+    (EVENT_QUALIFIER_POST_SHOT_XG, PostShotExpectedGoals),
+]
+
+
 def _parse_pass(
-    raw_event: OptaEvent, next_event: OptaEvent, next_next_event: OptaEvent
+    raw_event: OptaEvent,
+    next_event: OptaEvent,
+    next_next_event: OptaEvent,
+    parse_qualifiers: bool = True,
 ) -> Dict:
     if raw_event.outcome:
         result = PassResult.COMPLETE
     else:
         result = PassResult.INCOMPLETE
     receiver_coordinates = _get_end_coordinates(raw_event.qualifiers)
-    pass_qualifiers = _get_pass_qualifiers(raw_event.qualifiers)
-    overall_qualifiers = _get_event_qualifiers(raw_event.qualifiers)
-
-    qualifiers = pass_qualifiers + overall_qualifiers
+    qualifiers = (
+        _get_pass_qualifiers(raw_event.qualifiers)
+        + _get_event_qualifiers(raw_event.qualifiers)
+        if parse_qualifiers
+        else None
+    )
 
     # Set the end location of a deflected pass to the start location
     # of the next action and the outcome to "success" if the deflected
@@ -282,11 +419,15 @@ def _parse_pass(
     )
 
 
-def _parse_offside_pass(raw_event: OptaEvent) -> Dict:
-    pass_qualifiers = _get_pass_qualifiers(raw_event.qualifiers)
-    overall_qualifiers = _get_event_qualifiers(raw_event.qualifiers)
-
-    qualifiers = pass_qualifiers + overall_qualifiers
+def _parse_offside_pass(
+    raw_event: OptaEvent, parse_qualifiers: bool = True
+) -> Dict:
+    qualifiers = (
+        _get_pass_qualifiers(raw_event.qualifiers)
+        + _get_event_qualifiers(raw_event.qualifiers)
+        if parse_qualifiers
+        else None
+    )
 
     return dict(
         result=PassResult.OFFSIDE,
@@ -305,11 +446,17 @@ def _parse_take_on(raw_event: OptaEvent) -> Dict:
     return dict(result=result)
 
 
-def _parse_clearance(raw_event: OptaEvent) -> Dict:
-    return dict(qualifiers=_get_event_qualifiers(raw_event.qualifiers))
+def _parse_clearance(
+    raw_event: OptaEvent, parse_qualifiers: bool = True
+) -> Dict:
+    return dict(
+        qualifiers=_get_event_qualifiers(raw_event.qualifiers)
+        if parse_qualifiers
+        else None
+    )
 
 
-def _parse_card(raw_event: OptaEvent) -> Dict:
+def _parse_card(raw_event: OptaEvent, parse_qualifiers: bool = True) -> Dict:
     qualifiers = _get_event_qualifiers(raw_event.qualifiers)
 
     if EVENT_QUALIFIER_RED_CARD in qualifiers:
@@ -321,7 +468,11 @@ def _parse_card(raw_event: OptaEvent) -> Dict:
     else:
         card_type = None
 
-    return dict(result=None, qualifiers=qualifiers, card_type=card_type)
+    return dict(
+        result=None,
+        qualifiers=qualifiers if parse_qualifiers else None,
+        card_type=card_type,
+    )
 
 
 def _parse_lineup_qualifiers(raw_event: OptaEvent):
@@ -370,7 +521,11 @@ def _parse_substitution(next_event: OptaEvent, team: Team) -> Dict:
     return dict(replacement_player=replacement_player, position=position)
 
 
-def _parse_shot(raw_event: OptaEvent) -> Dict:
+def _parse_shot(
+    raw_event: OptaEvent,
+    parse_qualifiers: bool = True,
+    parse_statistics: bool = True,
+) -> Dict:
     coordinates = Point(x=raw_event.x, y=raw_event.y)
     if raw_event.type_id == EVENT_TYPE_SHOT_GOAL:
         if 28 in raw_event.qualifiers:
@@ -382,16 +537,14 @@ def _parse_shot(raw_event: OptaEvent) -> Dict:
             result = ShotResult.GOAL
     elif 82 in raw_event.qualifiers:
         result = ShotResult.BLOCKED
-    elif raw_event.type_id == EVENT_TYPE_SHOT_MISS:
-        result = ShotResult.OFF_TARGET
-    elif raw_event.type_id == EVENT_TYPE_SHOT_POST:
-        result = ShotResult.OFF_TARGET
-    elif raw_event.type_id == EVENT_TYPE_SHOT_SAVED:
-        result = ShotResult.SAVED
     else:
-        result = None
+        result = shot_results.get(raw_event.type_id)
 
-    qualifiers = _get_event_qualifiers(raw_event.qualifiers)
+    qualifiers = (
+        _get_event_qualifiers(raw_event.qualifiers)
+        if parse_qualifiers
+        else None
+    )
     result_coordinates = _get_end_coordinates(
         raw_event.qualifiers, start_coordinates=coordinates
     )
@@ -409,11 +562,13 @@ def _parse_shot(raw_event: OptaEvent) -> Dict:
             )
 
     statistics = []
-    if 321 in raw_event.qualifiers:
-        xg_value = float(raw_event.qualifiers[321])
-        statistics.append(ExpectedGoals(value=xg_value))
+    if parse_statistics:
+        for event_qualifier, statistic in shot_statistics:
+            xg_value = raw_event.qualifiers.get(event_qualifier)
+            if xg_value:
+                statistics.append(statistic(value=float(xg_value)))
 
-    event_info = dict(
+    return dict(
         coordinates=coordinates,
         result=result,
         result_coordinates=result_coordinates,
@@ -421,22 +576,13 @@ def _parse_shot(raw_event: OptaEvent) -> Dict:
         statistics=statistics,
     )
 
-    statistics = []
-    for event_qualifier, statistic in zip(
-        [EVENT_QUALIFIER_XG, EVENT_QUALIFIER_POST_SHOT_XG],
-        [ExpectedGoals, PostShotExpectedGoals],
-    ):
-        xg_value = raw_event.qualifiers.get(event_qualifier)
-        if xg_value:
-            statistics.append(statistic(value=float(xg_value)))
-
-    if statistics:
-        event_info["statistics"] = statistics
-
-    return event_info
 
+def _parse_goalkeeper_events(
+    raw_event: OptaEvent, parse_qualifiers: bool = True
+) -> Dict:
+    if not parse_qualifiers:
+        return dict(result=None, qualifiers=None)
 
-def _parse_goalkeeper_events(raw_event: OptaEvent) -> Dict:
     qualifiers = _get_event_qualifiers(raw_event.qualifiers)
     goalkeeper_qualifiers = _get_goalkeeper_qualifiers(raw_event.type_id)
     qualifiers.extend(goalkeeper_qualifiers)
@@ -444,7 +590,7 @@ def _parse_goalkeeper_events(raw_event: OptaEvent) -> Dict:
     return dict(result=None, qualifiers=qualifiers)
 
 
-def _parse_duel(raw_event: OptaEvent) -> Dict:
+def _get_duel_qualifiers(raw_event: OptaEvent) -> List[Qualifier]:
     qualifiers = _get_event_qualifiers(raw_event.qualifiers)
     if raw_event.type_id == EVENT_TYPE_TACKLE:
         qualifiers.extend([DuelQualifier(value=DuelType.GROUND)])
@@ -462,19 +608,31 @@ def _parse_duel(raw_event: OptaEvent) -> Dict:
                 DuelQualifier(value=DuelType.GROUND),
             ]
         )
+    return qualifiers
+
 
+def _parse_duel(raw_event: OptaEvent, parse_qualifiers: bool = True) -> Dict:
     result = DuelResult.WON if raw_event.outcome == 1 else DuelResult.LOST
 
     return dict(
         result=result,
-        qualifiers=qualifiers,
+        qualifiers=_get_duel_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
     )
 
 
 def _parse_interception(
-    raw_event: OptaEvent, team: Team, next_event: OptaEvent
+    raw_event: OptaEvent,
+    team: Team,
+    next_event: OptaEvent,
+    parse_qualifiers: bool = True,
 ) -> Dict:
-    qualifiers = _get_event_qualifiers(raw_event.qualifiers)
+    qualifiers = (
+        _get_event_qualifiers(raw_event.qualifiers)
+        if parse_qualifiers
+        else None
+    )
     result = InterceptionResult.SUCCESS
 
     if next_event is not None:
@@ -534,31 +692,30 @@ def _get_end_coordinates(
 
 
 def _get_event_qualifiers(raw_qualifiers: Dict[int, str]) -> List[Qualifier]:
-    qualifiers = []
-    qualifiers.extend(_get_event_setpiece_qualifiers(raw_qualifiers))
-    qualifiers.extend(_get_event_bodypart_qualifiers(raw_qualifiers))
-    qualifiers.extend(_get_event_card_qualifiers(raw_qualifiers))
-    qualifiers.extend(_get_event_counter_attack_qualifiers(raw_qualifiers))
-    return qualifiers
+    selected = {}
+    for qualifier_id in raw_qualifiers:
+        entry = event_qualifier_table.get(qualifier_id)
+        if entry is None:
+            continue
+        group, priority, qualifier_cls, value = entry
+        if group not in selected or priority < selected[group][0]:
+            selected[group] = (priority, qualifier_cls, value)
+
+    return [
+        qualifier_cls(value=value)
+        for _, (_, qualifier_cls, value) in sorted(selected.items())
+    ]
 
 
 def _get_pass_qualifiers(raw_qualifiers: Dict[int, str]) -> List[Qualifier]:
-    qualifiers = []
-    pass_qualifier_mapping = {
-        EVENT_QUALIFIER_CROSS: PassType.CROSS,
-        EVENT_QUALIFIER_LONG_BALL: PassType.LONG_BALL,
-        EVENT_QUALIFIER_CHIPPED_BALL: PassType.CHIPPED_PASS,
-        EVENT_QUALIFIER_THROUGH_BALL: PassType.THROUGH_BALL,
-        EVENT_QUALIFIER_LAUNCH: PassType.LAUNCH,
-        EVENT_QUALIFIER_FLICK_ON: PassType.FLICK_ON,
-        EVENT_QUALIFIER_ASSIST_2ND: PassType.ASSIST_2ND,
-    }
-    for (
-        sp_pass_qualifier,
-        pass_qualifier_value,
-    ) in pass_qualifier_mapping.items():
-        if sp_pass_qualifier in raw_qualifiers:
-            qualifiers.append(PassQualifier(value=pass_qualifier_value))
+    pass_types = sorted(
+        pass_qualifier_table[qualifier_id]
+        for qualifier_id in raw_qualifiers
+        if qualifier_id in pass_qualifier_table
+    )
+    qualifiers = [
+        PassQualifier(value=pass_type) for _, pass_type in pass_types
+    ]
 
     if EVENT_QUALIFIER_SHOT_ASSIST in raw_qualifiers:
         # Qualifier '210' defines that the pass was an assist for a shot
@@ -573,89 +730,11 @@ def _get_pass_qualifiers(raw_qualifiers: Dict[int, str]) -> List[Qualifier]:
     return qualifiers
 
 
-def _get_event_setpiece_qualifiers(
-    raw_qualifiers: Dict[int, str]
-) -> List[Qualifier]:
-    qualifiers = []
-    if EVENT_QUALIFIER_CORNER_KICK in raw_qualifiers:
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.CORNER_KICK))
-    elif (
-        EVENT_QUALIFIER_FREE_KICK in raw_qualifiers
-        or EVENT_QUALIFIER_FREE_KICK_SHOT in raw_qualifiers
-    ):
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.FREE_KICK))
-    elif EVENT_QUALIFIER_PENALTY in raw_qualifiers:
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.PENALTY))
-    elif EVENT_QUALIFIER_THROW_IN in raw_qualifiers:
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.THROW_IN))
-    elif EVENT_QUALIFIER_KICK_OFF in raw_qualifiers:
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.KICK_OFF))
-    elif EVENT_QUALIFIER_GOAL_KICK in raw_qualifiers:
-        qualifiers.append(SetPieceQualifier(value=SetPieceType.GOAL_KICK))
-    return qualifiers
-
-
-def _get_event_bodypart_qualifiers(
-    raw_qualifiers: Dict[int, str]
-) -> List[Qualifier]:
-    qualifiers = []
-    if EVENT_QUALIFIER_HEAD_PASS in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.HEAD))
-    elif EVENT_QUALIFIER_HEAD in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.HEAD))
-    elif EVENT_QUALIFIER_FLICK_ON in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.HEAD))
-    elif EVENT_QUALIFIER_LEFT_FOOT in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.LEFT_FOOT))
-    elif EVENT_QUALIFIER_RIGHT_FOOT in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.RIGHT_FOOT))
-    elif EVENT_QUALIFIER_OTHER_BODYPART in raw_qualifiers:
-        qualifiers.append(BodyPartQualifier(value=BodyPart.OTHER))
-    return qualifiers
-
-
-def _get_event_card_qualifiers(
-    raw_qualifiers: Dict[int, str]
-) -> List[Qualifier]:
-    qualifiers = []
-    if EVENT_QUALIFIER_RED_CARD in raw_qualifiers:
-        qualifiers.append(CardQualifier(value=CardType.RED))
-    elif EVENT_QUALIFIER_FIRST_YELLOW_CARD in raw_qualifiers:
-        qualifiers.append(CardQualifier(value=CardType.FIRST_YELLOW))
-    elif EVENT_QUALIFIER_SECOND_YELLOW_CARD in raw_qualifiers:
-        qualifiers.append(CardQualifier(value=CardType.SECOND_YELLOW))
-
-    return qualifiers
-
-
 def _get_goalkeeper_qualifiers(type_id: int) -> List[Qualifier]:
-    qualifiers = []
-    goalkeeper_qualifier = None
-    if type_id == EVENT_TYPE_SAVE:
-        goalkeeper_qualifier = GoalkeeperActionType.SAVE
-    elif type_id == EVENT_TYPE_CLAIM:
-        goalkeeper_qualifier = GoalkeeperActionType.CLAIM
-    elif type_id == EVENT_TYPE_PUNCH:
-        goalkeeper_qualifier = GoalkeeperActionType.PUNCH
-    elif type_id == EVENT_TYPE_KEEPER_PICK_UP:
-        goalkeeper_qualifier = GoalkeeperActionType.PICK_UP
-    elif type_id == EVENT_TYPE_SMOTHER:
-        goalkeeper_qualifier = GoalkeeperActionType.SMOTHER
-
-    if goalkeeper_qualifier:
-        qualifiers.append(GoalkeeperQualifier(value=goalkeeper_qualifier))
-
-    return qualifiers
-
-
-def _get_event_counter_attack_qualifiers(
-    raw_qualifiers: Dict[int, str],
-) -> List[Qualifier]:
-    qualifiers = []
-    if EVENT_QUALIFIER_COUNTER_ATTACK in raw_qualifiers:
-        qualifiers.append(CounterAttackQualifier(True))
-
-    return qualifiers
+    goalkeeper_action_type = goalkeeper_action_types.get(type_id)
+    if goalkeeper_action_type:
+        return [GoalkeeperQualifier(value=goalkeeper_action_type)]
+    return []
 
 
 def _get_event_type_name(type_id: int) -> str:
@@ -706,6 +785,9 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
 
             possession_team = None
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
+            parse_statistics = self.should_parse_field("statistics")
+            keep_raw_events = self.should_parse_field("raw_event")
             for idx, raw_event in enumerate(raw_events):
                 if raw_event.contestant_id == teams[0].team_id:
                     team = teams[0]
@@ -773,6 +855,16 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                     if raw_event.type_id in BALL_OWNING_EVENTS:
                         possession_team = team
 
+                    # Skip raw events that cannot result in any of the
+                    # requested event types. The possession tracking above
+                    # still has to see every event.
+                    if not self.should_parse_event_types(
+                        event_type_candidates.get(
+                            raw_event.type_id, (EventType.GENERIC,)
+                        )
+                    ):
+                        continue
+
                     if raw_event.type_id in DEAD_BALL_EVENTS:
                         ball_state = BallState.DEAD
                     else:
@@ -789,19 +881,24 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                         team=team,
                         player=player,
                         coordinates=Point(x=raw_event.x, y=raw_event.y),
-                        raw_event=raw_event,
+                        raw_event=raw_event if keep_raw_events else None,
                     )
 
                     if raw_event.type_id == EVENT_TYPE_PASS:
                         pass_event_kwargs = _parse_pass(
-                            raw_event, next_event, next_next_event
+                            raw_event,
+                            next_event,
+                            next_next_event,
+                            parse_qualifiers,
                         )
                         event = self.event_factory.build_pass(
                             **pass_event_kwargs,
                             **generic_event_kwargs,
                         )
                     elif raw_event.type_id == EVENT_TYPE_OFFSIDE_PASS:
-                        pass_event_kwargs = _parse_offside_pass(raw_event)
+                        pass_event_kwargs = _parse_offside_pass(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_pass(
                             **pass_event_kwargs,
                             **generic_event_kwargs,
@@ -835,7 +932,9 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                                     aware_datetime.astimezone(pytz.utc)
                                     - period.start_timestamp
                                 )
-                        shot_event_kwargs = _parse_shot(raw_event)
+                        shot_event_kwargs = _parse_shot(
+                            raw_event, parse_qualifiers, parse_statistics
+                        )
                         kwargs = {}
                         kwargs.update(generic_event_kwargs)
                         kwargs.update(shot_event_kwargs)
@@ -847,14 +946,18 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                             **generic_event_kwargs,
                         )
                     elif raw_event.type_id == EVENT_TYPE_CLEARANCE:
-                        clearance_event_kwargs = _parse_clearance(raw_event)
+                        clearance_event_kwargs = _parse_clearance(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_clearance(
                             result=None,
                             **clearance_event_kwargs,
                             **generic_event_kwargs,
                         )
                     elif raw_event.type_id in DUEL_EVENTS:
-                        duel_event_kwargs = _parse_duel(raw_event)
+                        duel_event_kwargs = _parse_duel(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_duel(
                             **duel_event_kwargs,
                             **generic_event_kwargs,
@@ -864,7 +967,7 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                         EVENT_TYPE_BLOCKED_PASS,
                     ):
                         interception_event_kwargs = _parse_interception(
-                            raw_event, team, next_event
+                            raw_event, team, next_event, parse_qualifiers
                         )
                         event = self.event_factory.build_interception(
                             **interception_event_kwargs,
@@ -881,7 +984,7 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                             )
                         else:
                             goalkeeper_event_kwargs = _parse_goalkeeper_events(
-                                raw_event
+                                raw_event, parse_qualifiers
                             )
                             event = self.event_factory.build_goalkeeper_event(
                                 **goalkeeper_event_kwargs,
@@ -937,7 +1040,9 @@ class StatsPerformDeserializer(EventDataDeserializer[StatsPerformInputs]):
                         )
 
                     elif raw_event.type_id == EVENT_TYPE_CARD:
-                        card_event_kwargs = _parse_card(raw_event)
+                        card_event_kwargs = _parse_card(
+                            raw_event, parse_qualifiers
+                        )
 
                         event = self.event_factory.build_card(
                             **card_event_kwargs,
@@ -7,7 +7,7 @@ extract data about players, teams and events that is encoded in the file.
 import json
 from typing import Tuple, List, Optional, IO, Dict
 
-from lxml import objectify
+from lxml import etree, objectify
 
 from kloppy.domain import Team, Score, Period, PositionType
 
@@ -109,3 +109,50 @@ class OptaXMLParser(OptaParser):
 
     def __init__(self, feed: IO[bytes]) -> None:
         self.root = objectify.fromstring(feed.read())
+
+
+class OptaXMLIterParser(OptaParser):
+    """Extract data from an Opta XML data stream without building a tree.
+
+    The feed is parsed incrementally with `etree.iterparse`. Each event
+    element is converted to an `OptaEvent` as soon as it is complete and is
+    cleared afterwards, so the memory usage does not grow with the size of
+    the XML document.
+
+    Args:
+        feed : The data stream of a game to parse.
+
+    Attributes:
+        attributes : The attributes of the `metadata_tags` elements.
+        events : The parsed events.
+    """
+
+    event_tag: str
+    metadata_tags: Tuple[str, ...] = ()
+
+    def __init__(self, feed: IO[bytes]) -> None:
+        self.attributes: Dict[str, Dict[str, str]] = {}
+        self.events: List[OptaEvent] = []
+
+        for action, elm in etree.iterparse(
+            feed,
+            events=("start", "end"),
+            tag=(self.event_tag,) + self.metadata_tags,
+        ):
+            if elm.tag != self.event_tag:
+                if action == "start":
+                    self.attributes[elm.tag] = dict(elm.attrib)
+                continue
+            if action == "end":
+                self.events.append(self._parse_event(elm))
+                # Free the memory of the processed elements
+                elm.clear()
+                while elm.getprevious() is not None:
+                    del elm.getparent()[0]
+
+    def _parse_event(self, elm: etree._Element) -> OptaEvent:
+        """Convert a complete event element to an `OptaEvent`."""
+        raise NotImplementedError
+
+    def extract_events(self) -> List[OptaEvent]:
+        return self.events
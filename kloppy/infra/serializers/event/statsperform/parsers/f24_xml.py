@@ -1,11 +1,11 @@
 """XML parser for Opta F24 feeds."""
 
 from datetime import datetime
-from typing import List, Optional
+from typing import Optional
 
 import pytz
 
-from .base import OptaEvent, OptaXMLParser
+from .base import OptaEvent, OptaXMLIterParser
 
 
 def _parse_f24_datetime(dt_str: str) -> datetime:
@@ -22,46 +22,40 @@ def _parse_f24_datetime(dt_str: str) -> datetime:
     return aware_datetime.astimezone(pytz.utc)
 
 
-class F24XMLParser(OptaXMLParser):
+class F24XMLParser(OptaXMLIterParser):
     """Extract data from a Opta F24 data stream."""
 
-    def extract_events(self) -> List[OptaEvent]:
-        game_elm = self.root.find("Game")
-        return [
-            OptaEvent(
-                id=event.attrib["id"],
-                event_id=int(event.attrib["event_id"]),
-                type_id=int(event.attrib["type_id"]),
-                period_id=int(event.attrib["period_id"]),
-                time_min=int(event.attrib["min"]),
-                time_sec=int(event.attrib["sec"]),
-                x=float(event.attrib["x"]),
-                y=float(event.attrib["y"]),
-                timestamp=_parse_f24_datetime(event.attrib["timestamp"]),
-                last_modified=_parse_f24_datetime(
-                    event.attrib["last_modified"]
-                ),
-                contestant_id=event.attrib.get("team_id"),
-                player_id=event.attrib.get("player_id"),
-                outcome=int(event.attrib["outcome"])
-                if "outcome" in event.attrib
-                else None,
-                qualifiers={
-                    int(
-                        qualifier.attrib["qualifier_id"]
-                    ): qualifier.attrib.get("value")
-                    for qualifier in event.iterchildren("Q")
-                },
-            )
-            for event in game_elm.iterchildren("Event")
-        ]
+    event_tag = "Event"
+    metadata_tags = ("Game",)
+
+    def _parse_event(self, elm) -> OptaEvent:
+        attrib = elm.attrib
+        return OptaEvent(
+            id=attrib["id"],
+            event_id=int(attrib["event_id"]),
+            type_id=int(attrib["type_id"]),
+            period_id=int(attrib["period_id"]),
+            time_min=int(attrib["min"]),
+            time_sec=int(attrib["sec"]),
+            x=float(attrib["x"]),
+            y=float(attrib["y"]),
+            timestamp=_parse_f24_datetime(attrib["timestamp"]),
+            last_modified=_parse_f24_datetime(attrib["last_modified"]),
+            contestant_id=attrib.get("team_id"),
+            player_id=attrib.get("player_id"),
+            outcome=int(attrib["outcome"]) if "outcome" in attrib else None,
+            qualifiers={
+                int(qualifier.get("qualifier_id")): qualifier.get("value")
+                for qualifier in elm.iterchildren("Q")
+            },
+        )
 
     def extract_date(self) -> Optional[datetime]:
         """Return the date of the game."""
-        game_elm = self.root.find("Game")
-        if game_elm is not None and "game_date" in game_elm.attrib:
+        game_attrib = self.attributes.get("Game", {})
+        if "game_date" in game_attrib:
             naive_datetime = datetime.strptime(
-                game_elm.attrib["game_date"], "%Y-%m-%dT%H:%M:%S"
+                game_attrib["game_date"], "%Y-%m-%dT%H:%M:%S"
             )
             timezone = pytz.timezone("Europe/London")
             aware_datetime = timezone.localize(naive_datetime)
@@ -71,16 +65,8 @@ class F24XMLParser(OptaXMLParser):
 
     def extract_game_week(self) -> Optional[str]:
         """Return the game_week of the game."""
-        game_elm = self.root.find("Game")
-        if game_elm is not None and "matchday" in game_elm.attrib:
-            return game_elm.attrib["matchday"]
-        else:
-            return None
+        return self.attributes.get("Game", {}).get("matchday")
 
     def extract_game_id(self) -> Optional[str]:
         """Return the game_id of the game."""
-        game_elm = self.root.find("Game")
-        if game_elm is not None and "id" in game_elm.attrib:
-            return game_elm.attrib["id"]
-        else:
-            return None
+        return self.attributes.get("Game", {}).get("id")
@@ -1,9 +1,8 @@
 """XML parser for Stats Perform MA3 feeds."""
 
 from datetime import datetime, timezone
-from typing import List
 
-from .base import OptaXMLParser, OptaEvent
+from .base import OptaXMLIterParser, OptaEvent
 
 
 def _parse_ma3_datetime(dt_str: str) -> datetime:
@@ -17,36 +16,29 @@ def _parse_ma3_datetime(dt_str: str) -> datetime:
         )
 
 
-class MA3XMLParser(OptaXMLParser):
+class MA3XMLParser(OptaXMLIterParser):
     """Extract data from a Stats Perform MA3 data stream."""
 
-    def extract_events(self) -> List[OptaEvent]:
-        live_data = self.root.liveData
-        return [
-            OptaEvent(
-                id=event.attrib["id"],
-                event_id=int(event.attrib["eventId"]),
-                type_id=int(event.attrib["typeId"]),
-                period_id=int(event.attrib["periodId"]),
-                time_min=int(event.attrib["timeMin"]),
-                time_sec=int(event.attrib["timeSec"]),
-                x=float(event.attrib["x"]),
-                y=float(event.attrib["y"]),
-                timestamp=_parse_ma3_datetime(event.attrib["timeStamp"]),
-                last_modified=_parse_ma3_datetime(
-                    event.attrib["lastModified"]
-                ),
-                contestant_id=event.attrib.get("contestantId"),
-                player_id=event.attrib.get("playerId"),
-                outcome=int(event.attrib["outcome"])
-                if "outcome" in event.attrib
-                else None,
-                qualifiers={
-                    int(qualifier.attrib["qualifierId"]): qualifier.attrib.get(
-                        "value"
-                    )
-                    for qualifier in event.iterchildren("qualifier")
-                },
-            )
-            for event in live_data.events.iterchildren("event")
-        ]
+    event_tag = "event"
+
+    def _parse_event(self, elm) -> OptaEvent:
+        attrib = elm.attrib
+        return OptaEvent(
+            id=attrib["id"],
+            event_id=int(attrib["eventId"]),
+            type_id=int(attrib["typeId"]),
+            period_id=int(attrib["periodId"]),
+            time_min=int(attrib["timeMin"]),
+            time_sec=int(attrib["timeSec"]),
+            x=float(attrib["x"]),
+            y=float(attrib["y"]),
+            timestamp=_parse_ma3_datetime(attrib["timeStamp"]),
+            last_modified=_parse_ma3_datetime(attrib["lastModified"]),
+            contestant_id=attrib.get("contestantId"),
+            player_id=attrib.get("playerId"),
+            outcome=int(attrib["outcome"]) if "outcome" in attrib else None,
+            qualifiers={
+                int(qualifier.get("qualifierId")): qualifier.get("value")
+                for qualifier in elm.iterchildren("qualifier")
+            },
+        )
@@ -1,4 +1,3 @@
-import json
 import logging
 from dataclasses import replace
 from datetime import timedelta
@@ -34,9 +33,10 @@ from kloppy.domain import (
     ShotResult,
     Team,
 )
-from kloppy.utils import performance_logging
+from kloppy.utils import iter_with_neighbours, performance_logging
 
 from . import wyscout_events, wyscout_tags
+from .helpers import load_match
 from ..deserializer import EventDataDeserializer
 
 logger = logging.getLogger(__name__)
@@ -45,10 +45,10 @@ logger = logging.getLogger(__name__)
 INVALID_PLAYER = "0"
 
 
-def _parse_team(raw_events, wyId: str, ground: Ground) -> Team:
+def _parse_team(match, wyId: str, ground: Ground) -> Team:
     team = Team(
         team_id=wyId,
-        name=raw_events["teams"][wyId]["team"]["officialName"],
+        name=match["teams"][wyId]["team"]["officialName"],
         ground=ground,
     )
     team.players = [
@@ -59,7 +59,7 @@ def _parse_team(raw_events, wyId: str, ground: Ground) -> Team:
             first_name=player["player"]["firstName"],
             last_name=player["player"]["lastName"],
         )
-        for player in raw_events["players"][wyId]
+        for player in match["players"][wyId]
     ]
     return team
 
@@ -168,10 +168,24 @@ def _create_shot_result_coordinates(raw_event: Dict) -> Optional[Point]:
     return None
 
 
-def _parse_shot(raw_event: Dict, next_event: Dict) -> Dict:
+def _shot_qualifiers(raw_event: Dict, next_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
     qualifiers.extend(_bodypart_qualifiers(raw_event))
 
+    if next_event["eventId"] == wyscout_events.SAVE.EVENT:
+        if next_event["subEventId"] == wyscout_events.SAVE.REFLEXES:
+            qualifiers.append(GoalkeeperQualifier(GoalkeeperActionType.REFLEX))
+        if next_event["subEventId"] == wyscout_events.SAVE.SAVE_ATTEMPT:
+            qualifiers.append(
+                GoalkeeperQualifier(GoalkeeperActionType.SAVE_ATTEMPT)
+            )
+
+    return qualifiers
+
+
+def _parse_shot(
+    raw_event: Dict, next_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
     result = None
     if _has_tag(raw_event, 101):
         result = ShotResult.GOAL
@@ -184,18 +198,12 @@ def _parse_shot(raw_event: Dict, next_event: Dict) -> Dict:
     elif any(_has_tag(raw_event, tag) for tag in wyscout_tags.SHOT_ON_GOAL):
         result = ShotResult.SAVED
 
-    if next_event["eventId"] == wyscout_events.SAVE.EVENT:
-        if next_event["subEventId"] == wyscout_events.SAVE.REFLEXES:
-            qualifiers.append(GoalkeeperQualifier(GoalkeeperActionType.REFLEX))
-        if next_event["subEventId"] == wyscout_events.SAVE.SAVE_ATTEMPT:
-            qualifiers.append(
-                GoalkeeperQualifier(GoalkeeperActionType.SAVE_ATTEMPT)
-            )
-
     return {
         "result": result,
         "result_coordinates": _create_shot_result_coordinates(raw_event),
-        "qualifiers": qualifiers,
+        "qualifiers": _shot_qualifiers(raw_event, next_event)
+        if parse_qualifiers
+        else None,
     }
 
 
@@ -233,7 +241,9 @@ def _pass_qualifiers(raw_event) -> List[Qualifier]:
     return qualifiers
 
 
-def _parse_pass(raw_event: Dict, next_event: Dict) -> Dict:
+def _parse_pass(
+    raw_event: Dict, next_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
     pass_result = None
     if _has_tag(raw_event, wyscout_tags.ACCURATE):
         pass_result = PassResult.COMPLETE
@@ -266,19 +276,21 @@ def _parse_pass(raw_event: Dict, next_event: Dict) -> Dict:
 
     return {
         "result": pass_result,
-        "qualifiers": _pass_qualifiers(raw_event),
+        "qualifiers": _pass_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
         "receive_timestamp": None,
         "receiver_player": None,
         "receiver_coordinates": receiver_coordinates,
     }
 
 
-def _parse_clearance(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_clearance(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {"result": None, "qualifiers": qualifiers}
 
 
-def _parse_goalkeeper_save(raw_event) -> List[Qualifier]:
+def _goalkeeper_save_qualifiers(raw_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
     goalkeeper_qualifiers = []
     if not _has_tag(raw_event, wyscout_tags.GOAL):
@@ -294,9 +306,17 @@ def _parse_goalkeeper_save(raw_event) -> List[Qualifier]:
             GoalkeeperQualifier(value=GoalkeeperActionType.REFLEX)
         )
     qualifiers.extend(goalkeeper_qualifiers)
+    return qualifiers
+
+
+def _parse_goalkeeper_save(
+    raw_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
     return {
         "result": None,
-        "qualifiers": qualifiers,
+        "qualifiers": _goalkeeper_save_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
         # start coordinates are stored as inverted end coordinates
         "coordinates": Point(
             x=100.0 - float(raw_event["positions"][1]["x"]),
@@ -305,7 +325,7 @@ def _parse_goalkeeper_save(raw_event) -> List[Qualifier]:
     }
 
 
-def _parse_foul(raw_event: Dict) -> Dict:
+def _foul_qualifiers(raw_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
 
     if _has_tag(raw_event, wyscout_tags.RED_CARD):
@@ -315,14 +335,20 @@ def _parse_foul(raw_event: Dict) -> Dict:
     elif _has_tag(raw_event, wyscout_tags.SECOND_YELLOW_CARD):
         qualifiers.append(CardQualifier(value=CardType.SECOND_YELLOW))
 
+    return qualifiers
+
+
+def _parse_foul(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
     return {
         "result": None,
-        "qualifiers": qualifiers,
+        "qualifiers": _foul_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
     }
 
 
-def _parse_card(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_card(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     card_type = None
     if _has_tag(raw_event, wyscout_tags.RED_CARD):
         card_type = CardType.RED
@@ -334,60 +360,64 @@ def _parse_card(raw_event: Dict) -> Dict:
     return {"result": None, "qualifiers": qualifiers, "card_type": card_type}
 
 
-def _parse_recovery(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_recovery(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {
         "result": None,
         "qualifiers": qualifiers,
     }
 
 
-def _parse_ball_out(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_ball_out(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {"result": None, "qualifiers": qualifiers}
 
 
-def _parse_set_piece(raw_event: Dict, next_event: Dict) -> Dict:
+def _set_piece_qualifiers(raw_event: Dict) -> List[Qualifier]:
+    sub_event_id = raw_event["subEventId"]
+    if sub_event_id == wyscout_events.FREE_KICK.GOAL_KICK:
+        return [SetPieceQualifier(SetPieceType.GOAL_KICK)]
+    elif sub_event_id == wyscout_events.FREE_KICK.THROW_IN:
+        return [
+            SetPieceQualifier(SetPieceType.THROW_IN),
+            PassQualifier(PassType.HAND_PASS),
+        ]
+    elif sub_event_id in [
+        wyscout_events.FREE_KICK.FREE_KICK,
+        wyscout_events.FREE_KICK.FREE_KICK_CROSS,
+        wyscout_events.FREE_KICK.FREE_KICK_SHOT,
+    ]:
+        return [SetPieceQualifier(SetPieceType.FREE_KICK)]
+    elif sub_event_id == wyscout_events.FREE_KICK.CORNER:
+        return [SetPieceQualifier(SetPieceType.CORNER_KICK)]
+    elif sub_event_id == wyscout_events.FREE_KICK.PENALTY:
+        return [SetPieceQualifier(SetPieceType.PENALTY)]
+    return []
+
+
+def _parse_set_piece(
+    raw_event: Dict, next_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
     result = {}
     if raw_event["subEventId"] in wyscout_events.FREE_KICK.PASS_TYPES:
-        result = _parse_pass(raw_event, next_event)
-        if raw_event["subEventId"] == wyscout_events.FREE_KICK.GOAL_KICK:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.GOAL_KICK)
-            )
-        elif raw_event["subEventId"] == wyscout_events.FREE_KICK.THROW_IN:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.THROW_IN)
-            )
-            result["qualifiers"].append(PassQualifier(PassType.HAND_PASS))
-        elif raw_event["subEventId"] in [
-            wyscout_events.FREE_KICK.FREE_KICK,
-            wyscout_events.FREE_KICK.FREE_KICK_CROSS,
-        ]:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.FREE_KICK)
-            )
-        elif raw_event["subEventId"] == wyscout_events.FREE_KICK.CORNER:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.CORNER_KICK)
-            )
+        result = _parse_pass(raw_event, next_event, parse_qualifiers)
     elif raw_event["subEventId"] in wyscout_events.FREE_KICK.SHOT_TYPES:
-        result = _parse_shot(raw_event, next_event)
-        if raw_event["subEventId"] == wyscout_events.FREE_KICK.FREE_KICK_SHOT:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.FREE_KICK)
-            )
-        elif raw_event["subEventId"] == wyscout_events.FREE_KICK.PENALTY:
-            result["qualifiers"].append(
-                SetPieceQualifier(SetPieceType.PENALTY)
-            )
-    else:
+        result = _parse_shot(raw_event, next_event, parse_qualifiers)
+    elif parse_qualifiers:
         result["qualifiers"] = _generic_qualifiers(raw_event)
+        return result
+
+    if parse_qualifiers:
+        result["qualifiers"].extend(_set_piece_qualifiers(raw_event))
+    else:
+        result["qualifiers"] = None
     return result
 
 
-def _parse_interception(raw_event: Dict, next_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_interception(
+    raw_event: Dict, next_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     result = InterceptionResult.SUCCESS
     ball_owning_events = (
         wyscout_events.PASS.EVENT,
@@ -418,7 +448,7 @@ def _parse_interception(raw_event: Dict, next_event: Dict) -> Dict:
     }
 
 
-def _parse_duel(raw_event: Dict) -> Dict:
+def _duel_qualifiers(raw_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
     duel_qualifiers = []
 
@@ -448,7 +478,10 @@ def _parse_duel(raw_event: Dict) -> Dict:
         duel_qualifiers.extend([DuelQualifier(value=DuelType.SLIDING_TACKLE)])
 
     qualifiers.extend(duel_qualifiers)
+    return qualifiers
 
+
+def _parse_duel(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
     result = None
     if _has_tag(raw_event, wyscout_tags.WON):
         result = DuelResult.WON
@@ -457,7 +490,47 @@ def _parse_duel(raw_event: Dict) -> Dict:
     elif _has_tag(raw_event, wyscout_tags.NEUTRAL):
         result = DuelResult.NEUTRAL
 
-    return {"result": result, "qualifiers": qualifiers}
+    return {
+        "result": result,
+        "qualifiers": _duel_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
+    }
+
+
+# The kloppy event types a raw event can be deserialized into. All other
+# raw events result in a generic event.
+event_type_candidates = {
+    wyscout_events.SHOT.EVENT: (EventType.SHOT,),
+    wyscout_events.PASS.EVENT: (EventType.PASS,),
+    wyscout_events.FOUL.EVENT: (EventType.FOUL_COMMITTED, EventType.CARD),
+    wyscout_events.INTERRUPTION.EVENT: (EventType.BALL_OUT,),
+    wyscout_events.SAVE.EVENT: (EventType.GOALKEEPER,),
+    wyscout_events.FREE_KICK.EVENT: (EventType.PASS, EventType.SHOT),
+    wyscout_events.OTHERS_ON_BALL.EVENT: (
+        EventType.CLEARANCE,
+        EventType.MISCONTROL,
+        EventType.RECOVERY,
+    ),
+    wyscout_events.DUEL.EVENT: (EventType.DUEL,),
+    wyscout_events.OFFSIDE.EVENT: (),
+}
+
+
+def _get_event_type_candidates(raw_event: Dict) -> List[EventType]:
+    event_types = list(
+        event_type_candidates.get(raw_event["eventId"], (EventType.GENERIC,))
+    )
+    if _has_tag(raw_event, wyscout_tags.INTERCEPTION):
+        event_types.append(EventType.INTERCEPTION)
+    return event_types
+
+
+def _normalize_event_ids(raw_event: Dict):
+    if "eventId" not in raw_event:
+        raw_event["eventId"] = raw_event["eventName"]
+    if "subEventId" not in raw_event:
+        raw_event["subEventId"] = raw_event.get("subEventName")
 
 
 def _players_to_dict(players: List[Player]):
@@ -477,35 +550,43 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
-            for event in raw_events["events"]:
-                if "eventId" not in event:
-                    event["eventId"] = event["eventName"]
-                if "subEventId" not in event:
-                    event["subEventId"] = event.get("subEventName")
+            # The events are decoded one at a time while they are parsed
+            match, raw_events = load_match(
+                inputs.event_data, required_keys=["teams", "players"]
+            )
 
         periods = []
 
         with performance_logging("parse data", logger=logger):
-            home_team_id, away_team_id = raw_events["teams"].keys()
-            home_team = _parse_team(raw_events, home_team_id, Ground.HOME)
-            away_team = _parse_team(raw_events, away_team_id, Ground.AWAY)
+            home_team_id, away_team_id = match["teams"].keys()
+            home_team = _parse_team(match, home_team_id, Ground.HOME)
+            away_team = _parse_team(match, away_team_id, Ground.AWAY)
             teams = {home_team_id: home_team, away_team_id: away_team}
             players = {
                 wyId: _players_to_dict(team.players)
                 for wyId, team in teams.items()
             }
-            game_id = raw_events["events"][0].get("matchId", None)
-            if game_id:
-                game_id = str(game_id)
+            game_id = None
 
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
+            keep_raw_events = self.should_parse_field("raw_event")
+            # raw event of the last included event, used to match
+            # interceptions with the previous duel
+            last_raw_event = None
+
+            for prev_event, raw_event, next_event in iter_with_neighbours(
+                raw_events
+            ):
+                if prev_event is None:
+                    game_id = raw_event.get("matchId", None)
+                    if game_id:
+                        game_id = str(game_id)
 
-            for idx, raw_event in enumerate(raw_events["events"]):
-                next_event = None
+                _normalize_event_ids(raw_event)
                 next_period_id = None
-                if (idx + 1) < len(raw_events["events"]):
-                    next_event = raw_events["events"][idx + 1]
+                if next_event is not None:
+                    _normalize_event_ids(next_event)
                     next_period_id = int(
                         next_event["matchPeriod"].replace("H", "")
                     )
@@ -531,6 +612,11 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                         + timedelta(seconds=raw_event["eventSec"]),
                     )
 
+                if not self.should_parse_event_types(
+                    _get_event_type_candidates(raw_event)
+                ):
+                    continue
+
                 generic_event_args = {
                     "event_id": str(raw_event["id"]),
                     "raw_event": raw_event,
@@ -550,19 +636,23 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
 
                 new_events = []
                 if raw_event["eventId"] == wyscout_events.SHOT.EVENT:
-                    shot_event_args = _parse_shot(raw_event, next_event)
+                    shot_event_args = _parse_shot(
+                        raw_event, next_event, parse_qualifiers
+                    )
                     shot_event = self.event_factory.build_shot(
                         **shot_event_args, **generic_event_args
                     )
                     new_events.append(shot_event)
                 elif raw_event["eventId"] == wyscout_events.PASS.EVENT:
-                    pass_event_args = _parse_pass(raw_event, next_event)
+                    pass_event_args = _parse_pass(
+                        raw_event, next_event, parse_qualifiers
+                    )
                     pass_event = self.event_factory.build_pass(
                         **pass_event_args, **generic_event_args
                     )
                     new_events.append(pass_event)
                 elif raw_event["eventId"] == wyscout_events.FOUL.EVENT:
-                    foul_event_args = _parse_foul(raw_event)
+                    foul_event_args = _parse_foul(raw_event, parse_qualifiers)
                     foul_event = self.event_factory.build_foul_committed(
                         **foul_event_args, **generic_event_args
                     )
@@ -570,7 +660,9 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                     if any(
                         _has_tag(raw_event, tag) for tag in wyscout_tags.CARD
                     ):
-                        card_event_args = _parse_card(raw_event)
+                        card_event_args = _parse_card(
+                            raw_event, parse_qualifiers
+                        )
                         card_event_id = (
                             f"card-{generic_event_args['event_id']}"
                         )
@@ -583,13 +675,17 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                         )
                         new_events.append(card_event)
                 elif raw_event["eventId"] == wyscout_events.INTERRUPTION.EVENT:
-                    ball_out_event_args = _parse_ball_out(raw_event)
+                    ball_out_event_args = _parse_ball_out(
+                        raw_event, parse_qualifiers
+                    )
                     ball_out_event = self.event_factory.build_ball_out(
                         **ball_out_event_args, **generic_event_args
                     )
                     new_events.append(ball_out_event)
                 elif raw_event["eventId"] == wyscout_events.SAVE.EVENT:
-                    goalkeeper_save_args = _parse_goalkeeper_save(raw_event)
+                    goalkeeper_save_args = _parse_goalkeeper_save(
+                        raw_event, parse_qualifiers
+                    )
                     goalkeeper_save_event = (
                         self.event_factory.build_goalkeeper_event(
                             **{**goalkeeper_save_args, **generic_event_args}
@@ -598,7 +694,7 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                     new_events.append(goalkeeper_save_event)
                 elif raw_event["eventId"] == wyscout_events.FREE_KICK.EVENT:
                     set_piece_event_args = _parse_set_piece(
-                        raw_event, next_event
+                        raw_event, next_event, parse_qualifiers
                     )
                     if (
                         raw_event["subEventId"]
@@ -624,7 +720,9 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                         raw_event["subEventId"]
                         == wyscout_events.OTHERS_ON_BALL.CLEARANCE
                     ):
-                        clearance_event_args = _parse_clearance(raw_event)
+                        clearance_event_args = _parse_clearance(
+                            raw_event, parse_qualifiers
+                        )
                         clearance_event = self.event_factory.build_clearance(
                             **clearance_event_args,
                             **generic_event_args,
@@ -636,7 +734,9 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                     ) & (_has_tag(raw_event, wyscout_tags.MISSED_BALL)):
                         miscontrol_event_args = {
                             "result": None,
-                            "qualifiers": _generic_qualifiers(raw_event),
+                            "qualifiers": _generic_qualifiers(raw_event)
+                            if parse_qualifiers
+                            else None,
                         }
                         miscontrol_event = self.event_factory.build_miscontrol(
                             **miscontrol_event_args,
@@ -644,13 +744,15 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                         )
                         new_events.append(miscontrol_event)
                     else:
-                        recovery_event_args = _parse_recovery(raw_event)
+                        recovery_event_args = _parse_recovery(
+                            raw_event, parse_qualifiers
+                        )
                         recovery_event = self.event_factory.build_recovery(
                             **recovery_event_args, **generic_event_args
                         )
                         new_events.append(recovery_event)
                 elif raw_event["eventId"] == wyscout_events.DUEL.EVENT:
-                    duel_event_args = _parse_duel(raw_event)
+                    duel_event_args = _parse_duel(raw_event, parse_qualifiers)
                     duel_event = self.event_factory.build_duel(
                         **duel_event_args, **generic_event_args
                     )
@@ -660,7 +762,11 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                     wyscout_events.OFFSIDE.EVENT,
                 ]:
                     # The events SAVE and OFFSIDE are already merged with PASS and SHOT events
-                    qualifiers = _generic_qualifiers(raw_event)
+                    qualifiers = (
+                        _generic_qualifiers(raw_event)
+                        if parse_qualifiers
+                        else None
+                    )
                     generic_event = self.event_factory.build_generic(
                         result=None,
                         qualifiers=qualifiers,
@@ -674,14 +780,15 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
                 # with this tag to an interception.
                 if _has_tag(raw_event, wyscout_tags.INTERCEPTION):
                     interception_event_args = _parse_interception(
-                        raw_event, next_event
+                        raw_event, next_event, parse_qualifiers
                     )
 
                     for i, new_event in enumerate(list(new_events)):
                         if new_event.event_type == EventType.DUEL:
                             # when DuelEvent is interception, we need to
                             # overwrite this and the previous DuelEvent
-                            events = events[:-1]
+                            if events and last_raw_event is prev_event:
+                                events = events[:-1]
                             new_events[
                                 i
                             ] = self.event_factory.build_interception(
@@ -717,7 +824,11 @@ class WyscoutDeserializerV2(EventDataDeserializer[WyscoutInputs]):
 
                 for new_event in new_events:
                     if self.should_include_event(new_event):
-                        events.append(transformer.transform_event(new_event))
+                        event = transformer.transform_event(new_event)
+                        if not keep_raw_events:
+                            event.raw_event = None
+                        events.append(event)
+                        last_raw_event = raw_event
 
         metadata = Metadata(
             teams=[home_team, away_team],
@@ -1,4 +1,3 @@
-import json
 import logging
 import warnings
 from dataclasses import replace
@@ -15,6 +14,7 @@ from kloppy.domain import (
     DuelResult,
     DuelType,
     EventDataset,
+    EventType,
     GoalkeeperActionType,
     GoalkeeperQualifier,
     Ground,
@@ -41,10 +41,11 @@ from kloppy.domain import (
     PostShotExpectedGoals,
 )
 from kloppy.exceptions import DeserializationError, DeserializationWarning
-from kloppy.utils import performance_logging
+from kloppy.utils import iter_with_neighbours, performance_logging
 
 from ..deserializer import EventDataDeserializer
 from .deserializer_v2 import WyscoutInputs
+from .helpers import load_match
 
 logger = logging.getLogger(__name__)
 
@@ -130,9 +131,9 @@ class ShotZoneResults(str, Enum):
     BLOCKED = "bc"
 
 
-def _parse_team(raw_events, wyId: str, ground: Ground) -> Team:
+def _parse_team(match, wyId: str, ground: Ground) -> Team:
     # Get the first formation description
-    first_period_formation_info = raw_events["formations"][wyId]["1H"]
+    first_period_formation_info = match["formations"][wyId]["1H"]
     first_formation_descr = next(iter(first_period_formation_info.values()))
     formation_str, formation_info = next(iter(first_formation_descr.items()))
 
@@ -148,12 +149,12 @@ def _parse_team(raw_events, wyId: str, ground: Ground) -> Team:
 
     team = Team(
         team_id=wyId,
-        name=raw_events["teams"][wyId]["team"]["officialName"],
+        name=match["teams"][wyId]["team"]["officialName"],
         ground=ground,
         starting_formation=starting_formation,
     )
 
-    for player in raw_events["players"][wyId]:
+    for player in match["players"][wyId]:
         player_id = str(player["player"]["wyId"])
         starting_position = starting_players_positions.get(player_id)
         team.players.append(
@@ -253,8 +254,12 @@ def _generic_qualifiers(raw_event: Dict) -> List[Qualifier]:
     return qualifiers
 
 
-def _parse_shot(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_shot(
+    raw_event: Dict,
+    parse_qualifiers: bool = True,
+    parse_statistics: bool = True,
+) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     if raw_event["type"]["primary"] == "own_goal":
         result = ShotResult.OWN_GOAL
     elif raw_event["shot"]["isGoal"] is True:
@@ -268,21 +273,24 @@ def _parse_shot(raw_event: Dict) -> Dict:
 
     if result != ShotResult.OWN_GOAL:
         result_coordinates = _create_shot_result_coordinates(raw_event)
-        if raw_event["shot"]["bodyPart"] == "head_or_other":
-            qualifiers.append(BodyPartQualifier(value=BodyPart.HEAD))
-        elif raw_event["shot"]["bodyPart"] == "left_foot":
-            qualifiers.append(BodyPartQualifier(value=BodyPart.LEFT_FOOT))
-        elif raw_event["shot"]["bodyPart"] == "right_foot":
-            qualifiers.append(BodyPartQualifier(value=BodyPart.RIGHT_FOOT))
+        if parse_qualifiers:
+            body_part = raw_event["shot"]["bodyPart"]
+            if body_part == "head_or_other":
+                qualifiers.append(BodyPartQualifier(value=BodyPart.HEAD))
+            elif body_part == "left_foot":
+                qualifiers.append(BodyPartQualifier(value=BodyPart.LEFT_FOOT))
+            elif body_part == "right_foot":
+                qualifiers.append(BodyPartQualifier(value=BodyPart.RIGHT_FOOT))
 
         statistics = []
-        for statistic_cls, prop_name in {
-            ExpectedGoals: "xg",
-            PostShotExpectedGoals: "postShotXg",
-        }.items():
-            value = raw_event["shot"].get(prop_name, None)
-            if value is not None:
-                statistics.append(statistic_cls(value=value))
+        if parse_statistics:
+            for statistic_cls, prop_name in {
+                ExpectedGoals: "xg",
+                PostShotExpectedGoals: "postShotXg",
+            }.items():
+                value = raw_event["shot"].get(prop_name, None)
+                if value is not None:
+                    statistics.append(statistic_cls(value=value))
     else:
         result_coordinates = None
         statistics = []
@@ -325,7 +333,12 @@ def _pass_qualifiers(raw_event) -> List[Qualifier]:
     return qualifiers
 
 
-def _parse_pass(raw_event: Dict, next_event: Dict, team: Team) -> Dict:
+def _parse_pass(
+    raw_event: Dict,
+    next_event: Dict,
+    team: Team,
+    parse_qualifiers: bool = True,
+) -> Dict:
     pass_result = None
     receiver_player = None
     if len(raw_event["pass"]["endLocation"]) > 1:
@@ -366,23 +379,25 @@ def _parse_pass(raw_event: Dict, next_event: Dict, team: Team) -> Dict:
 
     return {
         "result": pass_result,
-        "qualifiers": _pass_qualifiers(raw_event),
+        "qualifiers": _pass_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
         "receive_timestamp": None,
         "receiver_player": receiver_player,
         "receiver_coordinates": receiver_coordinates,
     }
 
 
-def _parse_foul(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_foul(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {
         "result": None,
         "qualifiers": qualifiers,
     }
 
 
-def _parse_card(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_card(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     card_type = None
     if _check_secondary_event_types(raw_event, ["yellow_card"]):
         card_type = CardType.FIRST_YELLOW
@@ -392,24 +407,26 @@ def _parse_card(raw_event: Dict) -> Dict:
     return {"result": None, "qualifiers": qualifiers, "card_type": card_type}
 
 
-def _parse_recovery(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_recovery(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {
         "result": None,
         "qualifiers": qualifiers,
     }
 
 
-def _parse_clearance(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_clearance(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {
         "result": None,
         "qualifiers": qualifiers,
     }
 
 
-def _parse_interception(raw_event: Dict, next_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_interception(
+    raw_event: Dict, next_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     result = InterceptionResult.SUCCESS
 
     if next_event is not None:
@@ -439,8 +456,13 @@ def _parse_interception(raw_event: Dict, next_event: Dict) -> Dict:
     }
 
 
-def _parse_carry(raw_event: Dict, next_event: Dict, start_ts: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_carry(
+    raw_event: Dict,
+    next_event: Dict,
+    start_ts: Dict,
+    parse_qualifiers: bool = True,
+) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     carry_info = raw_event["carry"]
     end_coordinates = Point(
         x=float(carry_info["endLocation"]["x"]),
@@ -466,7 +488,7 @@ def _parse_carry(raw_event: Dict, next_event: Dict, start_ts: Dict) -> Dict:
     }
 
 
-def _parse_goalkeeper_save(raw_event: Dict) -> Dict:
+def _goalkeeper_save_qualifiers(raw_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
 
     goalkeeper_qualifiers = []
@@ -480,58 +502,74 @@ def _parse_goalkeeper_save(raw_event: Dict) -> Dict:
             GoalkeeperQualifier(value=GoalkeeperActionType.REFLEX)
         )
     qualifiers.extend(goalkeeper_qualifiers)
+    return qualifiers
 
-    return {"result": None, "qualifiers": qualifiers}
+
+def _parse_goalkeeper_save(
+    raw_event: Dict, parse_qualifiers: bool = True
+) -> Dict:
+    return {
+        "result": None,
+        "qualifiers": _goalkeeper_save_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
+    }
 
 
-def _parse_ball_out(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_ball_out(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     return {"result": None, "qualifiers": qualifiers}
 
 
-def _parse_set_piece(raw_event: Dict, next_event: Dict, team: Team) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_set_piece(
+    raw_event: Dict,
+    next_event: Dict,
+    team: Team,
+    parse_qualifiers: bool = True,
+    parse_statistics: bool = True,
+) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else []
     result = {}
 
     # Pass set pieces
     if raw_event["type"]["primary"] == "goal_kick":
         qualifiers.append(SetPieceQualifier(SetPieceType.GOAL_KICK))
-        result = _parse_pass(raw_event, next_event, team)
+        result = _parse_pass(raw_event, next_event, team, parse_qualifiers)
     elif raw_event["type"]["primary"] == "throw_in":
         qualifiers.append(SetPieceQualifier(SetPieceType.THROW_IN))
         qualifiers.append(PassQualifier(PassType.HAND_PASS))
-        result = _parse_pass(raw_event, next_event, team)
+        result = _parse_pass(raw_event, next_event, team, parse_qualifiers)
     elif (
         raw_event["type"]["primary"] == "free_kick"
     ) and "free_kick_shot" not in raw_event["type"]["secondary"]:
         qualifiers.append(SetPieceQualifier(SetPieceType.FREE_KICK))
-        result = _parse_pass(raw_event, next_event, team)
+        result = _parse_pass(raw_event, next_event, team, parse_qualifiers)
     elif (
         raw_event["type"]["primary"] == "corner"
     ) and "shot" not in raw_event["type"]["secondary"]:
         qualifiers.append(SetPieceQualifier(SetPieceType.CORNER_KICK))
-        result = _parse_pass(raw_event, next_event, team)
+        result = _parse_pass(raw_event, next_event, team, parse_qualifiers)
     # Shot set pieces
     elif (
         raw_event["type"]["primary"] == "free_kick"
     ) and "free_kick_shot" in raw_event["type"]["secondary"]:
         qualifiers.append(SetPieceQualifier(SetPieceType.FREE_KICK))
-        result = _parse_shot(raw_event)
+        result = _parse_shot(raw_event, parse_qualifiers, parse_statistics)
     elif (raw_event["type"]["primary"] == "corner") and "shot" in raw_event[
         "type"
     ]["secondary"]:
         qualifiers.append(SetPieceQualifier(SetPieceType.CORNER_KICK))
-        result = _parse_shot(raw_event)
+        result = _parse_shot(raw_event, parse_qualifiers, parse_statistics)
     elif raw_event["type"]["primary"] == "penalty":
         qualifiers.append(SetPieceQualifier(SetPieceType.PENALTY))
-        result = _parse_shot(raw_event)
+        result = _parse_shot(raw_event, parse_qualifiers, parse_statistics)
 
-    result["qualifiers"] = qualifiers
+    result["qualifiers"] = qualifiers if parse_qualifiers else None
     return result
 
 
-def _parse_take_on(raw_event: Dict) -> Dict:
-    qualifiers = _generic_qualifiers(raw_event)
+def _parse_take_on(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    qualifiers = _generic_qualifiers(raw_event) if parse_qualifiers else None
     result = None
     if "offensive_duel" in raw_event["type"]["secondary"]:
         if raw_event["groundDuel"]["keptPossession"]:
@@ -552,7 +590,7 @@ def _parse_take_on(raw_event: Dict) -> Dict:
     return {"result": result, "qualifiers": qualifiers}
 
 
-def _parse_duel(raw_event: Dict) -> Dict:
+def _duel_qualifiers(raw_event: Dict) -> List[Qualifier]:
     qualifiers = _generic_qualifiers(raw_event)
     duel_qualifiers = []
     secondary_types = raw_event["type"]["secondary"]
@@ -594,7 +632,11 @@ def _parse_duel(raw_event: Dict) -> Dict:
             )
 
     qualifiers.extend(duel_qualifiers)
+    return qualifiers
+
 
+def _parse_duel(raw_event: Dict, parse_qualifiers: bool = True) -> Dict:
+    secondary_types = raw_event["type"]["secondary"]
     if (
         "offensive_duel" in secondary_types
         and raw_event["groundDuel"]["keptPossession"]
@@ -613,7 +655,12 @@ def _parse_duel(raw_event: Dict) -> Dict:
     else:
         result = DuelResult.LOST
 
-    return {"result": result, "qualifiers": qualifiers}
+    return {
+        "result": result,
+        "qualifiers": _duel_qualifiers(raw_event)
+        if parse_qualifiers
+        else None,
+    }
 
 
 def _create_timestamp_timedelta(
@@ -707,6 +754,46 @@ def _parse_period_id(raw_period: str) -> int:
     return period_id
 
 
+# The kloppy event types a raw event can be deserialized into, by primary
+# type. All other raw events result in a generic event.
+event_type_candidates = {
+    "shot": (EventType.SHOT,),
+    "own_goal": (EventType.SHOT,),
+    "pass": (EventType.PASS,),
+    "duel": (EventType.TAKE_ON, EventType.DUEL),
+    "clearance": (EventType.CLEARANCE,),
+    "interception": (EventType.INTERCEPTION,),
+    "shot_against": (EventType.GOALKEEPER, EventType.GENERIC),
+    "throw_in": (EventType.PASS,),
+    "goal_kick": (EventType.PASS,),
+    "free_kick": (EventType.PASS, EventType.SHOT),
+    "corner": (EventType.PASS, EventType.SHOT),
+    "penalty": (EventType.SHOT,),
+    "infraction": (EventType.FOUL_COMMITTED, EventType.CARD),
+}
+
+
+def _get_event_type_candidates(
+    raw_event: Dict, next_event: Optional[Dict]
+) -> List[EventType]:
+    event_types = list(
+        event_type_candidates.get(
+            raw_event["type"]["primary"], (EventType.GENERIC,)
+        )
+    )
+    if "carry" in raw_event["type"]["secondary"]:
+        event_types.append(EventType.CARRY)
+    if next_event:
+        # A synthetic formation change can follow any event
+        event_types.append(EventType.FORMATION_CHANGE)
+    return event_types
+
+
+def _normalize_event_id(raw_event: Dict):
+    if "id" not in raw_event:
+        raw_event["id"] = raw_event["type"]["primary"]
+
+
 class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
     @property
     def provider(self) -> Provider:
@@ -716,10 +803,11 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
         transformer = self.get_transformer()
 
         with performance_logging("load data", logger=logger):
-            raw_events = json.load(inputs.event_data)
-            for event in raw_events["events"]:
-                if "id" not in event:
-                    event["id"] = event["type"]["primary"]
+            # The events are decoded one at a time while they are parsed
+            match, raw_events = load_match(
+                inputs.event_data,
+                required_keys=["teams", "players", "formations"],
+            )
 
         periods = []
         # start timestamps are fixed
@@ -732,60 +820,41 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
         }
 
         with performance_logging("parse data", logger=logger):
-            home_team_id, away_team_id = raw_events["teams"].keys()
-            home_team = _parse_team(raw_events, home_team_id, Ground.HOME)
-            away_team = _parse_team(raw_events, away_team_id, Ground.AWAY)
+            home_team_id, away_team_id = match["teams"].keys()
+            home_team = _parse_team(match, home_team_id, Ground.HOME)
+            away_team = _parse_team(match, away_team_id, Ground.AWAY)
             teams = {home_team_id: home_team, away_team_id: away_team}
             players = {
                 wyId: _players_to_dict(team.players)
                 for wyId, team in teams.items()
             }
-            date = raw_events["match"].get("dateutc")
-            if date:
-                date = datetime.strptime(date, "%Y-%m-%d %H:%M:%S").replace(
-                    tzinfo=timezone.utc
-                )
-            game_week = raw_events["match"].get("gameweek")
-            if game_week:
-                game_week = str(game_week)
-            game_id = raw_events["events"][0].get("matchId")
-            if game_id:
-                game_id = str(game_id)
-            home_coach = None
-            away_coach = None
-            coaches = raw_events.get("coaches")
-            if coaches:
-                if (
-                    home_team_id in coaches
-                    and "coach" in coaches[home_team_id]
-                ):
-                    home_coach = coaches[home_team_id]["coach"].get(
-                        "shortName"
-                    )
-                if (
-                    away_team_id in coaches
-                    and "coach" in coaches[away_team_id]
-                ):
-                    away_coach = coaches[away_team_id]["coach"].get(
-                        "shortName"
-                    )
+            game_id = None
 
             events = []
+            parse_qualifiers = self.should_parse_field("qualifiers")
+            parse_statistics = self.should_parse_field("statistics")
+            keep_raw_events = self.should_parse_field("raw_event")
 
             next_pass_is_kickoff = False
-            for idx, raw_event in enumerate(raw_events["events"]):
-                next_event = None
+            for prev_event, raw_event, next_event in iter_with_neighbours(
+                raw_events
+            ):
+                if prev_event is None:
+                    game_id = raw_event.get("matchId")
+                    if game_id:
+                        game_id = str(game_id)
+
+                _normalize_event_id(raw_event)
                 next_period_id = None
-                if (idx + 1) < len(raw_events["events"]):
-                    next_event = raw_events["events"][idx + 1]
+                if next_event is not None:
+                    _normalize_event_id(next_event)
                     next_period_id = _parse_period_id(
                         next_event["matchPeriod"]
                     )
 
                 if (
-                    idx == 0
-                    or raw_event["matchPeriod"]
-                    != raw_events["events"][idx - 1]["matchPeriod"]
+                    prev_event is None
+                    or raw_event["matchPeriod"] != prev_event["matchPeriod"]
                     or "conceded_goal" in raw_event["type"]["secondary"]
                 ):
                     next_pass_is_kickoff = True
@@ -818,6 +887,11 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                         ),
                     )
 
+                if not self.should_parse_event_types(
+                    _get_event_type_candidates(raw_event, next_event)
+                ):
+                    continue
+
                 ball_owning_team = None
                 if raw_event["possession"]:
                     ball_owning_team = teams[
@@ -839,7 +913,7 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
 
                 generic_event_args = {
                     "event_id": raw_event["id"],
-                    "raw_event": raw_event,
+                    "raw_event": raw_event if keep_raw_events else None,
                     "coordinates": (
                         Point(
                             x=float(raw_event["location"]["x"]),
@@ -864,40 +938,51 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                     primary_event_type == "shot"
                     or primary_event_type == "own_goal"
                 ):
-                    shot_event_args = _parse_shot(raw_event)
+                    shot_event_args = _parse_shot(
+                        raw_event, parse_qualifiers, parse_statistics
+                    )
                     event = self.event_factory.build_shot(
                         **shot_event_args, **generic_event_args
                     )
                 elif primary_event_type == "pass":
-                    pass_event_args = _parse_pass(raw_event, next_event, team)
+                    pass_event_args = _parse_pass(
+                        raw_event, next_event, team, parse_qualifiers
+                    )
                     # Pass in new period or after goal scored is the kick-off
                     if next_pass_is_kickoff:
-                        pass_event_args["qualifiers"].append(
-                            SetPieceQualifier(value=SetPieceType.KICK_OFF)
-                        )
+                        if parse_qualifiers:
+                            pass_event_args["qualifiers"].append(
+                                SetPieceQualifier(value=SetPieceType.KICK_OFF)
+                            )
                         next_pass_is_kickoff = False
                     event = self.event_factory.build_pass(
                         **pass_event_args, **generic_event_args
                     )
                 elif primary_event_type == "duel":
                     if "dribble" in secondary_event_types:
-                        takeon_event_args = _parse_take_on(raw_event)
+                        takeon_event_args = _parse_take_on(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_take_on(
                             **takeon_event_args, **generic_event_args
                         )
                     else:
-                        duel_event_args = _parse_duel(raw_event)
+                        duel_event_args = _parse_duel(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_duel(
                             **duel_event_args, **generic_event_args
                         )
                 elif primary_event_type == "clearance":
-                    clearance_event_args = _parse_clearance(raw_event)
+                    clearance_event_args = _parse_clearance(
+                        raw_event, parse_qualifiers
+                    )
                     event = self.event_factory.build_clearance(
                         **clearance_event_args, **generic_event_args
                     )
                 elif primary_event_type == "interception":
                     interception_event_args = _parse_interception(
-                        raw_event, next_event
+                        raw_event, next_event, parse_qualifiers
                     )
                     event = self.event_factory.build_interception(
                         **interception_event_args, **generic_event_args
@@ -905,7 +990,9 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                 elif (primary_event_type == "shot_against") & (
                     "save" in raw_event["type"]["secondary"]
                 ):
-                    goalkeeper_save_args = _parse_goalkeeper_save(raw_event)
+                    goalkeeper_save_args = _parse_goalkeeper_save(
+                        raw_event, parse_qualifiers
+                    )
                     event = self.event_factory.build_goalkeeper_event(
                         **goalkeeper_save_args, **generic_event_args
                     )
@@ -921,7 +1008,11 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                     )
                 ):
                     set_piece_event_args = _parse_set_piece(
-                        raw_event, next_event, team
+                        raw_event,
+                        next_event,
+                        team,
+                        parse_qualifiers,
+                        parse_statistics,
                     )
                     event = self.event_factory.build_pass(
                         **set_piece_event_args, **generic_event_args
@@ -938,14 +1029,20 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                     )
                 ):
                     set_piece_event_args = _parse_set_piece(
-                        raw_event, next_event, team
+                        raw_event,
+                        next_event,
+                        team,
+                        parse_qualifiers,
+                        parse_statistics,
                     )
                     event = self.event_factory.build_shot(
                         **set_piece_event_args, **generic_event_args
                     )
                 elif primary_event_type == "infraction":
                     if "foul" in secondary_event_types:
-                        foul_event_args = _parse_foul(raw_event)
+                        foul_event_args = _parse_foul(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_foul_committed(
                             **foul_event_args, **generic_event_args
                         )
@@ -958,7 +1055,9 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                         "yellow_card" in secondary_event_types
                         or "red_card" in secondary_event_types
                     ):
-                        card_event_args = _parse_card(raw_event)
+                        card_event_args = _parse_card(
+                            raw_event, parse_qualifiers
+                        )
                         event = self.event_factory.build_card(
                             **card_event_args, **generic_event_args
                         )
@@ -967,7 +1066,7 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                         continue
                 elif "carry" in secondary_event_types:
                     carry_event_args = _parse_carry(
-                        raw_event, next_event, start_ts
+                        raw_event, next_event, start_ts, parse_qualifiers
                     )
                     event = self.event_factory.build_carry(
                         **carry_event_args, **generic_event_args
@@ -976,7 +1075,9 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                 else:
                     event = self.event_factory.build_generic(
                         result=None,
-                        qualifiers=_generic_qualifiers(raw_event),
+                        qualifiers=_generic_qualifiers(raw_event)
+                        if parse_qualifiers
+                        else None,
                         event_name=raw_event["type"]["primary"],
                         **generic_event_args,
                     )
@@ -1016,6 +1117,34 @@ class WyscoutDeserializerV3(EventDataDeserializer[WyscoutInputs]):
                         if event and self.should_include_event(event):
                             events.append(transformer.transform_event(event))
 
+            # The match and coaches blocks can come after the events
+            date = match["match"].get("dateutc")
+            if date:
+                date = datetime.strptime(date, "%Y-%m-%d %H:%M:%S").replace(
+                    tzinfo=timezone.utc
+                )
+            game_week = match["match"].get("gameweek")
+            if game_week:
+                game_week = str(game_week)
+            home_coach = None
+            away_coach = None
+            coaches = match.get("coaches")
+            if coaches:
+                if (
+                    home_team_id in coaches
+                    and "coach" in coaches[home_team_id]
+                ):
+                    home_coach = coaches[home_team_id]["coach"].get(
+                        "shortName"
+                    )
+                if (
+                    away_team_id in coaches
+                    and "coach" in coaches[away_team_id]
+                ):
+                    away_coach = coaches[away_team_id]["coach"].get(
+                        "shortName"
+                    )
+
         metadata = Metadata(
             teams=[home_team, away_team],
             periods=periods,
@@ -0,0 +1,54 @@
+from typing import IO, Any, Dict, Iterable, Iterator, Tuple
+
+from kloppy.io import iter_json_object
+
+
+def _iter_events(
+    events: Iterator[Dict], items: Iterator[Tuple[str, Any]], blocks: Dict
+) -> Iterator[Dict]:
+    yield from events
+    # The blocks after the events
+    for key, value in items:
+        if key != "events":
+            blocks[key] = value
+
+
+def load_match(
+    fp: IO[bytes], required_keys: Iterable[str]
+) -> Tuple[Dict[str, Any], Iterator[Dict]]:
+    """
+    Load a Wyscout match file without decoding all events at once.
+
+    Returns the blocks of the match (`teams`, `players`, `match`, ...) and an
+    iterator over the raw events. The blocks in `required_keys` are loaded
+    before the events are read. The other blocks can come after the events
+    in the file; they are added once the iterator is exhausted.
+
+    When a required block comes after the events, the events are skipped in
+    a first pass over the file and read in a second one. A stream that can't
+    be seeked is decoded in a single pass, keeping the raw events in memory.
+    """
+    required_keys = set(required_keys)
+    start = fp.tell() if fp.seekable() else None
+
+    blocks = {}
+    raw_events = None
+    items = iter_json_object(fp, stream_keys=["events"])
+    for key, value in items:
+        if key != "events":
+            blocks[key] = value
+        elif required_keys.issubset(blocks):
+            return blocks, _iter_events(value, items, blocks)
+        elif start is None:
+            raw_events = list(value)
+        # Otherwise the events are skipped in this pass
+
+    if start is None or raw_events is not None:
+        return blocks, iter(raw_events or [])
+
+    fp.seek(start)
+    for key, value in iter_json_object(fp, stream_keys=["events"]):
+        if key == "events":
+            # The blocks after the events were read in the first pass
+            return blocks, value
+    return blocks, iter([])
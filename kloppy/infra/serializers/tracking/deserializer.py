@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar, Optional, Union
+from typing import Callable, Generic, TypeVar, Optional, Union
 
 from kloppy.domain import (
+    Frame,
+    Metadata,
     Provider,
     TrackingDataset,
     DatasetTransformer,
@@ -50,3 +52,18 @@ class TrackingDataDeserializer(ABC, Generic[T]):
     @abstractmethod
     def deserialize(self, inputs: T) -> TrackingDataset:
         raise NotImplementedError
+
+    def create_frame_parser(
+        self, metadata: Metadata
+    ) -> Callable[[str], Optional[Frame]]:
+        """
+        Create a function that parses a single line of raw data into a frame,
+        in the coordinate system of the provider.
+
+        The function returns `None` for lines that should be skipped. It is
+        used to ingest a live feed (see
+        [`LiveTrackingDatasetBuilder`][kloppy.infra.serializers.tracking.live.LiveTrackingDatasetBuilder]).
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not support live ingestion"
+        )
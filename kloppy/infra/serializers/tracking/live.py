@@ -0,0 +1,196 @@
+import asyncio
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Tuple,
+    Union,
+)
+
+from kloppy.domain import (
+    AttackingDirection,
+    Frame,
+    Metadata,
+    Orientation,
+    TrackingDataset,
+    attacking_direction_from_frame,
+)
+from kloppy.exceptions import KloppyError
+
+from .deserializer import TrackingDataDeserializer
+
+FrameCallback = Callable[[Frame], None]
+
+_CLOSED = object()
+
+
+class LiveTrackingDatasetBuilder:
+    """
+    Build a `TrackingDataset` incrementally from a live tracking feed.
+
+    Raw data is fed in chunks, which do not have to end at a line boundary.
+    Every complete line is parsed by the provider-specific parser of the
+    deserializer, transformed to the requested coordinate system and
+    appended to `dataset`. Only the new frame and its predecessor are
+    linked, so appending a frame takes constant time.
+
+    Consumers can subscribe to new frames with a callback or iterate over
+    them asynchronously.
+
+    Attributes:
+        dataset: the dataset that is being built
+
+    Examples:
+        >>> builder = tracab.load_live(meta_data="meta.xml")
+        >>> builder.subscribe(lambda frame: print(frame.frame_id))
+        >>> for chunk in socket_chunks:
+        ...     builder.feed(chunk)
+
+        >>> async for frame in builder.frames():
+        ...     update_dashboard(frame)
+    """
+
+    def __init__(
+        self, deserializer: TrackingDataDeserializer, metadata: Metadata
+    ):
+        self.dataset = TrackingDataset(records=[], metadata=metadata)
+
+        self._parse_line = deserializer.create_frame_parser(metadata)
+        self._transformer = deserializer.get_transformer(
+            pitch_length=metadata.pitch_dimensions.pitch_length,
+            pitch_width=metadata.pitch_dimensions.pitch_width,
+        )
+
+        self._buffer = b""
+        self._callbacks: List[FrameCallback] = []
+        self._queues: List[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Queue]
+        ] = []
+        self.closed = False
+
+    def feed(self, chunk: Union[bytes, str]) -> List[Frame]:
+        """
+        Add a chunk of raw data. An incomplete last line is kept until the
+        next chunk arrives.
+
+        Returns the frames that were added.
+        """
+        if isinstance(chunk, str):
+            chunk = chunk.encode("ascii")
+
+        lines = (self._buffer + chunk).split(b"\n")
+        self._buffer = lines.pop()
+        return self.append_lines(lines)
+
+    def append_lines(self, lines: Iterable[Union[bytes, str]]) -> List[Frame]:
+        """Add complete lines of raw data.
+
+        Returns the frames that were added.
+        """
+        frames = []
+        for line in lines:
+            if isinstance(line, bytes):
+                line = line.decode("ascii")
+            line = line.strip()
+            if not line:
+                continue
+
+            frame = self._parse_line(line)
+            if frame is not None:
+                frames.append(frame)
+
+        return self.append(frames)
+
+    def append(self, frames: List[Frame]) -> List[Frame]:
+        """Add frames in the coordinate system of the provider.
+
+        Returns the transformed frames that were added.
+        """
+        if self.closed:
+            raise KloppyError("Cannot add frames to a closed live dataset")
+
+        records = self.dataset.records
+        frames = [self._transformer.transform_frame(frame) for frame in frames]
+        for frame in frames:
+            prev_frame = records[-1] if records else None
+            frame.set_refs(dataset=self.dataset, prev=prev_frame, next_=None)
+            if prev_frame is not None:
+                prev_frame.next_record = frame
+            records.append(frame)
+
+            if (
+                self.dataset.metadata.orientation == Orientation.NOT_SET
+                and frame.period.id == 1
+            ):
+                self.dataset.metadata.orientation = (
+                    Orientation.HOME_AWAY
+                    if attacking_direction_from_frame(frame)
+                    == AttackingDirection.LTR
+                    else Orientation.AWAY_HOME
+                )
+
+        for frame in frames:
+            self._publish(frame)
+
+        return frames
+
+    def flush(self) -> List[Frame]:
+        """Parse the incomplete line that is left in the buffer."""
+        buffer, self._buffer = self._buffer, b""
+        return self.append_lines([buffer])
+
+    def close(self):
+        """Flush the buffer and end all asynchronous iterators."""
+        if self.closed:
+            return
+        self.flush()
+        self.closed = True
+        for loop, queue in self._queues:
+            loop.call_soon_threadsafe(queue.put_nowait, _CLOSED)
+
+    def subscribe(self, callback: FrameCallback) -> Callable[[], None]:
+        """
+        Call `callback` for every new frame. Returns a function that
+        unsubscribes the callback.
+        """
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    async def frames(self) -> AsyncIterator[Frame]:
+        """
+        Iterate over new frames until the builder is closed.
+
+        Frames can be fed from another thread; they are handed over to the
+        event loop of the iterator.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        subscription = (asyncio.get_running_loop(), queue)
+        self._queues.append(subscription)
+        try:
+            while not self.closed or not queue.empty():
+                frame = await queue.get()
+                if frame is _CLOSED:
+                    break
+                yield frame
+        finally:
+            self._queues.remove(subscription)
+
+    def _publish(self, frame: Frame):
+        for callback in list(self._callbacks):
+            callback(frame)
+        for loop, queue in self._queues:
+            loop.call_soon_threadsafe(queue.put_nowait, frame)
+
+    def __len__(self):
+        return len(self.dataset.records)
+
+    def __repr__(self):
+        return (
+            f"<{self.__class__.__name__} "
+            f"provider={self.dataset.metadata.provider} "
+            f"frame_count={len(self)}>"
+        )
+
+
+__all__ = ["LiveTrackingDatasetBuilder"]
@@ -2,6 +2,7 @@ import re
 from typing import List, Iterator, IO
 from datetime import timedelta
 
+from kloppy.io import iter_lines
 
 from .models import (
     PlayerChannel,
@@ -78,14 +79,14 @@ def read_raw_data(
     n = 0
     sample = 1.0 / sample_rate
 
-    for i, line in enumerate(raw_data):
+    for i, line in enumerate(iter_lines(raw_data)):
         if i % sample != 0:
             continue
 
         def to_float(v):
             return float(v) if v else float("nan")
 
-        line = line.strip().decode("ascii")
+        line = str(line, "ascii").strip()
         row = {
             k: to_float(v) for k, v in regex.search(line).groupdict().items()
         }
@@ -1,8 +1,9 @@
 import json
 import logging
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 import warnings
-from typing import Dict, Optional, Union, NamedTuple, IO
+from typing import Callable, Dict, Optional, Union, NamedTuple, IO
 
 from lxml import objectify
 
@@ -18,6 +19,7 @@ from kloppy.domain import (
     Orientation,
     attacking_direction_from_frame,
     Metadata,
+    Frame,
     Ground,
     Player,
     Provider,
@@ -26,6 +28,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 
+from kloppy.io import iter_lines
 from kloppy.utils import Readable, performance_logging
 
 from .deserializer import TrackingDataDeserializer
@@ -110,6 +113,32 @@ class SecondSpectrumDeserializer(
 
         return frame
 
+    def _parse_frame_data(self, line: str) -> Optional[Dict]:
+        """The frame data on a line of raw data, or `None` when the frame
+        should be skipped."""
+        # Each line is just json so we just parse it
+        frame_data = json.loads(line)
+
+        if self.only_alive and not frame_data["live"]:
+            return None
+        return frame_data
+
+    def create_frame_parser(
+        self, metadata: Metadata
+    ) -> Callable[[str], Optional[Frame]]:
+        teams = metadata.teams
+        periods = metadata.periods
+
+        def parse(line: str) -> Optional[Frame]:
+            frame_data = self._parse_frame_data(line)
+            if frame_data is None:
+                return None
+
+            period = periods[frame_data["period"] - 1]
+            return self._frame_from_framedata(teams, period, frame_data)
+
+        return parse
+
     @staticmethod
     def __validate_inputs(inputs: Dict[str, Readable]):
         if "xml_metadata" not in inputs:
@@ -117,7 +146,17 @@ class SecondSpectrumDeserializer(
         if "raw_data" not in inputs:
             raise ValueError("Please specify a value for 'raw_data'")
 
-    def deserialize(self, inputs: SecondSpectrumInputs) -> TrackingDataset:
+    def deserialize_metadata(
+        self,
+        meta_data: IO[bytes],
+        additional_meta_data: Optional[IO[bytes]] = None,
+    ) -> Metadata:
+        """
+        Parse the metadata of a match, without any raw data.
+
+        The orientation is `NOT_SET`; it can be determined from the first
+        frame.
+        """
         metadata = None
 
         # Handles the XML metadata that contains the pitch dimensions and frame info
@@ -125,9 +164,9 @@ class SecondSpectrumDeserializer(
             # The meta data can also be in JSON format. In that case
             # it also contains the 'additional metadata'.
             # First do a 'peek' to determine the char
-            first_byte = inputs.meta_data.read(1)
+            first_byte = meta_data.read(1)
             if first_byte == b"{":
-                metadata = json.loads(first_byte + inputs.meta_data.read())
+                metadata = json.loads(first_byte + meta_data.read())
 
                 frame_rate = int(metadata["fps"])
                 pitch_size_height = float(metadata["pitchLength"])
@@ -152,7 +191,7 @@ class SecondSpectrumDeserializer(
                         )
             else:
                 match = objectify.fromstring(
-                    first_byte + inputs.meta_data.read()
+                    first_byte + meta_data.read()
                 ).match
                 frame_rate = int(match.attrib["iFrameRateFps"])
                 pitch_size_height = float(match.attrib["fPitchXSizeMeters"])
@@ -181,13 +220,11 @@ class SecondSpectrumDeserializer(
         away_team = Team(team_id="away", name="away", ground=Ground.AWAY)
         teams = [home_team, away_team]
 
-        if inputs.additional_meta_data or metadata:
+        if additional_meta_data or metadata:
             with performance_logging("Loading JSON metadata", logger=logger):
                 try:
-                    if inputs.additional_meta_data:
-                        metadata = json.loads(
-                            inputs.additional_meta_data.read()
-                        )
+                    if additional_meta_data:
+                        metadata = json.loads(additional_meta_data.read())
 
                     home_team_id = metadata["homeOptaId"]
                     away_team_id = metadata["awayOptaId"]
@@ -240,25 +277,64 @@ class SecondSpectrumDeserializer(
                         "Optional JSON Metadata is malformed. Continuing without"
                     )
 
+        if metadata:
+            score = Score(
+                home=metadata["homeScore"], away=metadata["awayScore"]
+            )
+            year, month, day = (
+                metadata["year"],
+                metadata["month"],
+                metadata["day"],
+            )
+            date = datetime(year, month, day, 0, 0, tzinfo=timezone.utc)
+            game_id = metadata["ssiId"]
+        else:
+            score = None
+            date = None
+            game_id = None
+
+        transformer = self.get_transformer(
+            pitch_length=pitch_size_height, pitch_width=pitch_size_width
+        )
+        return Metadata(
+            teams=teams,
+            periods=periods,
+            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
+            score=score,
+            frame_rate=frame_rate,
+            orientation=Orientation.NOT_SET,
+            provider=Provider.SECONDSPECTRUM,
+            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
+            coordinate_system=transformer.get_to_coordinate_system(),
+            date=date,
+            game_id=game_id,
+        )
+
+    def deserialize(self, inputs: SecondSpectrumInputs) -> TrackingDataset:
+        metadata = self.deserialize_metadata(
+            inputs.meta_data, inputs.additional_meta_data
+        )
+        teams = metadata.teams
+        periods = metadata.periods
+
         # Handles the tracking frame data
         with performance_logging("Loading data", logger=logger):
             transformer = self.get_transformer(
-                pitch_length=pitch_size_height, pitch_width=pitch_size_width
+                pitch_length=metadata.pitch_dimensions.pitch_length,
+                pitch_width=metadata.pitch_dimensions.pitch_width,
             )
 
             def _iter():
                 n = 0
                 sample = 1 / self.sample_rate
 
-                for line_ in inputs.raw_data.readlines():
-                    line_ = line_.strip().decode("ascii")
+                for line_ in iter_lines(inputs.raw_data):
+                    line_ = str(line_, "ascii").strip()
                     if not line_:
                         continue
 
-                    # Each line is just json so we just parse it
-                    frame_data = json.loads(line_)
-
-                    if self.only_alive and not frame_data["live"]:
+                    frame_data = self._parse_frame_data(line_)
+                    if frame_data is None:
                         continue
 
                     if n % sample == 0:
@@ -292,36 +368,7 @@ class SecondSpectrumDeserializer(
                 "Could not determine orientation of dataset, defaulting to NOT_SET"
             )
             orientation = Orientation.NOT_SET
-
-        if metadata:
-            score = Score(
-                home=metadata["homeScore"], away=metadata["awayScore"]
-            )
-            year, month, day = (
-                metadata["year"],
-                metadata["month"],
-                metadata["day"],
-            )
-            date = datetime(year, month, day, 0, 0, tzinfo=timezone.utc)
-            game_id = metadata["ssiId"]
-        else:
-            score = None
-            date = None
-            game_id = None
-
-        metadata = Metadata(
-            teams=teams,
-            periods=periods,
-            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
-            score=score,
-            frame_rate=frame_rate,
-            orientation=orientation,
-            provider=Provider.SECONDSPECTRUM,
-            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
-            coordinate_system=transformer.get_to_coordinate_system(),
-            date=date,
-            game_id=game_id,
-        )
+        metadata = replace(metadata, orientation=orientation)
 
         return TrackingDataset(
             records=frames,
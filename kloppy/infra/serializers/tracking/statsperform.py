@@ -20,6 +20,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.io import iter_lines
 from kloppy.utils import performance_logging
 from kloppy.infra.serializers.event.statsperform.parsers import get_parser
 
@@ -157,7 +158,9 @@ class StatsPerformDeserializer(TrackingDataDeserializer[StatsPerformInputs]):
             game_id = meta_data_parser.extract_game_id()
 
         with performance_logging("Loading tracking data", logger=logger):
-            tracking_data = inputs.raw_data.read().decode("ascii").splitlines()
+            tracking_data = [
+                str(line_, "ascii") for line_ in iter_lines(inputs.raw_data)
+            ]
             frame_rate = self.__get_frame_rate(tracking_data)
 
             transformer = self.get_transformer(
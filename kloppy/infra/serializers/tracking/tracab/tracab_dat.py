@@ -1,7 +1,8 @@
 import logging
 from datetime import datetime, timedelta, timezone
 import warnings
-from typing import Dict, Optional, Union
+from dataclasses import replace
+from typing import IO, Callable, Dict, List, Optional, Union
 import html
 
 from lxml import objectify
@@ -18,6 +19,7 @@ from kloppy.domain import (
     Orientation,
     attacking_direction_from_frame,
     Metadata,
+    Frame,
     Ground,
     Player,
     Provider,
@@ -26,6 +28,7 @@ from kloppy.domain import (
 )
 from kloppy.domain.services.frame_factory import create_frame
 from kloppy.exceptions import DeserializationError
+from kloppy.io import iter_lines
 
 from kloppy.utils import Readable, performance_logging
 
@@ -129,6 +132,39 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
 
         return frame
 
+    def _get_period(
+        self, line: str, periods: List[Period], frame_rate: int
+    ) -> Optional[Period]:
+        """The period of the frame on a line of raw data, or `None` when the
+        frame should be skipped."""
+        if self.only_alive and not line.endswith("Alive;:"):
+            return None
+
+        frame_id = int(line[:10].split(":", 1)[0])
+        for period in periods:
+            if (
+                period.start_timestamp
+                <= timedelta(seconds=frame_id / frame_rate)
+                <= period.end_timestamp
+            ):
+                return period
+        return None
+
+    def create_frame_parser(
+        self, metadata: Metadata
+    ) -> Callable[[str], Optional[Frame]]:
+        teams = metadata.teams
+        periods = metadata.periods
+        frame_rate = metadata.frame_rate
+
+        def parse(line: str) -> Optional[Frame]:
+            period = self._get_period(line, periods, frame_rate)
+            if period is None:
+                return None
+            return self._frame_from_line(teams, period, line, frame_rate)
+
+        return parse
+
     @staticmethod
     def __validate_inputs(inputs: Dict[str, Readable]):
         if "metadata" not in inputs:
@@ -166,9 +202,15 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
 
         return team
 
-    def deserialize(self, inputs: TRACABInputs) -> TrackingDataset:
+    def deserialize_metadata(self, meta_data: IO[bytes]) -> Metadata:
+        """
+        Parse the metadata of a match, without any raw data.
+
+        The orientation is `NOT_SET` when the metadata does not contain it;
+        it can be determined from the first frame.
+        """
         with performance_logging("Loading metadata", logger=logger):
-            meta_data = objectify.fromstring(inputs.meta_data.read())
+            meta_data = objectify.fromstring(meta_data.read())
 
             periods = []
             orientation = None
@@ -268,33 +310,49 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
                 )
             teams = [home_team, away_team]
 
+        transformer = self.get_transformer(
+            pitch_length=pitch_size_width, pitch_width=pitch_size_height
+        )
+        return Metadata(
+            teams=teams,
+            periods=periods,
+            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
+            score=None,
+            frame_rate=frame_rate,
+            orientation=orientation or Orientation.NOT_SET,
+            provider=Provider.TRACAB,
+            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
+            coordinate_system=transformer.get_to_coordinate_system(),
+            date=date,
+            game_id=game_id,
+        )
+
+    def deserialize(self, inputs: TRACABInputs) -> TrackingDataset:
+        metadata = self.deserialize_metadata(inputs.meta_data)
+        teams = metadata.teams
+        periods = metadata.periods
+        frame_rate = metadata.frame_rate
+
         with performance_logging("Loading data", logger=logger):
             transformer = self.get_transformer(
-                pitch_length=pitch_size_width, pitch_width=pitch_size_height
+                pitch_length=metadata.pitch_dimensions.pitch_length,
+                pitch_width=metadata.pitch_dimensions.pitch_width,
             )
 
             def _iter():
                 n = 0
                 sample = 1.0 / self.sample_rate
 
-                for line_ in inputs.raw_data.readlines():
-                    line_ = line_.strip().decode("ascii")
+                for line_ in iter_lines(inputs.raw_data):
+                    line_ = str(line_, "ascii").strip()
                     if not line_:
                         continue
 
-                    frame_id = int(line_[:10].split(":", 1)[0])
-                    if self.only_alive and not line_.endswith("Alive;:"):
-                        continue
-
-                    for period_ in periods:
-                        if (
-                            period_.start_timestamp
-                            <= timedelta(seconds=frame_id / frame_rate)
-                            <= period_.end_timestamp
-                        ):
-                            if n % sample == 0:
-                                yield period_, line_
-                            n += 1
+                    period_ = self._get_period(line_, periods, frame_rate)
+                    if period_ is not None:
+                        if n % sample == 0:
+                            yield period_, line_
+                        n += 1
 
             frames = []
             for n, (period, line) in enumerate(_iter()):
@@ -306,7 +364,7 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
                 if self.limit and n >= self.limit:
                     break
 
-        if not orientation:
+        if metadata.orientation == Orientation.NOT_SET:
             try:
                 first_frame = next(
                     frame for frame in frames if frame.period.id == 1
@@ -322,20 +380,7 @@ class TRACABDatDeserializer(TrackingDataDeserializer[TRACABInputs]):
                     "Could not determine orientation of dataset, defaulting to NOT_SET"
                 )
                 orientation = Orientation.NOT_SET
-
-        metadata = Metadata(
-            teams=teams,
-            periods=periods,
-            pitch_dimensions=transformer.get_to_coordinate_system().pitch_dimensions,
-            score=None,
-            frame_rate=frame_rate,
-            orientation=orientation,
-            provider=Provider.TRACAB,
-            flags=DatasetFlag.BALL_OWNING_TEAM | DatasetFlag.BALL_STATE,
-            coordinate_system=transformer.get_to_coordinate_system(),
-            date=date,
-            game_id=game_id,
-        )
+            metadata = replace(metadata, orientation=orientation)
 
         return TrackingDataset(
             records=frames,
@@ -1,34 +1,63 @@
 """I/O utilities for reading raw data."""
 
+import asyncio
 import bz2
+import concurrent.futures
 import contextlib
 import gzip
+import json
 import logging
 import lzma
+import mmap
 import os
+import queue
+import re
+import threading
 import urllib.parse
+from codecs import getincrementaldecoder
 from dataclasses import dataclass, replace
-from io import BufferedWriter, BytesIO, TextIOWrapper
+from io import (
+    BufferedIOBase,
+    BufferedReader,
+    BufferedWriter,
+    BytesIO,
+    RawIOBase,
+    TextIOWrapper,
+)
 from typing import (
     IO,
+    Any,
     BinaryIO,
+    Callable,
     ContextManager,
+    Coroutine,
+    Dict,
     Generator,
+    Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
+    TypeVar,
     Union,
 )
 
 from kloppy.config import get_config
-from kloppy.exceptions import InputNotFoundError
-from kloppy.infra.io.adapters import get_adapter
+from kloppy.exceptions import InputNotFoundError, KloppyError
+from kloppy.infra.io.adapters import Adapter, get_adapter
+from kloppy.infra.io.cache import CacheEntry, DownloadCache
+from kloppy.utils import deprecated
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_GZIP_COMPRESSION = 1
 DEFAULT_BZ2_COMPRESSION = 9
 DEFAULT_XZ_COMPRESSION = 6
+DEFAULT_ZSTD_COMPRESSION = 3
+DEFAULT_LZ4_COMPRESSION = 0
+
 
+T = TypeVar("T")
 
 FilePath = Union[str, bytes, os.PathLike]
 FileOrPath = Union[FilePath, IO]
@@ -97,33 +126,168 @@ def _file_or_path_to_binary_stream(
     )
 
 
+@dataclass(frozen=True)
+class Codec:
+    """A compression format that can be read and written transparently.
+
+    Args:
+        name (str): The name of the format, as used for the `format`
+            argument of `_open`.
+        extension (str): The file name extension, including the dot.
+        magic (bytes): The first bytes of a compressed file.
+        open (Callable): Opens a file path or file object. Called with
+            `(file_or_path, mode, compresslevel)`, where `mode` is 'rb', 'wb'
+            or 'ab' and `compresslevel` can be `None`.
+    """
+
+    name: str
+    extension: str
+    magic: bytes
+    open: Callable[[FileOrPath, str, Optional[int]], BinaryIO]
+
+
+def _open_bz2(
+    filename: FileOrPath,
+    mode: str,
+    compresslevel: Optional[int] = None,
+) -> BinaryIO:
+    assert mode in ("rb", "ab", "wb")
+    if compresslevel is None:
+        compresslevel = DEFAULT_BZ2_COMPRESSION
+
+    if "r" in mode:
+        return bz2.open(filename, mode)  # type: ignore
+    return BufferedWriter(bz2.open(filename, mode, compresslevel))  # type: ignore
+
+
+def _open_xz(
+    filename: FileOrPath,
+    mode: str,
+    compresslevel: Optional[int] = None,
+) -> BinaryIO:
+    assert mode in ("rb", "ab", "wb")
+    if compresslevel is None:
+        compresslevel = DEFAULT_XZ_COMPRESSION
+
+    if "r" in mode:
+        return lzma.open(filename, mode)  # type: ignore
+    return BufferedWriter(lzma.open(filename, mode, preset=compresslevel))  # type: ignore
+
+
+def _open_gz(
+    filename: FileOrPath,
+    mode: str,
+    compresslevel: Optional[int] = None,
+) -> BinaryIO:
+    assert mode in ("rb", "ab", "wb")
+    if compresslevel is None:
+        compresslevel = DEFAULT_GZIP_COMPRESSION
+
+    if "r" in mode:
+        return gzip.open(filename, mode)  # type: ignore
+    return BufferedWriter(gzip.open(filename, mode, compresslevel=compresslevel))  # type: ignore
+
+
+def _open_zst(
+    filename: FileOrPath,
+    mode: str,
+    compresslevel: Optional[int] = None,
+) -> BinaryIO:
+    assert mode in ("rb", "ab", "wb")
+    try:
+        import zstandard
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have zstandard installed. Please"
+            " install it using: pip install zstandard"
+        )
+
+    if "r" in mode:
+        return zstandard.open(filename, mode)  # type: ignore
+    if compresslevel is None:
+        compresslevel = DEFAULT_ZSTD_COMPRESSION
+    return zstandard.open(  # type: ignore
+        filename, mode, cctx=zstandard.ZstdCompressor(level=compresslevel)
+    )
+
+
+def _open_lz4(
+    filename: FileOrPath,
+    mode: str,
+    compresslevel: Optional[int] = None,
+) -> BinaryIO:
+    assert mode in ("rb", "ab", "wb")
+    try:
+        import lz4.frame
+    except ImportError:
+        raise ImportError(
+            "Seems like you don't have lz4 installed. Please"
+            " install it using: pip install lz4"
+        )
+
+    if "r" in mode:
+        return lz4.frame.open(filename, mode)  # type: ignore
+    if compresslevel is None:
+        compresslevel = DEFAULT_LZ4_COMPRESSION
+    return lz4.frame.open(  # type: ignore
+        filename, mode, compression_level=compresslevel
+    )
+
+
+codecs: Dict[str, Codec] = {}
+
+
+def register_codec(codec: Codec):
+    """Add support for reading (and writing) a compression format.
+
+    Example:
+        >>> import brotli_file
+        >>> register_codec(
+        ...     Codec(
+        ...         name="br",
+        ...         extension=".br",
+        ...         magic=b"\xce\xb2\xcf\x81",
+        ...         open=lambda f, mode, level: brotli_file.open(f, mode),
+        ...     )
+        ... )
+    """
+    codecs[codec.name] = codec
+
+
+# https://tools.ietf.org/html/rfc1952#page-6
+register_codec(Codec("gz", ".gz", b"\x1f\x8b", _open_gz))
+# https://en.wikipedia.org/wiki/List_of_file_signatures
+register_codec(Codec("bz2", ".bz2", b"\x42\x5a\x68", _open_bz2))
+# https://tukaani.org/xz/xz-file-format.txt
+register_codec(Codec("xz", ".xz", b"\xfd\x37\x7a\x58\x5a\x00", _open_xz))
+# https://datatracker.ietf.org/doc/html/rfc8878#section-3.1.1
+register_codec(Codec("zst", ".zst", b"\x28\xb5\x2f\xfd", _open_zst))
+# https://github.com/lz4/lz4/blob/dev/doc/lz4_Frame_format.md
+register_codec(Codec("lz4", ".lz4", b"\x04\x22\x4d\x18", _open_lz4))
+
+
 def _detect_format_from_content(file_or_path: FileOrPath) -> Optional[str]:
     """
     Attempts to detect file format from the content by reading the first
-    6 bytes. Returns None if no format could be detected.
+    bytes. Returns None if no format could be detected.
     """
+    magic_length = max(len(codec.magic) for codec in codecs.values())
     fileobj, closefd = _file_or_path_to_binary_stream(file_or_path, "rb")
     try:
         if not fileobj.readable():
             return None
         if hasattr(fileobj, "peek"):
-            bs = fileobj.peek(6)
+            bs = fileobj.peek(magic_length)
         elif hasattr(fileobj, "seekable") and fileobj.seekable():
             current_pos = fileobj.tell()
-            bs = fileobj.read(6)
+            bs = fileobj.read(magic_length)
             fileobj.seek(current_pos)
         else:
             return None
 
-        if bs[:2] == b"\x1f\x8b":
-            # https://tools.ietf.org/html/rfc1952#page-6
-            return "gz"
-        elif bs[:3] == b"\x42\x5a\x68":
-            # https://en.wikipedia.org/wiki/List_of_file_signatures
-            return "bz2"
-        elif bs[:6] == b"\xfd\x37\x7a\x58\x5a\x00":
-            # https://tukaani.org/xz/xz-file-format.txt
-            return "xz"
+        for codec in codecs.values():
+            if bs[: len(codec.magic)] == codec.magic:
+                return codec.name
         return None
     finally:
         if closefd:
@@ -135,17 +299,15 @@ def _detect_format_from_extension(filename: FilePath) -> Optional[str]:
     Attempt to detect file format from the filename extension.
     Return None if no format could be detected.
     """
-    extensions = ("bz2", "xz", "gz")
-
     if isinstance(filename, bytes):
-        for ext in extensions:
-            if filename.endswith(b"." + ext.encode()):
-                return ext
+        for codec in codecs.values():
+            if filename.endswith(codec.extension.encode()):
+                return codec.name
 
     if isinstance(filename, str):
-        for ext in extensions:
-            if filename.endswith("." + ext):
-                return ext
+        for codec in codecs.values():
+            if filename.endswith(codec.extension):
+                return codec.name
 
     if hasattr(filename, "name"):
         return _detect_format_from_extension(filename.name)
@@ -169,6 +331,322 @@ def _filepath_from_path_or_filelike(file_or_path: FileOrPath) -> str:
     return ""
 
 
+_BACKGROUND_EOF = object()
+
+
+class BackgroundReader(RawIOBase):
+    """Read a stream in a background thread.
+
+    The background thread reads chunks of `chunk_size` bytes into a buffer
+    of at most `buffer_size` chunks, from which this stream is read. When the
+    source stream decompresses its data, decompression and parsing overlap.
+
+    Errors raised while reading the source stream are raised again when
+    they are reached by the reader.
+    """
+
+    def __init__(
+        self, source: BinaryIO, chunk_size: int = 1 << 20, buffer_size=8
+    ):
+        super().__init__()
+        self.source = source
+        self._chunks: queue.Queue = queue.Queue(maxsize=buffer_size)
+        self._chunk = memoryview(b"")
+        self._eof = False
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(
+            target=self._produce, args=(chunk_size,), daemon=True
+        )
+        self._thread.start()
+
+    @property
+    def name(self):
+        return getattr(self.source, "name", "")
+
+    def _put(self, item) -> bool:
+        while not self._stopped.is_set():
+            try:
+                self._chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _produce(self, chunk_size: int):
+        try:
+            while True:
+                chunk = self.source.read(chunk_size)
+                if not chunk:
+                    break
+                if not self._put(chunk):
+                    return
+            self._put(_BACKGROUND_EOF)
+        except BaseException as e:
+            self._put(e)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        if not self._chunk and not self._eof:
+            item = self._chunks.get()
+            if item is _BACKGROUND_EOF:
+                self._eof = True
+            elif isinstance(item, BaseException):
+                self._eof = True
+                raise item
+            else:
+                self._chunk = memoryview(item)
+
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._stopped.set()
+            self._thread.join()
+            self.source.close()
+        super().close()
+
+
+class MappedFile(BufferedIOBase):
+    """A read-only, memory-mapped local file.
+
+    The file can be read like any other binary stream. In addition,
+    `iter_lines` yields the lines as `memoryview` slices of the mapping, so
+    the data is not copied. Processes that map the same file share its
+    pages in the page cache.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.name = path
+        with open(path, "rb") as fp:
+            self._mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        self._mmap.seek(offset, whence)
+        return self._mmap.tell()
+
+    def tell(self) -> int:
+        return self._mmap.tell()
+
+    def read(self, size: Optional[int] = -1) -> bytes:
+        return self._mmap.read(-1 if size is None else size)
+
+    read1 = read
+
+    def readinto(self, buffer) -> int:
+        data = self._mmap.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def peek(self, size: int = 0) -> bytes:
+        position = self._mmap.tell()
+        return self._mmap[position : position + max(size, 1)]
+
+    def readline(self, size: Optional[int] = -1) -> bytes:
+        line = self._mmap.readline()
+        if size is not None and 0 <= size < len(line):
+            self._mmap.seek(size - len(line), os.SEEK_CUR)
+            line = line[:size]
+        return line
+
+    def __iter__(self) -> Iterator[bytes]:
+        return iter(self._mmap.readline, b"")
+
+    def iter_lines(self) -> Iterator[memoryview]:
+        """Iterate over the remaining lines, without line endings, as
+        slices of the mapping."""
+        view = memoryview(self._mmap)
+        try:
+            position = self._mmap.tell()
+            end = len(view)
+            while position < end:
+                newline = self._mmap.find(b"\n", position)
+                next_position = end if newline == -1 else newline + 1
+                line_end = end if newline == -1 else newline
+                if line_end > position and view[line_end - 1] == ord("\r"):
+                    line_end -= 1
+                self._mmap.seek(next_position)
+                yield view[position:line_end]
+                position = next_position
+        finally:
+            view.release()
+
+    def close(self):
+        if not self.closed:
+            try:
+                self._mmap.close()
+            except BufferError:
+                # Slices returned by `iter_lines` are still referenced. The
+                # mapping is closed when they are garbage collected.
+                pass
+        super().close()
+
+
+def _open_memory_mapped(path: str) -> Optional[MappedFile]:
+    """Memory-map a local file, unless it is empty or compressed."""
+    if os.path.getsize(path) == 0:
+        return None
+    if _detect_format_from_extension(path) or _detect_format_from_content(
+        path
+    ):
+        return None
+    return MappedFile(path)
+
+
+def iter_lines(fp: BinaryIO) -> Iterator[Union[bytes, memoryview]]:
+    """Iterate over the lines of a binary stream, without line endings.
+
+    Lines of a memory-mapped file (see `open_as_file`) are `memoryview`
+    slices, other streams yield `bytes`. Both can be decoded with
+    `str(line, encoding)`.
+    """
+    if isinstance(fp, MappedFile):
+        yield from fp.iter_lines()
+    else:
+        for line in fp:
+            yield line.rstrip(b"\r\n")
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JSONStreamDecoder:
+    """Decode the values of a JSON document one at a time from a binary
+    stream, reading it in chunks."""
+
+    def __init__(self, fp: BinaryIO, chunk_size: int = 64 * 1024):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._text_decoder = getincrementaldecoder("utf-8-sig")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Read `size` more bytes into the buffer. Returns `False` at the
+        end of the stream."""
+        if self._eof:
+            return False
+        chunk = self._fp.read(size)
+        self._eof = not chunk
+        self._buffer = self._buffer[self._pos :] + self._text_decoder.decode(
+            chunk, final=self._eof
+        )
+        self._pos = 0
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def _skip_whitespace(self):
+        while True:
+            self._pos = _JSON_WHITESPACE.match(self._buffer, self._pos).end()
+            if self._pos < len(self._buffer) or not self._fill(
+                self._chunk_size
+            ):
+                return
+
+    def peek_char(self) -> str:
+        """The next character that is not whitespace."""
+        self._skip_whitespace()
+        if self._pos == len(self._buffer):
+            raise self._error("Unexpected end of document")
+        return self._buffer[self._pos]
+
+    def read_char(self, expected: str):
+        """Read the next character that is not whitespace, which must be
+        `expected`."""
+        if self.peek_char() != expected:
+            raise self._error(f"Expecting '{expected}'")
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """Decode the next value."""
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._json_decoder.raw_decode(
+                    self._buffer, self._pos
+                )
+            except json.JSONDecodeError:
+                # The value might continue after the buffer. Grow the buffer
+                # geometrically, so a large value is not decoded over and
+                # over again.
+                size = max(self._chunk_size, len(self._buffer) - self._pos)
+                if not self._fill(size):
+                    raise
+                continue
+            if end == len(self._buffer) and self._fill(self._chunk_size):
+                # A number can continue in the next chunk
+                continue
+            self._pos = end
+            return value
+
+
+def _iter_json_array(decoder: _JSONStreamDecoder) -> Iterator[Any]:
+    decoder.read_char("[")
+    if decoder.peek_char() == "]":
+        decoder.read_char("]")
+        return
+    while True:
+        yield decoder.read_value()
+        if decoder.peek_char() == "]":
+            decoder.read_char("]")
+            return
+        decoder.read_char(",")
+
+
+def iter_json_object(
+    fp: BinaryIO, stream_keys: Iterable[str] = ()
+) -> Iterator[Tuple[str, Any]]:
+    """Iterate over the `(key, value)` items of the JSON object in a binary
+    stream, without decoding the whole document at once.
+
+    The value of a key in `stream_keys` must be an array. It is returned as
+    an iterator that decodes the elements one at a time, and must be read
+    before the next item is requested (the elements that are not read are
+    skipped).
+
+    Example:
+        >>> for key, value in iter_json_object(fp, stream_keys=["events"]):
+        ...     if key == "events":
+        ...         for event in value:
+        ...             process(event)
+    """
+    stream_keys = set(stream_keys)
+    decoder = _JSONStreamDecoder(fp)
+    decoder.read_char("{")
+    if decoder.peek_char() == "}":
+        return
+    while True:
+        key = decoder.read_value()
+        if not isinstance(key, str):
+            raise decoder._error("Expecting property name")
+        decoder.read_char(":")
+        if key in stream_keys:
+            elements = _iter_json_array(decoder)
+            yield key, elements
+            for _ in elements:
+                pass
+        else:
+            yield key, decoder.read_value()
+        if decoder.peek_char() == "}":
+            return
+        decoder.read_char(",")
+
+
 def _open(
     filename: FileOrPath,
     mode: str = "rb",
@@ -177,37 +655,45 @@ def _open(
 ) -> BinaryIO:
     """
     A replacement for the "open" function that can also read and write
-    compressed files transparently. The supported compression formats are gzip,
-    bzip2 and xz. Filename can be a string, a Path or a file object.
+    compressed files transparently. The supported compression formats are
+    gzip, bzip2, xz, zstd and lz4 (see `register_codec` to add more). zstd
+    and lz4 require the `zstandard` and `lz4` packages. Filename can be a
+    string, a Path or a file object.
 
     When writing, the file format is chosen based on the file name extension:
     - .gz uses gzip compression
     - .bz2 uses bzip2 compression
     - .xz uses xz/lzma compression
+    - .zst uses zstd compression
+    - .lz4 uses lz4 frame compression
     - otherwise, no compression is used
 
     When reading, if a file name extension is available, the format is detected
-    using it, but if not, the format is detected from the contents.
+    using it, but if not, the format is detected from the contents. When the
+    `io.background_decompression` config is enabled, compressed files are
+    decompressed in a background thread (see `BackgroundReader`).
 
     mode can be: 'rb', 'ab', or 'wb'.
 
-    compresslevel is the compression level for writing to gzip, and xz.
-    This parameter is ignored for the other compression formats.
+    compresslevel is the compression level for writing to gzip, xz, zstd and
+    lz4. This parameter is ignored for the other compression formats.
     If set to None, a default depending on the format is used:
-    gzip: 6, xz: 6.
+    gzip: 1, bz2: 9, xz: 6, zstd: 3, lz4: 0.
 
     format overrides the autodetection of input and output formats. This can be
     useful when compressed output needs to be written to a file without an
-    extension. Possible values are "gz", "xz", "bz2" and "raw". In case of
-    "raw", no compression is used.
+    extension. Possible values are the names of the codecs ("gz", "xz",
+    "bz2", "zst" and "lz4") and "raw". In case of "raw", no compression is
+    used.
     """
     if mode not in ("rb", "wb", "ab"):
         raise ValueError(f"Mode '{mode}' not supported")
     filepath = _filepath_from_path_or_filelike(filename)
 
-    if format not in (None, "gz", "xz", "bz2", "raw"):
+    if format is not None and format != "raw" and format not in codecs:
         raise ValueError(
-            f"Format not supported: {format}. Choose one of: 'gz', 'xz', 'bz2'"
+            f"Format not supported: {format}. Choose one of: "
+            + ", ".join(f"'{name}'" for name in codecs)
         )
 
     if format == "raw":
@@ -217,65 +703,21 @@ def _open(
         if detected_format is None and "r" in mode:
             detected_format = _detect_format_from_content(filename)
 
-    if detected_format == "gz":
-        opened_file = _open_gz(filename, mode, compresslevel)
-    elif detected_format == "xz":
-        opened_file = _open_xz(filename, mode, compresslevel)
-    elif detected_format == "bz2":
-        opened_file = _open_bz2(filename, mode, compresslevel)
-    else:
+    if detected_format is None:
         opened_file, _ = _file_or_path_to_binary_stream(filename, mode)
+        return opened_file
 
+    opened_file = codecs[detected_format].open(filename, mode, compresslevel)
+    if "r" in mode and get_config("io.background_decompression"):
+        opened_file = BufferedReader(BackgroundReader(opened_file))
     return opened_file
 
 
-def _open_bz2(
-    filename: FileOrPath,
-    mode: str,
-    compresslevel: Optional[int] = None,
-) -> BinaryIO:
-    assert mode in ("rb", "ab", "wb")
-    if compresslevel is None:
-        compresslevel = DEFAULT_BZ2_COMPRESSION
-
-    if "r" in mode:
-        return bz2.open(filename, mode)  # type: ignore
-    return BufferedWriter(bz2.open(filename, mode, compresslevel))  # type: ignore
-
-
-def _open_xz(
-    filename: FileOrPath,
-    mode: str,
-    compresslevel: Optional[int] = None,
-) -> BinaryIO:
-    assert mode in ("rb", "ab", "wb")
-    if compresslevel is None:
-        compresslevel = DEFAULT_XZ_COMPRESSION
-
-    if "r" in mode:
-        return lzma.open(filename, mode)  # type: ignore
-    return BufferedWriter(lzma.open(filename, mode, preset=compresslevel))  # type: ignore
-
-
-def _open_gz(
-    filename: FileOrPath,
-    mode: str,
-    compresslevel: Optional[int] = None,
-) -> BinaryIO:
-    assert mode in ("rb", "ab", "wb")
-    if compresslevel is None:
-        compresslevel = DEFAULT_GZIP_COMPRESSION
-
-    if "r" in mode:
-        return gzip.open(filename, mode)  # type: ignore
-    return BufferedWriter(gzip.open(filename, mode, compresslevel=compresslevel))  # type: ignore
-
-
 def get_file_extension(file_or_path: FileLike) -> str:
     """Determine the file extension of the given file-like object.
 
-    If the file has compression extensions such as '.gz', '.xz', or '.bz2',
-    they will be stripped before determining the extension.
+    If the file has compression extensions such as '.gz', '.xz', '.bz2',
+    '.zst' or '.lz4', they will be stripped before determining the extension.
 
     Args:
         file_or_path (FileLike): The file-like object whose extension needs to be determined.
@@ -298,9 +740,9 @@ def get_file_extension(file_or_path: FileLike) -> str:
         file_or_path, "__fspath__"
     ):
         path = os.fspath(file_or_path)  # type: ignore
-        for ext in [".gz", ".xz", ".bz2"]:
-            if path.endswith(ext):
-                path = path[: -len(ext)]
+        for codec in codecs.values():
+            if path.endswith(codec.extension):
+                path = path[: -len(codec.extension)]
         return os.path.splitext(path)[1]
 
     if isinstance(file_or_path, Source):
@@ -311,6 +753,10 @@ def get_file_extension(file_or_path: FileLike) -> str:
     )
 
 
+@deprecated(
+    "get_local_cache_stream does not validate or evict cached files. Please"
+    " use get_download_cache instead."
+)
 def get_local_cache_stream(
     url: str, cache_dir: str, mode: str = "rb", format: Optional[str] = None
 ) -> Tuple[BinaryIO, Union[bool, str]]:
@@ -360,12 +806,141 @@ def get_local_cache_stream(
     return file, file_exists_and_non_empty
 
 
+def get_download_cache() -> Optional[DownloadCache]:
+    """Get the cache for downloaded inputs, as configured by the `cache`,
+    `cache.max_size` and `cache.verify` config. Returns `None` when caching
+    is disabled."""
+    cache_dir = get_config("cache")
+    assert cache_dir is None or isinstance(cache_dir, str)
+    if not cache_dir:
+        return None
+    return DownloadCache(
+        cache_dir,
+        max_size=get_config("cache.max_size"),
+        verify=get_config("cache.verify"),
+    )
+
+
+def _retrieve_remote(uri: str) -> Generator[BinaryIO, None, BinaryIO]:
+    """Open a remote input, using the download cache when it is enabled.
+
+    This generator yields each stream the content of `uri` must be
+    downloaded to and returns the opened input. The download itself is left
+    to the caller, so `_open_remote` and `_open_remote_async` share the
+    caching logic.
+    """
+    download_cache = get_download_cache()
+    if download_cache is None:
+        logger.info(f"Retrieving {uri}")
+        stream = BytesIO()
+        yield stream
+        logger.info(f"Retrieval of {uri} complete")
+        stream.seek(0)
+        return stream
+
+    # The cached file is opened by the cache while its index is locked,
+    # so another process can't evict it before it is read
+    stream = download_cache.open(uri)
+    if stream is not None:
+        logger.info(f"Using local cached file for {uri}")
+    else:
+        logger.info(f"Retrieving {uri}")
+        with download_cache.writer(uri) as output:
+            yield output
+        logger.info(f"Retrieval of {uri} complete")
+        stream = download_cache.open(uri)
+        if stream is None:
+            # Evicted by another process right after the download
+            stream = BytesIO()
+            yield stream
+            stream.seek(0)
+    return _open(stream, "rb")
+
+
+def _open_remote(uri: str, adapter: Adapter) -> BinaryIO:
+    retrieval = _retrieve_remote(uri)
+    try:
+        output = next(retrieval)
+        while True:
+            try:
+                adapter.read_to_stream(uri, output)
+            except BaseException as e:
+                output = retrieval.throw(e)
+            else:
+                output = next(retrieval)
+    except StopIteration as e:
+        return e.value
+
+
+async def _open_remote_async(uri: str, adapter: Adapter) -> BinaryIO:
+    retrieval = _retrieve_remote(uri)
+    try:
+        output = next(retrieval)
+        while True:
+            try:
+                await adapter.read_to_stream_async(uri, output)
+            except BaseException as e:
+                output = retrieval.throw(e)
+            else:
+                output = next(retrieval)
+    except StopIteration as e:
+        return e.value
+
+
+class _Cache:
+    """Inspect and prune the cache for downloaded inputs.
+
+    The cache directory and limits are taken from the `cache`,
+    `cache.max_size` and `cache.verify` config.
+
+    Example:
+        >>> from kloppy.io import cache
+        >>> cache.size()
+        52428800
+        >>> cache.prune(max_size=10 * 1024 * 1024)
+        ['https://raw.githubusercontent.com/statsbomb/open-data/...']
+    """
+
+    def _get(self) -> DownloadCache:
+        download_cache = get_download_cache()
+        if download_cache is None:
+            raise KloppyError("The download cache is disabled")
+        return download_cache
+
+    def entries(self) -> List[CacheEntry]:
+        """All cached inputs, the least recently used first."""
+        return self._get().entries()
+
+    def size(self) -> int:
+        """The total size of the cached files in bytes."""
+        return self._get().size()
+
+    def prune(self, max_size: Optional[int] = None) -> List[str]:
+        """Evict the least recently used inputs until the cache is no larger
+        than `max_size` bytes (defaults to `cache.max_size`). Returns the
+        evicted URLs."""
+        return self._get().prune(max_size)
+
+    def remove(self, url: str) -> bool:
+        """Remove a single input from the cache."""
+        return self._get().remove(url)
+
+    def clear(self):
+        """Remove all inputs from the cache."""
+        self._get().clear()
+
+
+cache = _Cache()
+
+
 @contextlib.contextmanager
 def dummy_context_mgr() -> Generator[None, None, None]:
     yield
 
 
-def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
+def open_as_file(
+    input_: FileLike, memory_map: bool = False
+) -> ContextManager[Optional[BinaryIO]]:
     """Open a byte stream to the given input object.
 
     The following input types are supported:
@@ -383,6 +958,9 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
 
     Args:
         input_ (FileLike): The input object to be opened.
+        memory_map (bool): Memory-map the input when it is an uncompressed
+            local file, instead of reading it through a buffer. See
+            [MappedFile](`kloppy.io.MappedFile`).
 
     Returns:
         BinaryIO: A binary stream to the input object.
@@ -399,8 +977,8 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
         To support reading data from other sources, see the
         [Adapter](`kloppy.io.adapters.Adapter`) class.
 
-        If the given file path or URL ends with '.gz', '.xz', or '.bz2', the
-        file will be decompressed before being read.
+        If the given file path or URL ends with '.gz', '.xz', '.bz2', '.zst'
+        or '.lz4', the file will be decompressed before being read.
     """
     if isinstance(input_, Source):
         if input_.data is None and input_.optional:
@@ -408,7 +986,7 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
             return dummy_context_mgr()
 
         try:
-            return open_as_file(input_.data)
+            return open_as_file(input_.data, memory_map=memory_map)
         except InputNotFoundError:
             if input_.skip_if_missing:
                 logging.info(f"Input {input_.data} not found. Skipping")
@@ -429,33 +1007,14 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
 
         adapter = get_adapter(uri)
         if adapter:
-            cache_dir = get_config("cache")
-            assert cache_dir is None or isinstance(cache_dir, str)
-            if cache_dir:
-                stream, local_cache_file = get_local_cache_stream(
-                    uri, cache_dir, "ab", format="raw"
-                )
-            else:
-                stream, local_cache_file = BytesIO(), None
-
-            if not local_cache_file:
-                logger.info(f"Retrieving {uri}")
-                adapter.read_to_stream(uri, stream)
-                logger.info("Retrieval complete")
-            else:
-                logger.info(f"Using local cached file {local_cache_file}")
-
-            if cache_dir:
-                stream.close()
-                stream, _ = get_local_cache_stream(uri, cache_dir, "rb")
-            else:
-                stream.seek(0)
-
+            stream = _open_remote(uri, adapter)
         else:
             if not os.path.exists(uri):
                 raise InputNotFoundError(f"File {uri} does not exist")
 
-            stream = _open(uri, "rb")
+            stream = memory_map and _open_memory_mapped(uri)
+            if not stream:
+                stream = _open(uri, "rb")
         return stream
 
     if isinstance(input_, TextIOWrapper):
@@ -467,3 +1026,103 @@ def open_as_file(input_: FileLike) -> ContextManager[Optional[BinaryIO]]:
         return _open(input_)  # type: ignore
 
     raise TypeError(f"Unsupported input type: {type(input_)}")
+
+
+async def _open_as_file_async(input_: FileLike) -> Optional[BinaryIO]:
+    if isinstance(input_, Source):
+        if input_.data is None and input_.optional:
+            return None
+
+        try:
+            return await _open_as_file_async(input_.data)
+        except InputNotFoundError:
+            if input_.skip_if_missing:
+                logging.info(f"Input {input_.data} not found. Skipping")
+                return None
+            raise
+
+    is_data_string = isinstance(input_, str) and (
+        "{" in input_ or "<" in input_
+    )
+    if not is_data_string and (
+        isinstance(input_, str) or hasattr(input_, "__fspath__")
+    ):
+        uri = _filepath_from_path_or_filelike(input_)
+
+        adapter = get_adapter(uri)
+        if adapter:
+            return await _open_remote_async(uri, adapter)
+
+    return open_as_file(input_)
+
+
+async def open_as_files_async(*inputs: FileLike) -> List[Optional[BinaryIO]]:
+    """Open byte streams to multiple inputs at once.
+
+    Remote inputs are downloaded concurrently using the `read_to_stream_async`
+    method of their [Adapter](`kloppy.io.adapters.Adapter`). Optional inputs
+    that are missing result in `None`. The caller is responsible for closing
+    the streams.
+
+    Args:
+        inputs (FileLike): The input objects to be opened. See
+            [open_as_file](`kloppy.io.open_as_file`) for the supported types.
+
+    Returns:
+        List[Optional[BinaryIO]]: A binary stream for every input.
+
+    Example:
+        >>> event_data_fp, lineup_data_fp = await open_as_files_async(
+        ...     "https://example.com/events.json",
+        ...     "https://example.com/lineups.json",
+        ... )
+    """
+    results = await asyncio.gather(
+        *(_open_as_file_async(input_) for input_ in inputs),
+        return_exceptions=True,
+    )
+
+    errors = [
+        result for result in results if isinstance(result, BaseException)
+    ]
+    if errors:
+        for result in results:
+            if result is not None and not isinstance(result, BaseException):
+                result.close()
+        raise errors[0]
+
+    return list(results)
+
+
+def _run_coroutine(coroutine: Coroutine[Any, Any, T]) -> T:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
+
+    # An event loop is already running in this thread (e.g. in a notebook),
+    # so run the coroutine in its own event loop in another thread.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
+
+
+@contextlib.contextmanager
+def open_as_files(
+    *inputs: FileLike,
+) -> Generator[List[Optional[BinaryIO]], None, None]:
+    """Open byte streams to multiple inputs at once, downloading remote
+    inputs concurrently. The streams are closed when the context exits.
+
+    See [open_as_files_async](`kloppy.io.open_as_files_async`).
+
+    Example:
+        >>> with open_as_files(events_url, lineups_url) as (events_fp, lineups_fp):
+        ...     events = json.load(events_fp)
+    """
+    streams = _run_coroutine(open_as_files_async(*inputs))
+    try:
+        yield streams
+    finally:
+        for stream in streams:
+            if stream is not None:
+                stream.close()
@@ -1,3 +1,3 @@
-from ._providers.secondspectrum import load
+from ._providers.secondspectrum import load, load_live
 
-__all__ = ["load"]
+__all__ = ["load", "load_live"]
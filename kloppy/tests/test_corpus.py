@@ -0,0 +1,125 @@
+import pytest
+
+from kloppy import statsbomb
+from kloppy.domain import EventCorpus
+from kloppy.exceptions import KloppyParameterError
+
+
+class TestEventCorpus:
+    @pytest.fixture(scope="class")
+    def datasets(self, base_dir):
+        return {
+            match_id: statsbomb.load(
+                event_data=base_dir / f"files/statsbomb_{match_id}_event.json",
+                lineup_data=base_dir
+                / f"files/statsbomb_{match_id}_lineup.json",
+            )
+            for match_id in ["15986", "3788741"]
+        }
+
+    @pytest.fixture(scope="class")
+    def corpus(self, datasets) -> EventCorpus:
+        return EventCorpus.from_datasets(datasets.items())
+
+    def test_table(self, corpus: EventCorpus, datasets):
+        assert len(corpus) == sum(
+            len(dataset) for dataset in datasets.values()
+        )
+        assert corpus.column_names == ["match_id"] + list(
+            datasets["15986"].to_dict().keys()
+        )
+        assert corpus.column("event_id")[: len(datasets["15986"])] == [
+            event.event_id for event in datasets["15986"]
+        ]
+        assert set(corpus.metadata.keys()) == {"15986", "3788741"}
+
+    def test_interned_players(self, corpus: EventCorpus, datasets):
+        player_ids = {
+            player.player_id
+            for dataset in datasets.values()
+            for team in dataset.metadata.teams
+            for player in team.players
+        }
+        assert set(corpus.players.keys()) == player_ids
+        assert len(corpus.teams) == len(
+            {
+                team.team_id
+                for dataset in datasets.values()
+                for team in dataset.metadata.teams
+            }
+        )
+
+    def test_filter_and_groupby(self, corpus: EventCorpus, datasets):
+        shots = corpus.filter(event_type="SHOT")
+        assert len(shots) == sum(
+            len(dataset.find_all("shot")) for dataset in datasets.values()
+        )
+
+        shots_per_match = shots.groupby("match_id")
+        assert {
+            match_id: len(match_shots)
+            for match_id, match_shots in shots_per_match.items()
+        } == {
+            match_id: len(dataset.find_all("shot"))
+            for match_id, dataset in datasets.items()
+        }
+        assert set(shots_per_match["15986"].metadata.keys()) == {"15986"}
+
+        mask = [
+            x is not None and x > 0.5 for x in corpus.column("coordinates_x")
+        ]
+        assert len(corpus.filter(mask)) == sum(mask)
+
+        with pytest.raises(KloppyParameterError):
+            corpus.filter(mask[:-1])
+
+    def test_filter_indexed_columns(self, corpus: EventCorpus):
+        """Filtering on indexed and other columns should select the same
+        events as comparing every row."""
+        team_id = corpus.column("team_id")[0]
+        passes = corpus.filter(
+            event_type="PASS", team_id=team_id, result="COMPLETE"
+        )
+        expected = [
+            event_id
+            for event_id, event_type, event_team_id, result in zip(
+                corpus.column("event_id"),
+                corpus.column("event_type"),
+                corpus.column("team_id"),
+                corpus.column("result"),
+            )
+            if event_type == "PASS"
+            and event_team_id == team_id
+            and result == "COMPLETE"
+        ]
+        assert len(expected) > 0
+        assert passes.column("event_id") == expected
+        assert passes.filter(event_type="SHOT").column("event_id") == []
+
+        passes_per_player = passes.groupby("player_id")
+        assert sum(len(group) for group in passes_per_player.values()) == len(
+            passes
+        )
+        for player_id, group in passes_per_player.items():
+            assert set(group.column("player_id")) == {player_id}
+
+    def test_add_after_filter(self, datasets):
+        """The index should be updated when matches are added."""
+        corpus = EventCorpus.from_datasets([("15986", datasets["15986"])])
+        assert len(corpus.filter(event_type="SHOT")) == len(
+            datasets["15986"].find_all("shot")
+        )
+
+        corpus.add(datasets["3788741"], match_id="3788741")
+        assert len(corpus.filter(event_type="SHOT")) == sum(
+            len(dataset.find_all("shot")) for dataset in datasets.values()
+        )
+
+    def test_duplicate_match(self, corpus: EventCorpus, datasets):
+        with pytest.raises(KloppyParameterError):
+            corpus.add(datasets["15986"], match_id="15986")
+
+    def test_to_df(self, corpus: EventCorpus):
+        df = corpus.to_df(engine="pandas")
+        assert len(df) == len(corpus)
+        assert list(df.columns) == corpus.column_names
@@ -1,7 +1,9 @@
 import pytest
 
 from kloppy import statsbomb
-from kloppy.domain import EventDataset
+from kloppy.domain import EventDataset, EventType, Ground
+from kloppy.domain.services.matchers.css import EventIndex
+from kloppy.exceptions import InvalidFilterError
 
 
 class TestEvent:
@@ -87,3 +89,124 @@ class TestEvent:
         assert goals[0].next("shot.goal") == goals[1]
         assert goals[0].next("shot.goal") == goals[2].prev("shot.goal")
         assert goals[2].next("shot.goal") is None
+
+    @pytest.mark.parametrize(
+        "selector",
+        ["pass", "PASS", "pass.complete", ".goal", "shot.goal", "generic"],
+    )
+    def test_find_all_simple_selector(
+        self, dataset: EventDataset, selector: str
+    ):
+        """
+        Test that simple selectors select the same events as Event.matches
+        """
+        assert dataset.find_all(selector) == [
+            event for event in dataset.events if event.matches(selector)
+        ]
+
+    def test_css_selector(self, dataset: EventDataset):
+        """
+        Test class and adjacency selectors
+        """
+        events = dataset.events
+
+        assert dataset.find_all("pass.home") == [
+            event
+            for event in events
+            if event.event_type == EventType.PASS
+            and event.team.ground == Ground.HOME
+        ]
+
+        passes_and_shots = dataset.filter(
+            lambda event: event.event_type in (EventType.PASS, EventType.SHOT)
+        )
+        expected = [
+            event
+            for prev_event, event in zip(
+                passes_and_shots.events, passes_and_shots.events[1:]
+            )
+            if prev_event.event_type == EventType.PASS
+            and event.event_type == EventType.SHOT
+        ]
+        assert expected
+        assert passes_and_shots.find_all("pass > shot") == expected
+        assert passes_and_shots.find_all("pass + shot") == expected
+
+        first_goal = dataset.find("shot.goal")
+        assert dataset.find_all("shot.goal ~ shot") == [
+            event
+            for event in dataset.find_all("shot")
+            if events.index(event) > events.index(first_goal)
+        ]
+        assert dataset.find_all("shot.goal shot") == dataset.find_all(
+            "shot.goal ~ shot"
+        )
+
+        assert dataset.find_all("shot.goal, card") == [
+            event
+            for event in events
+            if event.matches("shot.goal") or event.event_type == EventType.CARD
+        ]
+
+        filtered = passes_and_shots.filter("pass > shot")
+        assert isinstance(filtered, EventDataset)
+        assert filtered.records == expected
+
+    def test_css_selector_skips_generic(self, dataset: EventDataset):
+        """
+        Test that combinators skip generic events (like ball receipts)
+        """
+        events = [
+            event
+            for event in dataset.events
+            if event.event_type != EventType.GENERIC
+        ]
+        assert len(events) < len(dataset.events)
+
+        expected = [
+            event
+            for prev_event, event in zip(events, events[1:])
+            if prev_event.event_type == EventType.PASS
+            and event.event_type == EventType.SHOT
+        ]
+        assert len(expected) == 6
+        assert dataset.find_all("pass > shot") == expected
+
+        assert dataset.find_all("pass.home > shot.home") == [
+            event
+            for prev_event, event in zip(events, events[1:])
+            if prev_event.matches("pass")
+            and event.matches("shot")
+            and prev_event.team.ground == event.team.ground == Ground.HOME
+        ]
+        assert len(dataset.find_all("*")) == len(events)
+        assert dataset.find_all("pass ~ generic") == []
+
+    def test_css_selector_edited_records(self, dataset: EventDataset):
+        """
+        Test that selectors see records that are edited in place once the
+        index is invalidated
+        """
+        records = dataset.records
+        shots = dataset.find_all("shot")
+        assert shots
+
+        # Replace a shot by another event, keeping the number of records
+        records[records.index(shots[0])] = dataset.find("pass")
+        EventIndex.invalidate(dataset)
+        assert dataset.find_all("shot") == shots[1:]
+
+        shots[1].result = None
+        EventIndex.invalidate(dataset)
+        assert dataset.find_all("shot.off_target, shot.saved") == [
+            shot
+            for shot in shots[2:]
+            if shot.matches("shot.off_target") or shot.matches("shot.saved")
+        ]
+
+    @pytest.mark.parametrize(
+        "selector", ["passes", "pass >", "> pass", "pass:first", "pass..home"]
+    )
+    def test_invalid_css_selector(self, dataset: EventDataset, selector):
+        with pytest.raises(InvalidFilterError):
+            dataset.find_all(selector)
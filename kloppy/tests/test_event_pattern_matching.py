@@ -0,0 +1,183 @@
+import pickle
+
+import pytest
+
+from kloppy import event_pattern_matching as pm
+from kloppy import statsbomb
+from kloppy.domain import EventDataset, PassEvent, ShotEvent
+from kloppy.domain.services.matchers.pattern.regexp import (
+    CompiledRegExp,
+    Eq,
+    Final,
+    RegExp,
+    Test,
+)
+
+
+def legacy_search(events, pattern):
+    """Search by matching from every start index, like `search` used to."""
+    re = RegExp.from_ast(pattern)
+    results = []
+    for i in range(len(events)):
+        matches = re.match(events[i:], consume_all=False)
+        if matches:
+            results.append((i, matches[0]))
+    return results
+
+
+class TestCompiledRegExp:
+    def test_search(self):
+        """It should find the longest match at every start position."""
+        re = CompiledRegExp.from_ast(
+            Final(Eq("a"))["first"] + Final(Eq("b")) * slice(1, None)
+        )
+        matches = re.search("abbcabab")
+        assert [(start, "".join(m.trail)) for start, m in matches] == [
+            (0, "abb"),
+            (4, "ab"),
+            (6, "ab"),
+        ]
+        assert matches[0][1]["first"].trail == ("a",)
+
+    @pytest.mark.parametrize(
+        "pattern",
+        [
+            Final(Eq("a")) + Final(Eq("b")) * slice(None, 2),
+            (Final(Eq("a"))["x"] | Final(Eq("b"))["y"]) * slice(1, None),
+            Final(Eq("a")) + (Final(Eq("b"))["y"] + Final(Eq("a")))["z"],
+        ],
+    )
+    def test_same_as_match(self, pattern):
+        """It should give the same matches as RegExp.match."""
+        seq = "abbabaabbbab"
+        compiled = CompiledRegExp.from_ast(pattern).search(seq)
+        assert compiled == legacy_search(seq, pattern)
+
+    def test_skip_token_types(self):
+        """It should only call matchers for tokens of an accepted type."""
+        calls = []
+
+        class IntMatcher(Test):
+            types = (int,)
+
+        def is_even(token):
+            calls.append(token)
+            return token % 2 == 0
+
+        re = CompiledRegExp.from_ast(
+            Final(IntMatcher(is_even)) + Final(Eq("x"))
+        )
+        matches = re.search([1, "x", 2, "x", "y", 4, "y", 6, "x"])
+        assert [start for start, _ in matches] == [2, 7]
+        assert calls == [1, 2, 4, 6]
+
+    def test_pickle(self):
+        """It should be possible to send a compiled pattern to another
+        process."""
+        re = CompiledRegExp.from_ast(
+            pm.match_pass(capture="pass")
+            + pm.match_shot(team=pm.not_same_as("pass.team"))
+        )
+        unpickled = pickle.loads(pickle.dumps(re))
+        assert len(unpickled.transitions) == len(re.transitions)
+
+
+class TestEventSearch:
+    @pytest.fixture(scope="class")
+    def dataset(self, base_dir) -> EventDataset:
+        return statsbomb.load(
+            event_data=base_dir / "files/statsbomb_event.json",
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+            event_types=["pass", "shot"],
+        )
+
+    def test_same_as_legacy_search(self, dataset: EventDataset):
+        """It should find the same matches and captures as matching from
+        every start index."""
+        pattern = (
+            pm.match_pass(capture="last_pass_of_team_a")
+            + pm.match_pass(team=pm.not_same_as("last_pass_of_team_a.team"))
+            * slice(1, None)
+            + pm.group(
+                pm.match_pass(
+                    success=True,
+                    team=pm.same_as("last_pass_of_team_a.team"),
+                    capture="recover",
+                )
+                + pm.match_any() * slice(None, 2),
+                capture="success",
+            )
+            * slice(0, 1)
+        )
+
+        matches = pm.search(dataset, pattern)
+        assert matches
+
+        expected = []
+        for period in dataset.metadata.periods:
+            events = [
+                event for event in dataset.events if event.period == period
+            ]
+            for _, match in legacy_search(events, pattern):
+                expected.append(
+                    (
+                        match.trail,
+                        {
+                            name: value[0].trail[0]
+                            for name, value in match.children.items()
+                        },
+                    )
+                )
+
+        assert [
+            (match.events, match.captures) for match in matches
+        ] == expected
+        assert any("success" in match.captures for match in matches)
+
+    def test_pass_followed_by_shot(self, dataset: EventDataset):
+        """It should find passes followed by a shot of the same team."""
+        matches = pm.search(
+            dataset,
+            pm.match_pass(capture="pass")
+            + pm.match_shot(team=pm.same_as("pass.team")),
+        )
+
+        expected = [
+            [event, event.next_record]
+            for event in dataset.events
+            if isinstance(event, PassEvent)
+            and isinstance(event.next_record, ShotEvent)
+            and event.next_record.team == event.team
+            and event.next_record.period == event.period
+        ]
+        assert expected
+        assert [list(match.events) for match in matches] == expected
+        assert [match.captures["pass"] for match in matches] == [
+            events[0] for events in expected
+        ]
+
+    def test_workers(self, dataset: EventDataset, base_dir):
+        """It should give the same matches, in the same order, when the
+        periods of multiple datasets are searched by worker processes."""
+        other_dataset = statsbomb.load(
+            event_data=base_dir / "files/statsbomb_15986_event.json",
+            lineup_data=base_dir / "files/statsbomb_15986_lineup.json",
+            event_types=["pass", "shot"],
+        )
+        pattern = pm.match_pass(capture="pass") + pm.match_pass(
+            team=pm.same_as("pass.team"), success=True
+        ) * slice(2, None)
+
+        expected = pm.search([dataset, other_dataset], pattern)
+        matches = pm.search([dataset, other_dataset], pattern, workers=2)
+
+        assert len(matches) == len(expected)
+        for match, expected_match in zip(matches, expected):
+            assert len(match.events) == len(expected_match.events)
+            assert all(
+                event is expected_event
+                for event, expected_event in zip(
+                    match.events, expected_match.events
+                )
+            )
+            assert match.captures["pass"] is expected_match.captures["pass"]
@@ -1,3 +1,5 @@
+import json
+import pickle
 import sys
 
 import pytest
@@ -10,6 +12,7 @@ from kloppy.domain import (
     AttackingDirection,
     DatasetFlag,
     Dimension,
+    EventDataset,
     Ground,
     Metadata,
     MetricaCoordinateSystem,
@@ -25,6 +28,7 @@ from kloppy.domain import (
     TrackingDataset,
 )
 from kloppy.domain.services.frame_factory import create_frame
+from kloppy.exceptions import KloppyParameterError
 
 
 class TestHelpers:
@@ -514,3 +518,216 @@ class TestHelpers:
         df = dataset.to_df(engine="pandas[pyarrow]")
         assert isinstance(df, pd.DataFrame)
         assert isinstance(df.dtypes["ball_x"], pd.ArrowDtype)
+
+    def test_concat_event_data(self, base_dir):
+        def load():
+            return statsbomb.load(
+                event_data=base_dir / "files/statsbomb_15986_event.json",
+                lineup_data=base_dir / "files/statsbomb_15986_lineup.json",
+            )
+
+        expected = load()
+        first_half = load().filter(lambda event: event.period.id == 1)
+        second_half = load().filter(lambda event: event.period.id > 1)
+
+        dataset = EventDataset.concat([first_half, second_half])
+
+        assert len(dataset) == len(expected)
+        assert dataset.metadata is first_half.metadata
+        assert [event.event_id for event in dataset] == [
+            event.event_id for event in expected
+        ]
+        assert all(event.dataset is dataset for event in dataset)
+        assert all(
+            event.period is dataset.metadata.periods[event.period.id - 1]
+            for event in dataset
+        )
+        players = {
+            player.player_id: player
+            for team in dataset.metadata.teams
+            for player in team.players
+        }
+        assert all(
+            event.player is players[event.player.player_id]
+            for event in dataset
+            if event.player
+        )
+        freeze_frame_players = [
+            player
+            for event in dataset
+            if event.freeze_frame
+            for player in event.freeze_frame.players_data
+            if player
+        ]
+        assert freeze_frame_players
+        assert all(
+            player is players[player.player_id]
+            for player in freeze_frame_players
+        )
+
+        boundary = len(first_half)
+        assert dataset[boundary - 1].next_record is dataset[boundary]
+        assert dataset[boundary].prev_record is dataset[boundary - 1]
+
+        # the substitutions of the second half are applied to the players in
+        # the metadata
+        for team, expected_team in zip(
+            dataset.metadata.teams, expected.metadata.teams
+        ):
+            for player, expected_player in zip(
+                team.players, expected_team.players
+            ):
+                assert len(player.positions.items) == len(
+                    expected_player.positions.items
+                )
+
+    def test_concat_tracking_data(self, base_dir):
+        def load(only_alive):
+            return tracab.load(
+                meta_data=base_dir / "files/tracab_meta.xml",
+                raw_data=base_dir / "files/tracab_raw.dat",
+                only_alive=only_alive,
+            )
+
+        expected = load(only_alive=False)
+        parts = [
+            load(only_alive=False).filter(
+                lambda frame: frame.period.id == period_id
+            )
+            for period_id in (1, 2)
+        ]
+
+        dataset = TrackingDataset.concat(parts)
+
+        assert len(dataset) == len(expected)
+        assert [frame.frame_id for frame in dataset] == [
+            frame.frame_id for frame in expected
+        ]
+        assert all(frame.dataset is dataset for frame in dataset)
+        assert [period.id for period in dataset.metadata.periods] == [1, 2]
+        assert (
+            dataset.metadata.periods[0].next_period
+            is dataset.metadata.periods[1]
+        )
+
+        # the player data of the second part refers to the players in the
+        # metadata of the first part
+        players = {
+            player.player_id: player
+            for team in dataset.metadata.teams
+            for player in team.players
+        }
+        assert dataset.metadata is parts[0].metadata
+        assert all(
+            player is players[player.player_id]
+            for frame in dataset
+            for player in frame.players_data
+        )
+        assert dataset[-1].players_data
+
+    def test_concat_unseen_players(self, base_dir):
+        def load():
+            return statsbomb.load(
+                event_data=base_dir / "files/statsbomb_15986_event.json",
+                lineup_data=base_dir / "files/statsbomb_15986_lineup.json",
+            )
+
+        first_half = load().filter(lambda event: event.period.id == 1)
+        second_half = load().filter(lambda event: event.period.id > 1)
+
+        def plays(dataset, player):
+            return any(
+                event.player and event.player.player_id == player.player_id
+                for event in dataset
+            )
+
+        # A substitute that is only known to the second half
+        home_team = first_half.metadata.teams[0]
+        unseen_player = next(
+            player
+            for player in home_team.players
+            if plays(second_half, player) and not plays(first_half, player)
+        )
+        home_team.players.remove(unseen_player)
+
+        dataset = EventDataset.concat([first_half, second_half])
+
+        home_team = dataset.metadata.teams[0]
+        player = home_team.get_player_by_id(unseen_player.player_id)
+        assert player is not None
+        assert player.team is home_team
+        assert all(
+            event.player is player
+            for event in dataset
+            if event.player
+            and event.player.player_id == unseen_player.player_id
+        )
+        players = {
+            player.player_id: player
+            for team in dataset.metadata.teams
+            for player in team.players
+        }
+        assert all(
+            event.player is players[event.player.player_id]
+            for event in dataset
+            if event.player
+        )
+
+    def test_concat_incompatible(self, base_dir):
+        tracking_dataset = self._get_tracking_dataset()
+        event_dataset = statsbomb.load(
+            event_data=base_dir / "files/statsbomb_15986_event.json",
+            lineup_data=base_dir / "files/statsbomb_15986_lineup.json",
+        )
+
+        with pytest.raises(KloppyParameterError):
+            TrackingDataset.concat([])
+        with pytest.raises(KloppyParameterError):
+            EventDataset.concat([event_dataset, tracking_dataset])
+        with pytest.raises(KloppyParameterError):
+            TrackingDataset.concat(
+                [
+                    tracking_dataset,
+                    tracking_dataset.transform(
+                        to_orientation=Orientation.AWAY_HOME
+                    ),
+                ]
+            )
+
+    def test_pickle(self, base_dir, tmp_path):
+        three_sixty_file = tmp_path / "statsbomb_360.json"
+        three_sixty_file.write_text(
+            json.dumps(
+                [
+                    {
+                        "event_uuid": "719bbdb1-8743-4c95-b5a5-b61a0c392741",
+                        "visible_area": [0.0, 0.0, 120.0, 0.0, 120.0, 80.0],
+                        "freeze_frame": [
+                            {
+                                "teammate": True,
+                                "actor": True,
+                                "keeper": False,
+                                "location": [20.0, 40.0],
+                            }
+                        ],
+                    }
+                ]
+            )
+        )
+        dataset = statsbomb.load(
+            event_data=base_dir / "files/statsbomb_event.json",
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+            three_sixty_data=three_sixty_file,
+        )
+
+        unpickled = pickle.loads(pickle.dumps(dataset))
+
+        assert len(unpickled) == len(dataset)
+        assert all(event.dataset is unpickled for event in unpickled)
+        assert unpickled.records[1].prev_record is unpickled.records[0]
+        assert unpickled.records[0].next_record is unpickled.records[1]
+        assert unpickled.records[-1].next_record is None
+        assert unpickled.get_event_by_id(
+            "719bbdb1-8743-4c95-b5a5-b61a0c392741"
+        ).freeze_frame.players_coordinates
+        assert_frame_equal(unpickled.to_df(), dataset.to_df())
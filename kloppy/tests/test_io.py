@@ -1,14 +1,33 @@
+import asyncio
 import gzip
 import json
-from io import BytesIO
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BufferedReader, BytesIO
 from pathlib import Path
 
 import pytest
 import s3fs
 from moto import mock_aws
 
-from kloppy.exceptions import InputNotFoundError
-from kloppy.io import get_file_extension, open_as_file
+from kloppy.config import config_context
+from kloppy.exceptions import InputNotFoundError, KloppyError
+from kloppy.infra.io.cache import DownloadCache
+from kloppy.io import (
+    BackgroundReader,
+    MappedFile,
+    Source,
+    cache,
+    get_file_extension,
+    get_download_cache,
+    iter_json_object,
+    iter_lines,
+    open_as_file,
+    open_as_files,
+    open_as_files_async,
+)
 
 
 @pytest.fixture()
@@ -115,6 +134,69 @@ class TestOpenAsFile:
             assert fp is not None
             assert fp.read() == b"Hello, world!"
 
+    @pytest.mark.parametrize(
+        "ext,module", [(".zst", "zstandard"), (".lz4", "lz4.frame")]
+    )
+    def test_path_compressed_optional_codec(
+        self, tmp_path: Path, ext: str, module: str
+    ):
+        """It should be able to open files compressed with zstd or lz4."""
+        pytest.importorskip(module)
+        from kloppy.io import _open
+
+        path = tmp_path / f"testfile.txt{ext}"
+        with _open(path, "wb") as f_out:
+            f_out.write(b"Hello, world!")
+
+        with open_as_file(path) as fp:
+            assert fp.read() == b"Hello, world!"
+
+        # detect the format from the content
+        path.rename(tmp_path / "testfile.bin")
+        with open_as_file(tmp_path / "testfile.bin") as fp:
+            assert fp.read() == b"Hello, world!"
+
+    def test_path_compressed_missing_codec(self, tmp_path: Path):
+        """It should explain how to install a missing codec."""
+        try:
+            import zstandard  # noqa: F401
+
+            pytest.skip("zstandard is installed")
+        except ImportError:
+            pass
+
+        path = tmp_path / "testfile.txt.zst"
+        path.write_bytes(b"\x28\xb5\x2f\xfd")
+        with pytest.raises(ImportError, match="pip install zstandard"):
+            with open_as_file(path):
+                pass
+
+    @pytest.mark.parametrize("ext", [".gz", ".xz", ".bz2"])
+    def test_background_decompression(
+        self, filesystem_content: Path, ext: str
+    ):
+        """It should be able to decompress files in a background thread."""
+        path = filesystem_content / f"testfile.txt{ext}"
+        with config_context("io.background_decompression", True):
+            with open_as_file(path) as fp:
+                assert isinstance(fp.raw, BackgroundReader)
+                assert fp.read() == b"Hello, world!"
+
+    def test_memory_map(self, filesystem_content: Path):
+        """It should memory-map uncompressed local files on request."""
+        path = filesystem_content / "testfile.txt"
+        with open_as_file(path, memory_map=True) as fp:
+            assert isinstance(fp, MappedFile)
+            assert fp.read(5) == b"Hello"
+            assert fp.tell() == 5
+            assert fp.read() == b", world!"
+
+        with open_as_file(
+            filesystem_content / "testfile.txt.gz", memory_map=True
+        ) as fp:
+            assert not isinstance(fp, MappedFile)
+            assert fp.read() == b"Hello, world!"
+
     def test_path_missing(self, filesystem_content: Path):
         """It should raise an error if the file is not found."""
         path = filesystem_content / "missing.txt"
@@ -164,8 +246,359 @@ class TestOpenAsFile:
             assert fp.read() == b"Hello, world!"
 
 
+@pytest.fixture
+def keep_alive_server():
+    """A HTTP/1.1 server that counts the connections it accepts."""
+    files = {f"/file{i}.txt": f"Hello, world {i}!".encode() for i in range(3)}
+    connections = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def setup(self):
+            super().setup()
+            connections.append(self.client_address)
+
+        def do_GET(self):
+            body = files.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    server.connections = connections
+    server.files = files
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+class TestOpenAsFiles:
+    """Tests for the open_as_files and open_as_files_async functions."""
+
+    def test_mixed_inputs(self, keep_alive_server, filesystem_content: Path):
+        """It should open remote, local and in-memory inputs together."""
+        with config_context("cache", None):
+            with open_as_files(
+                f"{keep_alive_server.url}/file0.txt",
+                filesystem_content / "testfile.txt",
+                b"Hello, bytes!",
+                Source(
+                    f"{keep_alive_server.url}/missing.txt",
+                    skip_if_missing=True,
+                ),
+                Source.create(None, optional=True),
+            ) as (remote_fp, local_fp, bytes_fp, missing_fp, optional_fp):
+                assert remote_fp.read() == b"Hello, world 0!"
+                assert local_fp.read() == b"Hello, world!"
+                assert bytes_fp.read() == b"Hello, bytes!"
+                assert missing_fp is None
+                assert optional_fp is None
+
+    def test_missing(self, keep_alive_server):
+        """It should raise an error if a required input is not found."""
+        with config_context("cache", None):
+            with pytest.raises(InputNotFoundError):
+                with open_as_files(
+                    f"{keep_alive_server.url}/file0.txt",
+                    f"{keep_alive_server.url}/missing.txt",
+                ):
+                    pass
+
+    def test_missing_cached(self, keep_alive_server, tmp_path: Path):
+        """A failed download should not end up in the cache."""
+        url = f"{keep_alive_server.url}/missing.txt"
+        with config_context("cache", str(tmp_path / "cache")):
+            with pytest.raises(InputNotFoundError):
+                with open_as_file(url):
+                    pass
+            with pytest.raises(InputNotFoundError):
+                with open_as_files(url):
+                    pass
+
+            download_cache = get_download_cache()
+            assert download_cache.entries() == []
+            assert os.listdir(download_cache.tmp_dir) == []
+
+    def test_connection_reuse(self, keep_alive_server):
+        """Consecutive downloads should reuse the same connection."""
+        with config_context("cache", None):
+            for i in range(3):
+                with open_as_file(
+                    f"{keep_alive_server.url}/file{i}.txt"
+                ) as fp:
+                    assert (
+                        fp.read() == keep_alive_server.files[f"/file{i}.txt"]
+                    )
+
+        assert len(keep_alive_server.connections) == 1
+
+    def test_cache(self, keep_alive_server, tmp_path: Path):
+        """Downloaded inputs should be read from the cache the next time."""
+        urls = [f"{keep_alive_server.url}/file{i}.txt" for i in range(3)]
+        with config_context("cache", str(tmp_path / "cache")):
+            with open_as_files(*urls) as streams:
+                assert [fp.read() for fp in streams] == list(
+                    keep_alive_server.files.values()
+                )
+            requests_made = len(keep_alive_server.connections)
+
+            with open_as_files(*urls) as streams:
+                assert [fp.read() for fp in streams] == list(
+                    keep_alive_server.files.values()
+                )
+            assert len(keep_alive_server.connections) == requests_made
+
+    def test_async(self, keep_alive_server):
+        """It should download inputs concurrently from a running loop."""
+        urls = [f"{keep_alive_server.url}/file{i}.txt" for i in range(3)]
+
+        async def download():
+            streams = await open_as_files_async(*urls)
+            try:
+                return [fp.read() for fp in streams]
+            finally:
+                for fp in streams:
+                    fp.close()
+
+        async def download_sync():
+            # open_as_files can also be used while an event loop is running
+            with open_as_files(*urls) as streams:
+                return [fp.read() for fp in streams]
+
+        with config_context("cache", None):
+            assert asyncio.run(download()) == list(
+                keep_alive_server.files.values()
+            )
+            assert asyncio.run(download_sync()) == list(
+                keep_alive_server.files.values()
+            )
+
+
+class TestDownloadCache:
+    """Tests for the cache of downloaded inputs."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path: Path) -> str:
+        return str(tmp_path / "cache")
+
+    def test_interrupted_download(self, cache_dir: str):
+        """An interrupted download should not end up in the cache."""
+        download_cache = DownloadCache(cache_dir)
+        with pytest.raises(ConnectionError):
+            with download_cache.writer("http://example.com/file") as output:
+                output.write(b"Hello, ")
+                raise ConnectionError()
+
+        assert download_cache.get("http://example.com/file") is None
+        assert download_cache.entries() == []
+        assert os.listdir(download_cache.tmp_dir) == []
+
+    def test_content_addressed(self, cache_dir: str):
+        """Inputs with the same content should be stored once."""
+        download_cache = DownloadCache(cache_dir)
+        for url in ["http://example.com/a", "http://example.com/b"]:
+            with download_cache.writer(url) as output:
+                output.write(b"Hello, world!")
+
+        assert download_cache.get("http://example.com/a") == output.path
+        assert download_cache.get("http://example.com/b") == output.path
+        assert download_cache.size() == len(b"Hello, world!")
+
+        download_cache.remove("http://example.com/a")
+        assert os.path.exists(output.path)
+        download_cache.remove("http://example.com/b")
+        assert not os.path.exists(output.path)
+
+    @pytest.mark.skipif(
+        sys.platform == "win32", reason="open files can't be removed"
+    )
+    def test_open_evicted(self, cache_dir: str):
+        """A cached file that is opened should stay readable when it is
+        evicted."""
+        download_cache = DownloadCache(cache_dir)
+        with download_cache.writer("http://example.com/file") as output:
+            output.write(b"Hello, world!")
+
+        with download_cache.open("http://example.com/file") as fp:
+            assert download_cache.prune(max_size=0) == [
+                "http://example.com/file"
+            ]
+            assert fp.read() == b"Hello, world!"
+
+        assert download_cache.open("http://example.com/file") is None
+
+    def test_eviction(self, keep_alive_server, cache_dir: str):
+        """The least recently used inputs should be evicted."""
+        urls = [f"{keep_alive_server.url}/file{i}.txt" for i in range(3)]
+        file_size = len(keep_alive_server.files["/file0.txt"])
+        with config_context(
+            "cache", cache_dir, "cache.max_size", 2 * file_size
+        ):
+            for url in urls[:2]:
+                with open_as_file(url) as fp:
+                    fp.read()
+            # use the first file again, so the second one is evicted
+            with open_as_file(urls[0]) as fp:
+                fp.read()
+            with open_as_file(urls[2]) as fp:
+                fp.read()
+
+            assert [entry.url for entry in cache.entries()] == [
+                urls[0],
+                urls[2],
+            ]
+            assert cache.size() == 2 * file_size
+
+    def test_verify(self, keep_alive_server, cache_dir: str):
+        """Corrupt cached files should be downloaded again."""
+        url = f"{keep_alive_server.url}/file0.txt"
+        with config_context("cache", cache_dir, "cache.verify", True):
+            with open_as_file(url) as fp:
+                assert fp.read() == b"Hello, world 0!"
+
+            (entry,) = cache.entries()
+            with open(entry.path, "wb") as fp:
+                fp.write(b"Hello, World 0!")
+
+            with open_as_file(url) as fp:
+                assert fp.read() == b"Hello, world 0!"
+
+    def test_cache_api(self, keep_alive_server, cache_dir: str):
+        """It should be possible to inspect and prune the cache."""
+        urls = [f"{keep_alive_server.url}/file{i}.txt" for i in range(3)]
+        with config_context("cache", cache_dir):
+            with open_as_files(*urls):
+                pass
+
+            assert len(cache.entries()) == 3
+            assert cache.size() == sum(
+                len(content) for content in keep_alive_server.files.values()
+            )
+
+            evicted = cache.prune(max_size=cache.size() - 1)
+            assert len(evicted) == 1
+            assert len(cache.entries()) == 2
+
+            assert cache.remove(cache.entries()[0].url)
+            assert len(cache.entries()) == 1
+
+            cache.clear()
+            assert cache.entries() == []
+            assert cache.size() == 0
+
+        with config_context("cache", None):
+            with pytest.raises(KloppyError):
+                cache.size()
+
+
+class TestBackgroundReader:
+    """Tests for reading a stream in a background thread."""
+
+    def test_read(self):
+        data = b"".join(f"line {i}\n".encode() for i in range(1000))
+        with BufferedReader(
+            BackgroundReader(BytesIO(data), chunk_size=7, buffer_size=2)
+        ) as fp:
+            assert fp.readline() == b"line 0\n"
+            assert fp.read(7) == b"line 1\n"
+            assert fp.readlines() == data.splitlines(keepends=True)[2:]
+            assert fp.read() == b""
+
+    def test_error(self):
+        class FailingStream(BytesIO):
+            def read(self, size=-1):
+                if self.tell() > 10:
+                    raise EOFError("Compressed file ended too early")
+                return super().read(size)
+
+        with BufferedReader(
+            BackgroundReader(FailingStream(b"x" * 100), chunk_size=5)
+        ) as fp:
+            with pytest.raises(EOFError):
+                fp.read()
+
+    def test_close_early(self):
+        """Closing the reader should stop the background thread."""
+        reader = BackgroundReader(
+            BytesIO(b"x" * 1000), chunk_size=1, buffer_size=1
+        )
+        reader.close()
+        assert not reader._thread.is_alive()
+
+
+@pytest.mark.parametrize("memory_map", [True, False])
+def test_iter_lines(tmp_path: Path, memory_map: bool):
+    """It should iterate over lines without their line endings."""
+    path = tmp_path / "lines.txt"
+    path.write_bytes(b"first\r\nsecond\n\nlast")
+
+    with open_as_file(path, memory_map=memory_map) as fp:
+        lines = list(iter_lines(fp))
+        assert all(
+            isinstance(line, memoryview if memory_map else bytes)
+            for line in lines
+        )
+        assert [str(line, "ascii") for line in lines] == [
+            "first",
+            "second",
+            "",
+            "last",
+        ]
+        del lines
+
+
+def test_iter_json_object():
+    """It should decode the items of a JSON object one at a time."""
+    events = [
+        {"id": i, "x": i / 3, "name": f"event \u00e9 {i}", "tags": [i] * 3}
+        for i in range(5_000)
+    ]
+    document = {"events": events, "teams": {"1": "home"}, "skipped": [1, 2]}
+    data = json.dumps(document, indent=1).encode("utf-8")
+
+    items = []
+    for key, value in iter_json_object(
+        BytesIO(data), stream_keys=["events", "skipped"]
+    ):
+        if key == "events":
+            value = list(value)
+        elif key == "skipped":
+            # Elements that are not read are skipped
+            value = None
+        items.append((key, value))
+
+    assert items == [
+        ("events", events),
+        ("teams", {"1": "home"}),
+        ("skipped", None),
+    ]
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_object(BytesIO(b"[1, 2]")))
+    with pytest.raises(json.JSONDecodeError):
+        for key, value in iter_json_object(
+            BytesIO(b'{"events": [1 2]}'), stream_keys=["events"]
+        ):
+            list(value)
+
+
 def test_get_file_extension():
     assert get_file_extension(Path("data.xml")) == ".xml"
     assert get_file_extension("data.xml") == ".xml"
     assert get_file_extension("data.xml.gz") == ".xml"
+    assert get_file_extension("data.dat.zst") == ".dat"
+    assert get_file_extension("data.jsonl.lz4") == ".jsonl"
     assert get_file_extension("data") == ""
@@ -0,0 +1,206 @@
+from datetime import timedelta
+
+import pytest
+
+from kloppy.domain import (
+    Dimension,
+    Ground,
+    Metadata,
+    NormalizedPitchDimensions,
+    Orientation,
+    Period,
+    Player,
+    PlayerData,
+    Point,
+    Point3D,
+    Team,
+    TrackingDataset,
+)
+from kloppy.domain.services.frame_factory import create_frame
+from kloppy.exceptions import KloppyError, KloppyParameterError
+
+FRAME_RATE = 25
+
+
+@pytest.fixture
+def dataset() -> TrackingDataset:
+    """
+    A player who runs along the x-axis at 5 m/s. In the first period the
+    player is substituted off for 10 frames, and in frame 30 the tracking
+    system puts the player at the wrong position. The pitch is normalized
+    to 100x50 meters.
+    """
+    home_team = Team(team_id="home", name="home", ground=Ground.HOME)
+    away_team = Team(team_id="away", name="away", ground=Ground.AWAY)
+    player = Player(team=home_team, player_id="home_1", jersey_no=1)
+    home_team.players = [player]
+
+    periods = [
+        Period(
+            id=1,
+            start_timestamp=timedelta(0),
+            end_timestamp=timedelta(seconds=45 * 60),
+        ),
+        Period(
+            id=2,
+            start_timestamp=timedelta(seconds=60 * 60),
+            end_timestamp=timedelta(seconds=105 * 60),
+        ),
+    ]
+
+    frames = []
+    for period, frame_count in zip(periods, [100, 50]):
+        for idx in range(frame_count):
+            seconds = idx / FRAME_RATE
+            x = 5 * seconds / 100
+            if period.id == 1 and idx == 30:
+                x += 0.1
+            players_data = {}
+            if not (period.id == 1 and 50 <= idx < 60):
+                players_data[player] = PlayerData(
+                    coordinates=Point(x=x, y=0.5)
+                )
+            frames.append(
+                create_frame(
+                    frame_id=len(frames),
+                    timestamp=timedelta(seconds=seconds),
+                    ball_owning_team=None,
+                    ball_state=None,
+                    period=period,
+                    players_data=players_data,
+                    other_data={},
+                    ball_coordinates=Point3D(x=0.5, y=0.5, z=0),
+                )
+            )
+
+    metadata = Metadata(
+        flags=None,
+        pitch_dimensions=NormalizedPitchDimensions(
+            x_dim=Dimension(0, 1),
+            y_dim=Dimension(0, 1),
+            pitch_length=100,
+            pitch_width=50,
+        ),
+        orientation=Orientation.NOT_SET,
+        frame_rate=FRAME_RATE,
+        periods=periods,
+        teams=[home_team, away_team],
+        score=None,
+        provider=None,
+        coordinate_system=None,
+    )
+    return TrackingDataset(metadata=metadata, records=frames)
+
+
+class TestKinematics:
+    @pytest.mark.parametrize("smoothing", ["savitzky_golay", "moving_average"])
+    def test_compute_kinematics(self, dataset: TrackingDataset, smoothing):
+        dataset = dataset.compute_kinematics(smoothing=smoothing)
+        player = dataset.metadata.teams[0].players[0]
+
+        speeds = [
+            frame.players_data[player].speed
+            for frame in dataset.frames
+            if player in frame.players_data
+        ]
+        assert speeds == pytest.approx([5] * len(speeds))
+
+        accelerations = [
+            frame.players_data[player].other_data["acceleration"]
+            for frame in dataset.frames
+            if player in frame.players_data
+        ]
+        assert accelerations == pytest.approx([0] * len(speeds), abs=1e-6)
+
+        # The distance is not increased over the substitution and the
+        # break between the periods
+        last_frame = dataset.frames[-1]
+        assert last_frame.players_data[player].distance == pytest.approx(
+            5 * (49 + 39 + 49) / FRAME_RATE
+        )
+
+    def test_to_df(self, dataset: TrackingDataset):
+        df = dataset.compute_kinematics().to_df(engine="pandas")
+
+        assert df["home_1_s"].iloc[1] == pytest.approx(5)
+        assert df["home_1_d"].iloc[1] == pytest.approx(5 / FRAME_RATE)
+        assert df["home_1_acceleration"].iloc[1] == pytest.approx(0, abs=1e-6)
+
+    def test_max_speed(self, dataset: TrackingDataset):
+        """Without a maximum speed, the wrong position affects the speed."""
+        dataset = dataset.compute_kinematics(smoothing=None, max_speed=None)
+        player = dataset.metadata.teams[0].players[0]
+
+        assert dataset.frames[29].players_data[player].speed > 12
+
+    def test_original_not_modified(self, dataset: TrackingDataset):
+        """Datasets that share the frames keep their own player data."""
+        player = dataset.metadata.teams[0].players[0]
+        first_half = dataset.filter(lambda frame: frame.period.id == 1)
+
+        first_half.compute_kinematics()
+
+        for frames in (dataset.frames, first_half.frames):
+            data = frames[1].players_data[player]
+            assert data.speed is None
+            assert data.distance is None
+            assert "acceleration" not in data.other_data
+
+    def test_invalid_parameters(self, dataset: TrackingDataset):
+        with pytest.raises(KloppyParameterError):
+            dataset.compute_kinematics(smoothing="kalman")
+        with pytest.raises(KloppyParameterError):
+            dataset.compute_kinematics(window_length=4)
+
+
+class TestPhysicalAggregator:
+    def test_aggregate(self, dataset: TrackingDataset):
+        player = dataset.metadata.teams[0].players[0]
+        # Sprint at 8 m/s in the second period
+        for frame in dataset.frames:
+            if frame.period.id == 2:
+                frame.players_data[player].coordinates = Point(
+                    x=8 * frame.timestamp.total_seconds() / 100, y=0.5
+                )
+
+        first_period, second_period = dataset.aggregate("physical")
+
+        assert first_period.period.id == 1
+        assert first_period.time_played.total_seconds() == pytest.approx(
+            (49 + 39) / FRAME_RATE
+        )
+        assert first_period.total_distance == pytest.approx(
+            5 * (49 + 39) / FRAME_RATE
+        )
+        assert first_period.high_speed_distance == 0
+        assert first_period.sprint_count == 0
+        assert first_period.time_in_speed_zones[
+            "running"
+        ].total_seconds() == pytest.approx(
+            first_period.time_played.total_seconds()
+        )
+
+        assert second_period.period.id == 2
+        assert second_period.total_distance == pytest.approx(
+            8 * 49 / FRAME_RATE
+        )
+        assert second_period.high_speed_distance == pytest.approx(
+            second_period.total_distance
+        )
+        assert second_period.sprint_count == 1
+        assert second_period.time_in_speed_zones[
+            "sprinting"
+        ].total_seconds() == pytest.approx(49 / FRAME_RATE)
+
+        (match,) = dataset.aggregate(
+            "physical", per_period=False, min_sprint_duration=3
+        )
+        assert match.period is None
+        assert match.total_distance == pytest.approx(
+            first_period.total_distance + second_period.total_distance
+        )
+        assert match.sprint_count == 0
+
+    def test_unknown_aggregator(self, dataset: TrackingDataset):
+        with pytest.raises(KloppyError):
+            dataset.aggregate("minutes_played")
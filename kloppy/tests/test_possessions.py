@@ -0,0 +1,130 @@
+from datetime import timedelta
+
+import pytest
+
+from kloppy import statsbomb, tracab
+from kloppy.domain import BallState, Ground, Time
+from kloppy.domain.services.possessions import (
+    IntervalIndex,
+    PossessionOutcome,
+)
+
+
+class TestIntervalIndex:
+    def test_at(self):
+        index = IntervalIndex([(0, 10, "a"), (10, 20, "b"), (25, 30, "c")])
+
+        assert index.at(0) == "a"
+        assert index.at(10) == "b"
+        assert index.at(22) is None
+        assert index.at(29) == "c"
+        assert index.at(30) is None
+        assert index.at(-1) is None
+
+    def test_overlapping(self):
+        index = IntervalIndex([(0, 100, "a"), (10, 20, "b"), (30, 40, "c")])
+
+        assert index.overlapping(15) == ["a", "b"]
+        assert index.overlapping(25) == ["a"]
+        assert index.at(35) == "c"
+        assert index.at(50) == "a"
+
+
+class TestPossessions:
+    def test_event_dataset(self, base_dir):
+        dataset = statsbomb.load(
+            event_data=base_dir / "files/statsbomb_event.json",
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+        )
+
+        possessions = dataset.possessions()
+
+        # The phases cover all records, in order
+        assert possessions[0].start_idx == 0
+        assert possessions[-1].end_idx == len(dataset.records)
+        for phase, next_phase in zip(possessions, possessions[1:]):
+            assert phase.end_idx == next_phase.start_idx
+            if phase.period == next_phase.period:
+                assert phase.end_time == next_phase.start_time
+
+        for phase in possessions:
+            records = dataset.records[phase.start_idx : phase.end_idx]
+            assert {record.ball_owning_team for record in records} == {
+                phase.team
+            }
+            assert {record.ball_state for record in records} == {
+                phase.ball_state
+            }
+
+        goals = [
+            phase
+            for phase in possessions
+            if phase.outcome == PossessionOutcome.GOAL
+        ]
+        assert len(goals) == 1
+        assert possessions[-1].outcome == PossessionOutcome.END_OF_PERIOD
+        assert len(possessions.possessions()) == 108
+
+        # Every record lies within the phase that is found for its time
+        for idx in range(0, len(dataset.records), 50):
+            record = dataset.records[idx]
+            phase = possessions.at(record.time)
+            assert phase.start_time.period == record.period
+            assert phase.start_time.timestamp <= record.timestamp
+
+        # Records at the end of a period belong to its last phase
+        period = dataset.metadata.periods[0]
+        assert possessions.at(Time.from_period(period, "end")).period == period
+
+    def test_tracking_dataset(self, base_dir):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+
+        possessions = dataset.possessions()
+
+        assert [
+            (
+                phase.start_idx,
+                phase.end_idx,
+                phase.team.ground,
+                phase.ball_state,
+                phase.outcome,
+            )
+            for phase in possessions
+        ] == [
+            (0, 1, Ground.HOME, BallState.DEAD, None),
+            (1, 3, Ground.HOME, BallState.ALIVE, PossessionOutcome.BALL_DEAD),
+            (3, 4, Ground.HOME, BallState.DEAD, None),
+            (4, 6, Ground.AWAY, BallState.DEAD, None),
+            (6, 7, Ground.HOME, BallState.DEAD, None),
+        ]
+        assert possessions.at(dataset.records[2].time) is possessions[1]
+        assert (
+            possessions.at(dataset.records[-1].time + timedelta(seconds=1))
+            is possessions[-1]
+        )
+
+    @pytest.mark.parametrize("engine", ["pandas", "polars"])
+    def test_to_df(self, base_dir, engine):
+        dataset = tracab.load(
+            meta_data=base_dir / "files/tracab_meta.xml",
+            raw_data=base_dir / "files/tracab_raw.dat",
+            only_alive=False,
+        )
+
+        df = dataset.possessions().to_df(engine=engine)
+
+        assert list(df.columns) == [
+            "start_idx",
+            "end_idx",
+            "team",
+            "period",
+            "start_time",
+            "end_time",
+            "ball_state",
+            "outcome",
+        ]
+        assert len(df) == 5
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -139,3 +140,46 @@ class TestSecondSpectrumTracking:
         assert pitch_dimensions.x_dim.max == 1.0
         assert pitch_dimensions.y_dim.min == 0.0
         assert pitch_dimensions.y_dim.max == 1.0
+
+    def test_live(
+        self, meta_data: Path, raw_data: Path, additional_meta_data: Path
+    ):
+        expected = secondspectrum.load(
+            meta_data=meta_data,
+            raw_data=raw_data,
+            additional_meta_data=additional_meta_data,
+            only_alive=False,
+        )
+
+        builder = secondspectrum.load_live(
+            meta_data=meta_data,
+            additional_meta_data=additional_meta_data,
+            only_alive=False,
+        )
+
+        async def consume():
+            frames = []
+            async for frame in builder.frames():
+                frames.append(frame)
+            return frames
+
+        async def ingest():
+            task = asyncio.ensure_future(consume())
+            await asyncio.sleep(0)
+            for line in raw_data.read_bytes().splitlines(keepends=True):
+                builder.feed(line)
+            builder.close()
+            return await task
+
+        received = asyncio.run(ingest())
+
+        assert len(builder.dataset) == len(expected)
+        assert received == builder.dataset.records
+        assert [frame.frame_id for frame in received] == [
+            frame.frame_id for frame in expected
+        ]
+        home_player = builder.dataset.metadata.teams[0].players[2]
+        assert (
+            received[0].players_coordinates[home_player]
+            == expected.records[0].players_coordinates[home_player]
+        )
@@ -1,3 +1,4 @@
+import pickle
 from itertools import groupby
 
 from kloppy.domain import EventType, Event, EventDataset, FormationType
@@ -123,3 +124,44 @@ class TestStateBuilder:
         assert dataset_with_state.events[1].state["custom"] == 3
         assert dataset_with_state.events[2].state["custom"] == 5
         assert dataset_with_state.events[3].state["custom"] == 7
+
+    def test_state_table(self, base_dir):
+        dataset = self._load_dataset(base_dir)
+        events = list(dataset.events)
+
+        dataset_with_state = dataset.add_state("score").add_state("sequence")
+
+        # The state is stored beside the events, which are not copied
+        assert all(
+            event is original
+            for event, original in zip(dataset_with_state.events, events)
+        )
+        state_table = dataset_with_state.state_table
+        assert len(state_table) == len(events)
+        assert set(state_table.columns) == {"score", "sequence"}
+        assert "_state_ref" in events[100].__dict__
+
+        state = events[100].state
+        assert state == {
+            "score": state_table.column("score")[100],
+            "sequence": state_table.column("sequence")[100],
+        }
+        assert events[100].state is state
+        assert str(events[-1].state["score"]) == "3-1"
+
+    def test_pickle_event_with_state(self, base_dir):
+        dataset = self._load_dataset(base_dir).add_state("score", "sequence")
+        event = dataset.events[100]
+
+        size_without_state = len(
+            pickle.dumps(self._load_dataset(base_dir).events[100])
+        )
+        data = pickle.dumps(event)
+
+        # Only the state of the event is pickled, not the state table of the
+        # whole dataset
+        assert "_state_ref" not in event.__dict__
+        assert len(data) < size_without_state + 1_000
+
+        unpickled_event = pickle.loads(data)
+        assert unpickled_event.state == event.state
@@ -1,4 +1,6 @@
+import json
 import os
+import pickle
 from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -47,7 +49,7 @@ from kloppy.domain.models.event import (
     PassQualifier,
     PassType,
 )
-from kloppy.exceptions import DeserializationError
+from kloppy.exceptions import DeserializationError, KloppyParameterError
 from kloppy.infra.serializers.event.statsbomb.helpers import parse_str_ts
 
 ENABLE_PLOTTING = True
@@ -567,6 +569,163 @@ class TestStatsBombEvent:
                 assert player.team in [home_team, away_team]
                 assert player.name is None
 
+    def test_freeze_frame_360_lazy(self, base_dir: Path, tmp_path: Path):
+        """It should only parse a 360 freeze frame when it is accessed."""
+        event_id = "719bbdb1-8743-4c95-b5a5-b61a0c392741"
+        three_sixty_file = tmp_path / "statsbomb_360.json"
+        three_sixty_file.write_text(
+            json.dumps(
+                [
+                    {
+                        "event_uuid": event_id,
+                        "visible_area": [0.0, 0.0, 120.0, 0.0, 120.0, 80.0],
+                        "freeze_frame": [
+                            {
+                                "teammate": True,
+                                "actor": True,
+                                "keeper": False,
+                                "location": [25.0, 2.0],
+                            },
+                            {
+                                "teammate": False,
+                                "actor": False,
+                                "keeper": False,
+                                "location": [30.0, 10.0],
+                            },
+                        ],
+                    }
+                ]
+            )
+        )
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            three_sixty_data=three_sixty_file,
+            coordinates="statsbomb",
+        )
+
+        pass_event = dataset.get_event_by_id(event_id)
+        assert callable(pass_event.__dict__["_freeze_frame"])
+
+        freeze_frame = pass_event.freeze_frame
+        assert len(freeze_frame.players_data) == 2
+        assert freeze_frame.players_coordinates[pass_event.player] == Point(
+            24.5, 1.5
+        )
+        assert freeze_frame.other_data["visible_area"] == [
+            0.0,
+            0.0,
+            120.0,
+            0.0,
+            120.0,
+            80.0,
+        ]
+        # The parsed freeze frame is cached on the event
+        assert pass_event.freeze_frame is freeze_frame
+
+    def test_freeze_frame_shot_lazy(self, base_dir: Path):
+        """It should keep shot freeze frames lazy when transforming a dataset."""
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            coordinates="statsbomb",
+        )
+        shot_event = dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        assert callable(shot_event.__dict__["_freeze_frame"])
+
+        transformed_dataset = dataset.transform(
+            to_orientation=Orientation.STATIC_HOME_AWAY
+        )
+        transformed_shot_event = transformed_dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        assert callable(transformed_shot_event.__dict__["_freeze_frame"])
+        assert callable(shot_event.__dict__["_freeze_frame"])
+
+        freeze_frame = shot_event.freeze_frame
+        transformed_freeze_frame = transformed_shot_event.freeze_frame
+        assert len(freeze_frame.players_data) == 12
+        for player, coordinates in freeze_frame.players_coordinates.items():
+            transformed_coordinates = (
+                transformed_freeze_frame.players_coordinates[player]
+            )
+            if shot_event.team == dataset.metadata.teams[0]:
+                assert transformed_coordinates == coordinates
+            else:
+                assert transformed_coordinates.x == pytest.approx(
+                    120 - coordinates.x
+                )
+
+    def test_freeze_frame_pickle_lazy(self, base_dir: Path):
+        """It should keep freeze frames lazy when pickling an event."""
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            coordinates="statsbomb",
+        )
+        shot_event = dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+
+        unpickled_shot_event = pickle.loads(pickle.dumps(shot_event))
+        assert callable(shot_event.__dict__["_freeze_frame"])
+        assert callable(unpickled_shot_event.__dict__["_freeze_frame"])
+
+        freeze_frame = unpickled_shot_event.freeze_frame
+        assert (
+            freeze_frame.players_coordinates
+            == shot_event.freeze_frame.players_coordinates
+        )
+
+    def test_fields(self, base_dir: Path):
+        """It should only parse the optional attributes that are requested."""
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            coordinates="statsbomb",
+        )
+        projected_dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            coordinates="statsbomb",
+            fields=["qualifiers"],
+        )
+        assert len(projected_dataset) == len(dataset)
+
+        shot_event = projected_dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        original_shot_event = dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        assert shot_event.coordinates == original_shot_event.coordinates
+        assert shot_event.qualifiers == original_shot_event.qualifiers
+        assert shot_event.raw_event is None
+        assert shot_event.related_event_ids == []
+        assert shot_event.statistics == []
+        assert shot_event.freeze_frame is None
+
+        projected_dataset = statsbomb.load(
+            lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+            event_data=base_dir / "files" / "statsbomb_event.json",
+            coordinates="statsbomb",
+            fields=[],
+        )
+        shot_event = projected_dataset.get_event_by_id(
+            "65f16e50-7c5d-4293-b2fc-d20887a772f9"
+        )
+        assert shot_event.result == original_shot_event.result
+        assert shot_event.qualifiers is None
+
+        with pytest.raises(KloppyParameterError, match="coordinatez"):
+            statsbomb.load(
+                lineup_data=base_dir / "files" / "statsbomb_lineup.json",
+                event_data=base_dir / "files" / "statsbomb_event.json",
+                fields=["coordinatez"],
+            )
+
     def test_correct_normalized_deserialization(self):
         """Test if the normalized deserialization is correct"""
         dataset = statsbomb.load(
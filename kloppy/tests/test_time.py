@@ -204,6 +204,51 @@ class TestAbsTimeContainer:
 
         assert repr(container) == "TimeContainer[int]({'P1T13:20': 10})"
 
+    def test_values_at(self, periods):
+        period1, period2, _ = periods
+
+        container = TimeContainer()
+        container[Time(period=period1, timestamp=timedelta(seconds=10))] = 1
+        container[Time(period=period2, timestamp=timedelta(seconds=0))] = 2
+        container[Time(period=period2, timestamp=timedelta(seconds=60))] = 3
+
+        times = [
+            Time(period=period1, timestamp=timedelta(seconds=0)),
+            Time(period=period1, timestamp=timedelta(seconds=10)),
+            Time(period=period1, timestamp=timedelta(seconds=2700)),
+            Time(period=period2, timestamp=timedelta(seconds=59)),
+            Time(period=period2, timestamp=timedelta(seconds=600)),
+            # Out of order
+            Time(period=period1, timestamp=timedelta(seconds=20)),
+        ]
+        assert container.values_at(times, default=None) == [
+            None,
+            1,
+            1,
+            2,
+            3,
+            1,
+        ]
+        assert container.values_at(times[1:]) == [
+            container.value_at(time) for time in times[1:]
+        ]
+
+        with pytest.raises(KeyError):
+            container.values_at(times)
+
+    def test_sort_key(self, periods):
+        period1, period2, _ = periods
+
+        time1 = Time(period=period1, timestamp=timedelta(seconds=2700))
+        time2 = Time(period=period2, timestamp=timedelta(microseconds=1))
+
+        assert time1.sort_key == (1, 2_700_000_000)
+        assert time1 < time2
+        assert not time2 < time1
+        assert hash(time2) == hash(
+            Time(period=period2, timestamp=timedelta(microseconds=1))
+        )
+
     def test_ranges(self, periods):
         period1, period2, _ = periods
 
@@ -227,3 +272,44 @@ class TestAbsTimeContainer:
             print(f"{start} - {end} = {end - start} -> {position}")
 
         assert container.last() is None
+
+
+class TestMatchTime:
+    def test_match_time(self, base_dir):
+        dataset = statsbomb.load(
+            lineup_data=base_dir / "files/statsbomb_lineup.json",
+            event_data=base_dir / "files/statsbomb_event.json",
+        )
+        period1, period2 = dataset.metadata.periods
+
+        assert dataset.metadata.period_offsets == {
+            1: timedelta(0),
+            2: period1.duration,
+        }
+
+        kick_off = Time.from_period(period1, "start")
+        match_times = dataset.metadata.to_match_time(
+            [event.period.id for event in dataset.events],
+            [event.timestamp for event in dataset.events],
+        )
+        assert match_times == [
+            event.time - kick_off for event in dataset.events
+        ]
+
+        # Timestamps at (or after) the end of a period can't be told apart
+        # from the start of the next period
+        events = [
+            event
+            for event in dataset.events
+            if event.timestamp < event.period.duration
+        ]
+        period_ids, timestamps = dataset.metadata.from_match_time(
+            [event.time - kick_off for event in events]
+        )
+        assert period_ids == [event.period.id for event in events]
+        assert timestamps == [event.timestamp for event in events]
+
+        assert dataset.metadata.from_match_time([period1.duration]) == (
+            [2],
+            [timedelta(0)],
+        )
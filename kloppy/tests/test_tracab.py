@@ -1,3 +1,4 @@
+import warnings
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
 
@@ -18,6 +19,7 @@ from kloppy.domain import (
 )
 
 from kloppy import tracab
+from kloppy.config import config_context
 
 
 @pytest.fixture(scope="session")
@@ -251,6 +253,101 @@ class TestTracabDATTracking:
             assert isinstance(game_id, str)
             assert game_id == "1"
 
+    def test_memory_map_disabled(
+        self, xml_meta_data: Path, dat_raw_data: Path
+    ):
+        expected = tracab.load(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+        with config_context("io.memory_map", False):
+            dataset = tracab.load(
+                meta_data=xml_meta_data,
+                raw_data=dat_raw_data,
+                only_alive=False,
+            )
+
+        player_home_1 = dataset.metadata.teams[0].get_player_by_jersey_number(
+            1
+        )
+        assert len(dataset) == len(expected)
+        for frame, expected_frame in zip(dataset, expected):
+            assert frame.frame_id == expected_frame.frame_id
+            assert (
+                frame.players_data[player_home_1].coordinates
+                == expected_frame.players_data[player_home_1].coordinates
+            )
+
+    def test_live(self, xml_meta_data: Path, dat_raw_data: Path):
+        expected = tracab.load(
+            meta_data=xml_meta_data, raw_data=dat_raw_data, only_alive=False
+        )
+
+        builder = tracab.load_live(meta_data=xml_meta_data, only_alive=False)
+        received = []
+        builder.subscribe(received.append)
+
+        raw_data = dat_raw_data.read_bytes()
+        # feed chunks that do not end at a line boundary
+        for i in range(0, len(raw_data), 1000):
+            builder.feed(raw_data[i : i + 1000])
+        builder.close()
+
+        dataset = builder.dataset
+        assert len(dataset) == len(expected)
+        assert received == dataset.records
+        assert dataset.metadata.orientation == expected.metadata.orientation
+
+        player_home_1 = dataset.metadata.teams[0].get_player_by_jersey_number(
+            1
+        )
+        for frame, expected_frame in zip(dataset, expected):
+            assert frame.frame_id == expected_frame.frame_id
+            assert frame.period.id == expected_frame.period.id
+            assert (
+                frame.players_data[player_home_1].coordinates
+                == expected_frame.players_data[player_home_1].coordinates
+            )
+            assert frame.dataset is dataset
+
+        assert dataset[0].prev_record is None
+        assert dataset[0].next_record is dataset[1]
+        assert dataset[-1].prev_record is dataset[-2]
+
+    def test_live_only_alive(
+        self, xml_meta_data: Path, dat_raw_data: Path, tmp_path: Path
+    ):
+        # Make every other frame alive
+        lines = dat_raw_data.read_text().splitlines()
+        raw_data = tmp_path / "tracab_raw.dat"
+        raw_data.write_text(
+            "\n".join(
+                line.replace("Dead;:", "Alive;:") if i % 2 == 0 else line
+                for i, line in enumerate(lines)
+            )
+        )
+        expected = tracab.load(
+            meta_data=xml_meta_data, raw_data=raw_data, only_alive=True
+        )
+        assert 0 < len(expected) < len(lines)
+
+        with warnings.catch_warnings():
+            # The metadata is parsed without running the full deserializer
+            warnings.simplefilter("error")
+            builder = tracab.load_live(
+                meta_data=xml_meta_data, only_alive=True
+            )
+        assert builder.dataset.metadata.orientation == Orientation.NOT_SET
+
+        builder.feed(raw_data.read_bytes())
+        builder.close()
+
+        assert [frame.frame_id for frame in builder.dataset] == [
+            frame.frame_id for frame in expected
+        ]
+        assert [frame.period.id for frame in builder.dataset] == [
+            frame.period.id for frame in expected
+        ]
+
 
 class TestTracabMeta2:
     def test_correct_deserialization(
@@ -1,4 +1,6 @@
+import json
 from datetime import datetime, timedelta, timezone
+from io import BufferedReader, BytesIO, RawIOBase
 from pathlib import Path
 
 import pytest
@@ -29,6 +31,10 @@ from kloppy.domain import (
     ShotResult,
     Time,
 )
+from kloppy.infra.serializers.event.wyscout import (
+    WyscoutDeserializerV2,
+    WyscoutInputs,
+)
 
 
 @pytest.fixture(scope="session")
@@ -159,6 +165,75 @@ class TestWyscoutV2:
             0.2981354967264447, 0.06427244582043344
         )
 
+    def test_event_types_filter(
+        self, dataset: EventDataset, event_v2_data: Path
+    ):
+        """Raw events are skipped when they cannot result in a requested
+        event type, without changing the events that are returned."""
+        for event_types in [[EventType.SHOT], [EventType.INTERCEPTION]]:
+            filtered_dataset = wyscout.load(
+                event_data=event_v2_data,
+                coordinates="wyscout",
+                data_version="V2",
+                event_types=event_types,
+            )
+            expected_event_ids = [
+                event.event_id
+                for event in dataset
+                if event.event_type in event_types
+            ]
+            assert [
+                event.event_id for event in filtered_dataset
+            ] == expected_event_ids
+
+    @pytest.mark.parametrize("seekable", [True, False])
+    @pytest.mark.parametrize("events_first", [True, False])
+    def test_streaming(
+        self,
+        dataset: EventDataset,
+        event_v2_data: Path,
+        seekable: bool,
+        events_first: bool,
+    ):
+        """Events are decoded one at a time, whether the teams and players
+        come before or after the events."""
+        document = json.loads(event_v2_data.read_bytes())
+        if not events_first:
+            document = {
+                "teams": document["teams"],
+                "players": document["players"],
+                "events": document["events"],
+            }
+        event_data = BytesIO(json.dumps(document).encode("utf-8"))
+        if not seekable:
+            event_data = BufferedReader(_NonSeekable(event_data))
+
+        streamed_dataset = WyscoutDeserializerV2(
+            coordinate_system="wyscout"
+        ).deserialize(WyscoutInputs(event_data=event_data))
+
+        assert streamed_dataset.metadata.game_id == dataset.metadata.game_id
+        assert [
+            (event.event_id, event.event_type, event.coordinates)
+            for event in streamed_dataset
+        ] == [
+            (event.event_id, event.event_type, event.coordinates)
+            for event in dataset
+        ]
+
+
+class _NonSeekable(RawIOBase):
+    def __init__(self, fp: BytesIO):
+        self._fp = fp
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        data = self._fp.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
 
 class TestWyscoutV3:
     """Tests related to deserialization of Wyscout V3 data."""
@@ -1,3 +1,3 @@
-from ._providers.tracab import load
+from ._providers.tracab import load, load_live
 
-__all__ = ["load"]
+__all__ = ["load", "load_live"]
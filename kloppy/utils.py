@@ -2,7 +2,15 @@ import re
 import time
 from contextlib import contextmanager
 from io import BytesIO
-from typing import BinaryIO, Union
+from typing import (
+    BinaryIO,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 import functools
 import inspect
 import warnings
@@ -10,6 +18,8 @@ import warnings
 
 Readable = Union[bytes, BinaryIO]
 
+T = TypeVar("T")
+
 
 def to_file_object(s: Readable) -> BinaryIO:
     if isinstance(s, bytes):
@@ -17,6 +27,30 @@ def to_file_object(s: Readable) -> BinaryIO:
     return s
 
 
+def iter_with_neighbours(
+    iterable: Iterable[T],
+) -> Iterator[Tuple[Optional[T], T, Optional[T]]]:
+    """Iterate over `(previous, current, next)` items of an iterable.
+
+    Only a single item is buffered ahead, so this works on streams that
+    cannot be indexed.
+
+    Examples:
+        >>> list(iter_with_neighbours([1, 2, 3]))
+        [(None, 1, 2), (1, 2, 3), (2, 3, None)]
+    """
+    iterator = iter(iterable)
+    previous_item = None
+    try:
+        current_item = next(iterator)
+    except StopIteration:
+        return
+    for next_item in iterator:
+        yield previous_item, current_item, next_item
+        previous_item, current_item = current_item, next_item
+    yield previous_item, current_item, None
+
+
 @contextmanager
 def performance_logging(description: str, counter: int = None, logger=None):
     start = time.time()